@@ -0,0 +1,144 @@
+"""
+Local stand-in servers for the benchmarks.
+
+They accept any upload to any path, optionally wait a while to imitate parse time, and reply with a canned Tika
+style JSON body.  Nothing is parsed, so the numbers measure the client and the transport only.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+
+def tika_json(content_size: int = 1024, metadata_keys: int = 32) -> bytes:
+    """Build a realistic looking Tika JSON response, one large content string plus many metadata keys."""
+    line = "The quick brown fox jumps over the lazy dog. Ünïcödé text is common too.\n"
+    data: dict[str, Any] = {
+        "Content-Type": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "X-TIKA:Parsed-By": ["org.apache.tika.parser.DefaultParser", "org.apache.tika.parser.microsoft.ooxml"],
+        "X-TIKA:content": (line * (content_size // len(line) + 1))[:content_size],
+        "dcterms:created": "2023-05-17T16:41:00Z",
+        "dcterms:modified": "2023-05-17T16:44:00Z",
+        "xmp:CreateDate": "2023-05-17T16:41:00.123+02:00",
+        "xmpTPg:NPages": "12",
+        "meta:character-count": str(content_size),
+        "cp:revision": "3",
+        "dc:title": "A sample document",
+    }
+    for index in range(metadata_keys):
+        data[f"custom:key-{index}"] = f"value number {index}"
+    return json.dumps(data).encode()
+
+
+def _read_body(handler: BaseHTTPRequestHandler) -> int:
+    if handler.headers.get("Transfer-Encoding", "").lower() == "chunked":
+        total = 0
+        while True:
+            size = int(handler.rfile.readline().strip(), 16)
+            if size == 0:
+                handler.rfile.readline()
+                return total
+            handler.rfile.read(size + 2)
+            total += size
+    length = int(handler.headers.get("Content-Length", "0"))
+    remaining = length
+    while remaining:
+        remaining -= len(handler.rfile.read(min(remaining, 1 << 16)))
+    return length
+
+
+@contextmanager
+def http1_server(body: bytes, delay: float = 0.0, status: int = 200) -> Iterator[str]:
+    """Run a threaded HTTP/1.1 keep-alive server, yielding its URL."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _reply(self) -> None:
+            _read_body(self)
+            if delay:
+                time.sleep(delay)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_PUT = do_POST = _reply  # noqa: N815
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        # The default backlog of 5 resets connections when hundreds of clients connect at once
+        request_queue_size = 1024
+
+    server = Server(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+@contextmanager
+def h2c_server(body: bytes, delay: float = 0.0) -> Iterator[str]:
+    """
+    Run a prior-knowledge cleartext HTTP/2 server (like Jetty with h2c enabled), yielding its URL.
+
+    Requires the h2 package.
+    """
+    import h2.config  # noqa: PLC0415
+    import h2.connection  # noqa: PLC0415
+    import h2.events  # noqa: PLC0415
+
+    class Protocol(asyncio.Protocol):
+        def connection_made(self, transport: asyncio.BaseTransport) -> None:
+            self.transport: asyncio.Transport = transport  # type: ignore[assignment]
+            self.conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+            self.conn.initiate_connection()
+            self.conn.increment_flow_control_window(1 << 24)
+            self.transport.write(self.conn.data_to_send())
+
+        def data_received(self, data: bytes) -> None:
+            for event in self.conn.receive_data(data):
+                if isinstance(event, h2.events.DataReceived):
+                    self.conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+                elif isinstance(event, h2.events.StreamEnded):
+                    asyncio.get_running_loop().call_later(delay, self._respond, event.stream_id)
+            self.transport.write(self.conn.data_to_send())
+
+        def _respond(self, stream_id: int) -> None:
+            self.conn.send_headers(
+                stream_id,
+                [(":status", "200"), ("content-type", "application/json"), ("content-length", str(len(body)))],
+            )
+            self.conn.send_data(stream_id, body, end_stream=True)
+            self.transport.write(self.conn.data_to_send())
+
+    loop = asyncio.new_event_loop()
+    server = loop.run_until_complete(loop.create_server(Protocol, "127.0.0.1", 0))
+    port = server.sockets[0].getsockname()[1]
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        server.close()
+        loop.close()
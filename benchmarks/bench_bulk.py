@@ -0,0 +1,66 @@
+"""
+Measure how bulk_extract scales with worker processes when responses are large and decoding is CPU bound.
+
+The thread pool of TikaClient.map is run first as the single core baseline.
+
+Run with: python benchmarks/bench_bulk.py [--requests N] [--processes 1,2,4,8] [--content-size BYTES]
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import TikaClient
+from tika_client import bulk_extract
+
+
+def run_threads(url: str, *, sample: Path, requests: int, workers: int) -> tuple[float, int]:
+    """Extract with the thread pool of a single client, returning the elapsed time and the number of failures."""
+    with TikaClient(url, workers=workers) as client:
+        start = time.perf_counter()
+        failures = sum(not item.ok for item in client.map(client.tika.as_text.from_file, [sample] * requests))
+        return time.perf_counter() - start, failures
+
+
+def run_processes(url: str, *, sample: Path, requests: int, processes: int) -> tuple[float, int]:
+    """Extract with worker processes, returning the elapsed time, including process start up, and the failures."""
+    start = time.perf_counter()
+    failures = sum(not item.ok for item in bulk_extract(url, [sample] * requests, processes=processes))
+    return time.perf_counter() - start, failures
+
+
+def main() -> None:
+    """Run the thread baseline and each process count against a stand-in server and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--processes", default="1,2,4,8", help="Comma separated process counts")
+    parser.add_argument("--content-size", type=int, default=8 * 1024 * 1024, help="Extracted text per response")
+    args = parser.parse_args()
+    counts = [int(value) for value in args.processes.split(",")]
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(tika_json(args.content_size), delay=0.0) as url:
+        sample = Path(tmp) / "sample.txt"
+        sample.write_bytes(b"x" * 1024)
+
+        print(f"{args.requests} responses of {args.content_size} bytes of text, {os.cpu_count()} CPUs")
+        print(f"{'driver':<14} {'seconds':>8} {'resp/s':>10} {'speedup':>8} {'failures':>9}")
+        elapsed, failures = run_threads(url, sample=sample, requests=args.requests, workers=max(counts))
+        baseline = args.requests / elapsed
+        name = f"{max(counts)} threads"
+        print(f"{name:<14} {elapsed:>8.2f} {baseline:>10.1f} {1:>7.1f}x {failures:>9}")
+        for processes in counts:
+            elapsed, failures = run_processes(url, sample=sample, requests=args.requests, processes=processes)
+            rate = args.requests / elapsed
+            name = f"{processes} processes"
+            print(f"{name:<14} {elapsed:>8.2f} {rate:>10.1f} {rate / baseline:>7.1f}x {failures:>9}")
+
+
+if __name__ == "__main__":
+    main()
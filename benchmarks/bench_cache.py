@@ -0,0 +1,73 @@
+"""
+Measure the latency of repeated requests for a hot set of documents, uncached, from disk and from memory.
+
+Every document is requested once to warm the caches, then the whole set again for each round.
+
+Run with: python benchmarks/bench_cache.py [--documents N] [--rounds N] [--content-size BYTES] [--delay SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import MemoryCache
+from tika_client import ResultCache
+from tika_client import TikaClient
+
+
+def run(url: str, documents: list[Path], rounds: int, **options: Any) -> float:  # noqa: ANN401
+    """Request every document once to warm up, then for each round, returning the mean microseconds per request."""
+    with TikaClient(url, **options) as client:
+        for document in documents:
+            client.metadata.from_file(document)
+        start = time.perf_counter()
+        for _ in range(rounds):
+            for document in documents:
+                client.metadata.from_file(document)
+        return (time.perf_counter() - start) / (rounds * len(documents)) * 1e6
+
+
+def main() -> None:
+    """Request a hot set of documents with each cache setup against a stand-in server and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--content-size", type=int, default=16 * 1024, help="Bytes of content in each response")
+    parser.add_argument("--delay", type=float, default=0.005, help="Simulated server parse time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(tika_json(args.content_size), delay=args.delay) as url:
+        documents = []
+        for index in range(args.documents):
+            document = Path(tmp) / f"document-{index}.txt"
+            document.write_bytes(f"document {index}\n".encode() * 4096)
+            documents.append(document)
+
+        setups = {
+            "uncached": dict,
+            "disk": lambda: {"cache": ResultCache(Path(tmp) / "disk.sqlite3")},
+            "memory": lambda: {"memory_cache": MemoryCache()},
+            "memory+disk": lambda: {
+                "cache": ResultCache(Path(tmp) / "both.sqlite3"),
+                "memory_cache": MemoryCache(),
+            },
+        }
+        print(f"{args.documents} documents, {args.content_size} bytes of content, {args.delay * 1000:.0f} ms delay")
+        print(f"{'cache':>12} {'us/request':>11} {'speedup':>8}")
+        baseline = None
+        for name, options in setups.items():
+            rounds = 1 if name == "uncached" else args.rounds
+            latency = run(url, documents, rounds, **options())
+            baseline = baseline or latency
+            print(f"{name:>12} {latency:>11.1f} {baseline / latency:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Measure many identical async uploads at once, each sent on its own against coalesced into one request.
+
+Imitates a popular attachment arriving in many mailboxes at the same moment.
+
+Run with: python benchmarks/bench_coalesce.py [--uploads N] [--size-kb N] [--delay SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import anyio
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import AsyncTikaClient
+
+
+async def run(url: str, *, sample: Path, uploads: int, coalesce: bool) -> tuple[float, int]:
+    """Upload the sample from many tasks at once, returning the elapsed time and the requests sent."""
+    async with AsyncTikaClient(url, coalesce=coalesce, max_connections=uploads) as client:
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(uploads):
+                tg.start_soon(client.metadata.from_file, sample)
+        elapsed = time.perf_counter() - start
+        stats = client.coalescing_stats()
+    return elapsed, stats.sent if stats is not None else uploads
+
+
+def main() -> None:
+    """Upload the same file from many tasks with and without coalescing and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--uploads", type=int, default=500)
+    parser.add_argument("--size-kb", type=int, default=512)
+    parser.add_argument("--delay", type=float, default=0.05, help="Simulated server parse time")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(tika_json(), delay=args.delay) as url:
+        sample = Path(tmp) / "attachment.bin"
+        sample.write_bytes(b"x" * args.size_kb * 1024)
+
+        print(f"{args.uploads} identical uploads of {args.size_kb} KiB, {args.delay * 1000:.0f} ms server delay")
+        print(f"{'coalesce':>8} {'seconds':>8} {'requests':>9}")
+        for coalesce in (False, True):
+            elapsed, sent = anyio.run(
+                lambda coalesce=coalesce: run(url, sample=sample, uploads=args.uploads, coalesce=coalesce),
+            )
+            print(f"{coalesce!s:>8} {elapsed:>8.2f} {sent:>9}")
+
+
+if __name__ == "__main__":
+    main()
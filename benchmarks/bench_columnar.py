@@ -0,0 +1,90 @@
+"""
+Compare exporting many responses as a dictionary per row with gathering them into columns.
+
+The rows variant builds one dictionary of converted fields per response, as a row based warehouse load would.  The
+columnar variants gather the same fields with ResponseColumns, into standard library arrays or an Arrow table when
+pyarrow is installed.
+
+Run with: python benchmarks/bench_columnar.py [--documents N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+
+from _stub import tika_json
+
+from tika_client import RESPONSE_COLUMNS
+from tika_client import ResponseColumns
+from tika_client.data_models import TikaResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+def rows(responses: list[TikaResponse]) -> Any:  # noqa: ANN401
+    """Convert each response to a dictionary of its fields."""
+    names = [column.name for column in RESPONSE_COLUMNS]
+    return [{name: getattr(response, name) for name in names} for response in responses]
+
+
+def arrays(responses: list[TikaResponse]) -> Any:  # noqa: ANN401
+    """Gather the fields into standard library arrays."""
+    columns = ResponseColumns()
+    columns.extend(responses)
+    return columns.to_arrays()
+
+
+def arrow(responses: list[TikaResponse]) -> Any:  # noqa: ANN401
+    """Gather the fields into an Arrow table."""
+    columns = ResponseColumns()
+    columns.extend(responses)
+    return columns.to_arrow()
+
+
+def measure(export: Callable[[list[TikaResponse]], Any], documents: list[dict[str, Any]]) -> tuple[float, float]:
+    """Return the seconds an export takes and the MB its result keeps, from separate runs on fresh responses."""
+    responses = [TikaResponse(data) for data in documents]
+    start = time.perf_counter()
+    export(responses)
+    elapsed = time.perf_counter() - start
+
+    responses = [TikaResponse(data) for data in documents]
+    tracemalloc.start()
+    result = export(responses)
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return elapsed, kept / 1e6
+
+
+def main() -> None:
+    """Export the responses each way and print the time taken and the memory the result keeps."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=200_000)
+    args = parser.parse_args()
+
+    template = tika_json(content_size=256, metadata_keys=8)
+    documents = [json.loads(template) for _ in range(args.documents)]
+    exports: dict[str, Callable[[list[TikaResponse]], Any]] = {"rows": rows, "arrays": arrays}
+    try:
+        import_module("pyarrow")
+        exports["arrow"] = arrow
+    except ImportError:
+        print("pyarrow is not installed, skipping the Arrow table")
+
+    print(f"{args.documents} documents")
+    print(f"{'export':<8} {'seconds':>8} {'kept MB':>8}")
+    for name, export in exports.items():
+        elapsed, kept = measure(export, documents)
+        print(f"{name:<8} {elapsed:>8.2f} {kept:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
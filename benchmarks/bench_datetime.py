@@ -0,0 +1,106 @@
+"""
+Compare the previous regex datetime parsing with the fromisoformat fast path, with and without the memo cache.
+
+The strings follow the formats in tests/test_datetime_formats.py, spread over a number of distinct timestamps, as a
+bulk metadata export repeats the same creation and modification times across many documents.
+
+Run with: python benchmarks/bench_datetime.py [--strings N] [--distinct N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import time
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import TYPE_CHECKING
+
+from tika_client.data_models import _TIME_RE
+from tika_client.data_models import TikaResponse
+from tika_client.data_models import set_datetime_cache_size
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# The formats of tests/test_datetime_formats.py
+FORMATS = (
+    "{:%Y-%m-%dT%H:%M:%S}+00:00",
+    "{:%Y-%m-%dT%H:%M:%S}Z",
+    "{:%Y-%m-%dT%H:%M:%S}+08:00",
+    "{:%Y-%m-%dT%H:%M:%S}-08:00",
+    "{:%Y-%m-%dT%H:%M:%S.%f}+00:00",
+)
+
+
+def regex_parse(date_str: str | None) -> datetime | None:
+    """Parse as before, matching the regex and building a new timezone for every string."""
+    if not date_str:
+        return None
+    m = _TIME_RE.match(date_str)
+    if not m:
+        return None
+    (year, month, day, hour, minute, second, frac_sec, timezone_str) = m.groups()
+    microseconds = int(frac_sec[1:].ljust(6, "0")[:6]) if frac_sec is not None else 0
+    tzinfo = None
+    if timezone_str is not None:
+        if timezone_str.lower() == "z":
+            tzinfo = timezone.utc
+        else:
+            multi = -1 if timezone_str[0:1] == "-" else 1
+            delta = timedelta(hours=int(timezone_str[1:3]), minutes=int(timezone_str[4:])) * multi
+            tzinfo = timezone(delta)
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        microseconds,
+        tzinfo=tzinfo,
+    )
+
+
+def corpus(count: int, distinct: int) -> list[str]:
+    """Build count strings from the given number of distinct timestamps, in every format."""
+    rng = random.Random(42)  # noqa: S311
+    start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+    pool = [
+        FORMATS[index % len(FORMATS)].format(start + timedelta(seconds=rng.randrange(10**8), microseconds=index))
+        for index in range(distinct)
+    ]
+    return [rng.choice(pool) for _ in range(count)]
+
+
+def timed(parse: Callable[[str | None], datetime | None], strings: list[str]) -> float:
+    """Parse every string, returning the seconds taken."""
+    start = time.perf_counter()
+    for date_str in strings:
+        parse(date_str)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Parse the corpus with each parser and print the time per string."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--strings", type=int, default=200_000)
+    parser.add_argument("--distinct", type=int, default=2_000)
+    args = parser.parse_args()
+
+    strings = corpus(args.strings, args.distinct)
+    baseline = timed(regex_parse, strings)
+    fast = timed(TikaResponse.parse_datetime_string, strings)
+    set_datetime_cache_size(args.distinct)
+    memoized = timed(TikaResponse.parse_datetime_string, strings)
+    set_datetime_cache_size(0)
+
+    print(f"{args.strings} strings, {args.distinct} distinct")
+    print(f"{'parser':<12} {'us/string':>10} {'speedup':>8}")
+    for name, elapsed in (("regex", baseline), ("fast path", fast), ("memoized", memoized)):
+        print(f"{name:<12} {elapsed / args.strings * 1e6:>10.2f} {baseline / elapsed:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Measure how much large async uploads delay other tasks on the event loop.
+
+A ticker task sleeps for one millisecond at a time while files upload, and records how late each wake up is.
+
+Run with: python benchmarks/bench_event_loop.py [--size-mb N] [--uploads N] [--concurrency N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+import anyio
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import AsyncTikaClient
+from tika_client import UploadMode
+
+
+async def run(url: str, *, mode: UploadMode, sample: Path, uploads: int, concurrency: int) -> list[float]:
+    """Upload the sample while a ticker runs, returning the ticker's lateness in seconds."""
+    lags: list[float] = []
+    limiter = anyio.CapacityLimiter(concurrency)
+
+    async with AsyncTikaClient(url, upload_mode=mode) as client, anyio.create_task_group() as tg:
+
+        async def ticker() -> None:
+            while True:
+                start = time.perf_counter()
+                await anyio.sleep(0.001)
+                lags.append(time.perf_counter() - start - 0.001)
+
+        async def upload() -> None:
+            async with limiter:
+                await client.metadata.from_file(sample)
+
+        tg.start_soon(ticker)
+        async with anyio.create_task_group() as uploads_tg:
+            for _ in range(uploads):
+                uploads_tg.start_soon(upload)
+        tg.cancel_scope.cancel()
+    return lags
+
+
+def main() -> None:
+    """Upload in both modes against a stand-in server and print the ticker's lateness."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=int, default=64)
+    parser.add_argument("--uploads", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(tika_json()) as url:
+        sample = Path(tmp) / "sample.bin"
+        with sample.open("wb") as handle:
+            for _ in range(args.size_mb):
+                handle.write(b"x" * 1024 * 1024)
+
+        print(f"{args.uploads} uploads of {args.size_mb} MiB, {args.concurrency} concurrent")
+        print(f"{'mode':<10} {'ticks':>6} {'median ms':>10} {'p99 ms':>8} {'max ms':>8}")
+        for mode in UploadMode:
+            lags = anyio.run(
+                lambda mode=mode: run(
+                    url,
+                    mode=mode,
+                    sample=sample,
+                    uploads=args.uploads,
+                    concurrency=args.concurrency,
+                ),
+            )
+            p99 = statistics.quantiles(lags, n=100)[98] if len(lags) > 1 else lags[0]
+            print(
+                f"{mode.value:<10} {len(lags):>6} {statistics.median(lags) * 1000:>10.2f} "
+                f"{p99 * 1000:>8.2f} {max(lags) * 1000:>8.2f}",
+            )
+
+
+if __name__ == "__main__":
+    main()
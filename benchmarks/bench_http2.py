@@ -0,0 +1,75 @@
+"""
+Compare HTTP/1.1 and cleartext HTTP/2 for many concurrent uploads with the AsyncTikaClient.
+
+Run with: python benchmarks/bench_http2.py [--requests N] [--concurrency N] [--delay SECONDS]
+
+Requires the http2 extra (pip install tika-client[http2]).
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+import anyio
+from _stub import h2c_server
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import AsyncTikaClient
+
+
+async def run(url: str, *, http2: bool, sample: Path, requests: int, concurrency: int) -> tuple[float, int]:
+    """Upload the sample repeatedly, returning the elapsed time and the most connections seen open."""
+    peak_connections = 0
+    limiter = anyio.CapacityLimiter(concurrency)
+
+    async with AsyncTikaClient(url, http2=http2, max_connections=concurrency) as client:
+
+        async def one() -> None:
+            nonlocal peak_connections
+            async with limiter:
+                await client.metadata.from_file(sample, "text/plain")
+                peak_connections = max(peak_connections, client.pool_stats().connections)
+
+        start = time.perf_counter()
+        async with anyio.create_task_group() as tg:
+            for _ in range(requests):
+                tg.start_soon(one)
+        return time.perf_counter() - start, peak_connections
+
+
+def main() -> None:
+    """Run both protocols against their stand-in servers and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--delay", type=float, default=0.01, help="Simulated server parse time")
+    parser.add_argument("--upload-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    body = tika_json()
+    with tempfile.TemporaryDirectory() as tmp:
+        sample = Path(tmp) / "sample.txt"
+        sample.write_bytes(b"x" * args.upload_size)
+
+        print(f"{args.requests} uploads of {args.upload_size} bytes, {args.concurrency} concurrent")
+        print(f"{'protocol':<10} {'seconds':>8} {'req/s':>10} {'connections':>12}")
+        for name, server, http2 in (("HTTP/1.1", http1_server, False), ("h2c", h2c_server, True)):
+            with server(body, delay=args.delay) as url:
+                elapsed, connections = anyio.run(
+                    lambda url=url, http2=http2: run(
+                        url,
+                        http2=http2,
+                        sample=sample,
+                        requests=args.requests,
+                        concurrency=args.concurrency,
+                    ),
+                )
+            print(f"{name:<10} {elapsed:>8.2f} {args.requests / elapsed:>10.1f} {connections:>12}")
+
+
+if __name__ == "__main__":
+    main()
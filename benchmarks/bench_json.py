@@ -0,0 +1,67 @@
+"""
+Compare the throughput of the JSON decoders the client can use on realistic Tika responses.
+
+Each response is one large content string plus many metadata keys.  Decoders which are not installed are skipped.
+
+Run with: python benchmarks/bench_json.py [--keys N] [--seconds N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from importlib import import_module
+from typing import TYPE_CHECKING
+
+from _stub import tika_json
+
+if TYPE_CHECKING:
+    from tika_client._json import JsonDecoder
+
+SIZES_KB = (16, 256, 4096, 32768)
+
+
+def decoders() -> dict[str, JsonDecoder]:
+    """Collect the installed decoders, the standard library first."""
+    found: dict[str, JsonDecoder] = {"json": json.loads}
+    try:
+        found["orjson"] = import_module("orjson").loads
+    except ImportError:
+        print("orjson is not installed, skipping it")
+    try:
+        found["msgspec"] = import_module("msgspec.json").Decoder().decode
+    except ImportError:
+        print("msgspec is not installed, skipping it")
+    return found
+
+
+def throughput(decoder: JsonDecoder, body: bytes, seconds: float) -> float:
+    """Decode the body repeatedly for about the given time, returning MB per second of the best round."""
+    best = float("inf")
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        decoder(body)
+        best = min(best, time.perf_counter() - start)
+    return len(body) / best / 1e6
+
+
+def main() -> None:
+    """Decode responses of growing sizes with each decoder and print the throughput."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--keys", type=int, default=64)
+    parser.add_argument("--seconds", type=float, default=1.0)
+    args = parser.parse_args()
+
+    found = decoders()
+    header = " ".join(f"{name + ' MB/s':>13}" for name in found)
+    print(f"{'content KiB':>11} {header}")
+    for size_kb in SIZES_KB:
+        body = tika_json(content_size=size_kb * 1024, metadata_keys=args.keys)
+        row = " ".join(f"{throughput(decoder, body, args.seconds):>13.0f}" for decoder in found.values())
+        print(f"{size_kb:>11} {row}")
+
+
+if __name__ == "__main__":
+    main()
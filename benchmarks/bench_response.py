@@ -0,0 +1,103 @@
+"""
+Compare the construction time and memory of the slotted, lazily converting TikaResponse with the previous eager one.
+
+Responses are built from already decoded JSON, as for each embedded document of a large /rmeta response.  Reading only
+the content is the common case, reading every field shows the cost once each conversion has run.
+
+Run with: python benchmarks/bench_response.py [--documents N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from typing import Any
+
+from _stub import tika_json
+
+from tika_client.data_models import DublinCoreKey
+from tika_client.data_models import OtherTikaKeys
+from tika_client.data_models import TikaKey
+from tika_client.data_models import TikaResponse
+from tika_client.data_models import XmpKey
+
+FIELDS = (
+    "content",
+    "content_length",
+    "created",
+    "modified",
+    "title",
+    "xmp_created",
+    "page_count",
+    "character_count",
+    "revision",
+    "language",
+    "last_author",
+)
+
+
+class EagerResponse:
+    """The previous TikaResponse, converting every field on construction and keeping an instance __dict__."""
+
+    def __init__(self, data: dict[str, Any]) -> None:
+        """Convert every field of the data."""
+        self.data = data
+        self.type = data[TikaKey.ContentType]
+        self.parsers = data[TikaKey.Parsers]
+        self.content = data.get(TikaKey.Content)
+        self.content_length = int(data.get(TikaKey.ContentLength, "0")) or None
+        self.created = TikaResponse.parse_datetime_string(data.get(DublinCoreKey.Created))
+        self.modified = TikaResponse.parse_datetime_string(data.get(DublinCoreKey.Modified))
+        self.title = data.get(DublinCoreKey.Title)
+        self.xmp_created = TikaResponse.parse_datetime_string(data.get(XmpKey.Created))
+        self.page_count = int(data.get(XmpKey.NumPages, "0")) or None
+        self.character_count = int(data.get(OtherTikaKeys.CharacterCount, "0")) or None
+        self.revision = int(data.get(OtherTikaKeys.Revision, "0")) or None
+        self.language = data.get(OtherTikaKeys.Language)
+        self.last_author = data.get(OtherTikaKeys.LastAuthor)
+
+
+def build(cls: type, documents: list[dict[str, Any]], fields: tuple[str, ...]) -> list[Any]:
+    """Build a response per document and read the given fields of each."""
+    responses = [cls(data) for data in documents]
+    for response in responses:
+        for field in fields:
+            getattr(response, field)
+    return responses
+
+
+def measure(cls: type, documents: list[dict[str, Any]], fields: tuple[str, ...]) -> tuple[float, float]:
+    """Return the seconds taken to build the responses and the MB they keep, from separate runs."""
+    start = time.perf_counter()
+    build(cls, documents, fields)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    responses = build(cls, documents, fields)
+    kept = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del responses
+    return elapsed, kept / 1e6
+
+
+def main() -> None:
+    """Build the responses both ways and print the time taken and the memory they keep."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=50_000)
+    args = parser.parse_args()
+
+    template = tika_json(content_size=256, metadata_keys=8)
+    documents = [json.loads(template) for _ in range(args.documents)]
+
+    print(f"{args.documents} documents")
+    print(f"{'class':<14} {'reads':<8} {'seconds':>8} {'kept MB':>8}")
+    for reads, fields in (("content", ("content",)), ("all", FIELDS)):
+        for cls in (EagerResponse, TikaResponse):
+            elapsed, kept = measure(cls, documents, fields)
+            print(f"{cls.__name__:<14} {reads:<8} {elapsed:>8.3f} {kept:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
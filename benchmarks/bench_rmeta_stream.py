@@ -0,0 +1,62 @@
+"""
+Compare the peak memory of reading a large recursive metadata response whole, or streamed a document at a time.
+
+The stand-in server replies with an array of many embedded documents, like Tika's answer for a mail archive.  Each
+document is dropped once read, as a pipeline indexing them would.
+
+Run with: python benchmarks/bench_rmeta_stream.py [--documents N] [--content-kb N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import TikaClient
+
+
+def run_whole(client: TikaClient, sample: Path) -> int:
+    """Read every document from the complete response."""
+    return len(client.rmeta.as_text.from_file(sample))
+
+
+def run_streamed(client: TikaClient, sample: Path) -> int:
+    """Read every document as it is parsed from the response."""
+    return sum(1 for _ in client.rmeta.as_text.stream_from_file(sample))
+
+
+def main() -> None:
+    """Read the response both ways against a stand-in server and print the peak memory and time."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--documents", type=int, default=2000)
+    parser.add_argument("--content-kb", type=int, default=64)
+    args = parser.parse_args()
+
+    document = json.loads(tika_json(content_size=args.content_kb * 1024))
+    body = json.dumps([document] * args.documents).encode()
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(body) as url, TikaClient(url) as client:
+        sample = Path(tmp) / "archive.mbox"
+        sample.write_bytes(b"From sender@example.com\n")
+
+        print(f"{args.documents} documents of {args.content_kb} KiB content, {len(body) / 1e6:.1f} MB response")
+        print(f"{'mode':<10} {'documents':>10} {'peak MB':>9} {'seconds':>8}")
+        for name, run in (("whole", run_whole), ("streamed", run_streamed)):
+            tracemalloc.start()
+            start = time.perf_counter()
+            count = run(client, sample)
+            elapsed = time.perf_counter() - start
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+            print(f"{name:<10} {count:>10} {peak / 1e6:>9.1f} {elapsed:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Measure how the sync TikaClient's map scales with its thread count.
+
+Run with: python benchmarks/bench_threads.py [--requests N] [--workers 1,2,4,8,16,32] [--delay SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import TikaClient
+
+
+def run(url: str, *, sample: Path, requests: int, workers: int) -> tuple[float, int]:
+    """Upload the sample repeatedly with map, returning the elapsed time and the number of failures."""
+    with TikaClient(url, workers=workers, max_connections=workers) as client:
+        start = time.perf_counter()
+        failures = sum(not item.ok for item in client.map(client.metadata.from_file, [sample] * requests))
+        return time.perf_counter() - start, failures
+
+
+def main() -> None:
+    """Run map with each thread count against a stand-in server and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--workers", default="1,2,4,8,16,32", help="Comma separated thread counts")
+    parser.add_argument("--delay", type=float, default=0.01, help="Simulated server parse time")
+    parser.add_argument("--upload-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(tika_json(), delay=args.delay) as url:
+        sample = Path(tmp) / "sample.txt"
+        sample.write_bytes(b"x" * args.upload_size)
+
+        print(f"{args.requests} uploads of {args.upload_size} bytes, {args.delay * 1000:.0f} ms server delay")
+        print(f"{'workers':>8} {'seconds':>8} {'req/s':>10} {'speedup':>8} {'failures':>9}")
+        baseline = None
+        for workers in (int(value) for value in args.workers.split(",")):
+            elapsed, failures = run(url, sample=sample, requests=args.requests, workers=workers)
+            rate = args.requests / elapsed
+            baseline = baseline or rate
+            print(f"{workers:>8} {elapsed:>8.2f} {rate:>10.1f} {rate / baseline:>7.1f}x {failures:>9}")
+
+
+if __name__ == "__main__":
+    main()
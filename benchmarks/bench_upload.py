@@ -0,0 +1,62 @@
+"""
+Compare multipart and streamed raw PUT uploads of from_file across file sizes.
+
+Peak memory is the largest Python allocation traced during the uploads, so it shows whether memory grows with the
+file size.
+
+Run with: python benchmarks/bench_upload.py [--sizes-mb 1,16,128] [--requests N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from _stub import http1_server
+from _stub import tika_json
+
+from tika_client import TikaClient
+from tika_client import UploadMode
+
+
+def run(url: str, *, mode: UploadMode, sample: Path, requests: int) -> tuple[float, int]:
+    """Upload the sample repeatedly, returning the elapsed time and the peak traced memory."""
+    with TikaClient(url, upload_mode=mode) as client:
+        # Warm up the connection outside of the measurement
+        client.metadata.from_file(sample)
+        tracemalloc.start()
+        start = time.perf_counter()
+        for _ in range(requests):
+            client.metadata.from_file(sample)
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        return elapsed, peak
+
+
+def main() -> None:
+    """Upload files of each size in both modes against a stand-in server and print a comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes-mb", default="1,16,128", help="Comma separated file sizes in MiB")
+    parser.add_argument("--requests", type=int, default=10)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp, http1_server(tika_json()) as url:
+        print(f"{args.requests} uploads per row")
+        print(f"{'size MiB':>8} {'mode':<10} {'seconds':>8} {'MiB/s':>8} {'peak KiB':>10}")
+        for size in (int(value) for value in args.sizes_mb.split(",")):
+            sample = Path(tmp) / f"sample-{size}.bin"
+            with sample.open("wb") as handle:
+                for _ in range(size):
+                    handle.write(b"x" * 1024 * 1024)
+            for mode in UploadMode:
+                elapsed, peak = run(url, mode=mode, sample=sample, requests=args.requests)
+                rate = size * args.requests / elapsed
+                print(f"{size:>8} {mode.value:<10} {elapsed:>8.2f} {rate:>8.1f} {peak / 1024:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,10 +3,76 @@
 #
 # SPDX-License-Identifier: MPL-2.0
 
+from tika_client._balancer import LoadBalancing
+from tika_client._balancer import NodeStats
+from tika_client._batch import BatchResult
+from tika_client._bulk import BulkEndpoint
+from tika_client._bulk import bulk_extract
+from tika_client._cache import CacheStats
+from tika_client._cache import MemoryCache
+from tika_client._cache import ResultCache
+from tika_client._coalesce import CoalescingStats
+from tika_client._columnar import RESPONSE_COLUMNS
+from tika_client._columnar import ArrayColumn
+from tika_client._columnar import Column
+from tika_client._columnar import ColumnType
+from tika_client._columnar import ResponseColumns
+from tika_client._compression import CompressionPolicy
+from tika_client._compression import CompressionStats
+from tika_client._health import CircuitState
+from tika_client._health import HealthPolicy
+from tika_client._health import NoHealthyServerError
+from tika_client._hedging import HedgingPolicy
+from tika_client._hedging import HedgingStats
+from tika_client._json import best_json_decoder
+from tika_client._options import OcrStrategy
+from tika_client._options import ParseOptions
+from tika_client._pool import PoolStats
+from tika_client._retry import RetryPolicy
+from tika_client._streaming import AsyncTextStream
+from tika_client._streaming import TextStream
+from tika_client._upload import UploadMode
 from tika_client.client import AsyncTikaClient
 from tika_client.client import TikaClient
 from tika_client.data_models import DublinCoreKey
 from tika_client.data_models import TikaKey
 from tika_client.data_models import XmpKey
+from tika_client.data_models import set_datetime_cache_size
 
-__all__ = ["AsyncTikaClient", "DublinCoreKey", "TikaClient", "TikaKey", "XmpKey"]
+__all__ = [
+    "RESPONSE_COLUMNS",
+    "ArrayColumn",
+    "AsyncTextStream",
+    "AsyncTikaClient",
+    "BatchResult",
+    "BulkEndpoint",
+    "CacheStats",
+    "CircuitState",
+    "CoalescingStats",
+    "Column",
+    "ColumnType",
+    "CompressionPolicy",
+    "CompressionStats",
+    "DublinCoreKey",
+    "HealthPolicy",
+    "HedgingPolicy",
+    "HedgingStats",
+    "LoadBalancing",
+    "MemoryCache",
+    "NoHealthyServerError",
+    "NodeStats",
+    "OcrStrategy",
+    "ParseOptions",
+    "PoolStats",
+    "ResponseColumns",
+    "ResultCache",
+    "RetryPolicy",
+    "TextStream",
+    "TikaClient",
+    "TikaKey",
+    "UploadMode",
+    "XmpKey",
+    "best_json_decoder",
+    "bulk_extract",
+    "set_datetime_cache_size",
+]
@@ -0,0 +1,515 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import logging
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from time import monotonic
+from time import perf_counter
+from typing import TYPE_CHECKING
+from typing import Final
+from typing import TypeVar
+
+from httpx import URL
+from httpx import AsyncBaseTransport
+from httpx import AsyncByteStream
+from httpx import BaseTransport
+from httpx import SyncByteStream
+from httpx import codes
+from httpx._utils import URLPattern
+
+from tika_client._health import CircuitState
+from tika_client._health import NoHealthyServerError
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Callable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+
+    from httpx import Request
+    from httpx import Response
+
+    from tika_client._health import HealthPolicy
+
+logger = logging.getLogger("tika_client")
+
+T = TypeVar("T", BaseTransport, AsyncBaseTransport)
+
+# Request extension carrying a RouteHint from the caller to the balancing transport
+ROUTE_EXTENSION: Final[str] = "tika_client.route"
+
+# Statuses which say something about the server, rather than the document sent to it
+NODE_FAILURE_STATUSES = frozenset({codes.BAD_GATEWAY, codes.SERVICE_UNAVAILABLE, codes.GATEWAY_TIMEOUT})
+
+
+class LoadBalancing(str, Enum):
+    """Strategies for choosing which Tika server receives the next request."""
+
+    RoundRobin = "round-robin"
+    LeastOutstanding = "least-outstanding"
+    PowerOfTwoChoices = "power-of-two-choices"
+
+
+@dataclass(frozen=True)
+class NodeStats:
+    """
+    A point in time snapshot of one Tika server's load.
+
+    Args:
+        url: The base URL of the server
+        in_flight: The number of requests currently sent to the server and not yet finished
+        requests: The total number of requests sent to the server
+        failures: The total number of requests which failed at the transport level or with a 502, 503 or 504
+        latency: Exponentially weighted average of seconds until the response headers arrived, None before any
+        state: The circuit breaker state of the server
+
+    """
+
+    url: str
+    in_flight: int
+    requests: int
+    failures: int
+    latency: float | None
+    state: CircuitState = CircuitState.Closed
+
+
+@dataclass
+class RouteHint:
+    """
+    Steers a single request away from a node, and reports back which node served it.
+
+    Args:
+        avoid: A node not to use, unless no other is available
+        node: Set by the transport to the node the request was sent to
+
+    """
+
+    avoid: Node | None = None
+    node: Node | None = None
+
+
+class Node:
+    """The live state of a single Tika server, only modified while holding the owning pool's lock."""
+
+    def __init__(self, url: str, window: int) -> None:
+        self.url = URL(url)
+        self.host_header = self.url.netloc.decode("ascii")
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.latency: float | None = None
+        # Circuit breaker state
+        self.state = CircuitState.Closed
+        self.outcomes: deque[bool] = deque(maxlen=window)
+        self.open_until = 0.0
+        self.open_duration = 0.0
+        self.probe_failures = 0
+        self.trial_in_flight = False
+
+    def stats(self) -> NodeStats:
+        """Snapshot the node's counters."""
+        return NodeStats(
+            url=str(self.url),
+            in_flight=self.in_flight,
+            requests=self.requests,
+            failures=self.failures,
+            latency=self.latency,
+            state=self.state,
+        )
+
+
+class NodePool:
+    """
+    Chooses a Tika server for every request and tracks per-server load.
+
+    Thread safe, so a single pool may be shared by worker threads of a sync client.
+
+    Args:
+        urls: The base URLs of the servers, which must all share the same path
+        strategy: How to choose the server for each request
+        latency_decay: Weight given to the newest sample in the latency average
+        health: When given, servers are ejected by circuit breakers according to this policy
+
+    """
+
+    def __init__(
+        self,
+        urls: Sequence[str],
+        strategy: LoadBalancing = LoadBalancing.RoundRobin,
+        *,
+        latency_decay: float = 0.2,
+        health: HealthPolicy | None = None,
+    ) -> None:
+        if not urls:
+            msg = "At least one Tika server URL is required"
+            raise ValueError(msg)
+        self.health = health
+        self.nodes = [Node(url, health.window if health is not None else 0) for url in urls]
+        if len({node.url.path for node in self.nodes}) != 1:
+            msg = "All Tika server URLs must share the same path"
+            raise ValueError(msg)
+        self.strategy = LoadBalancing(strategy)
+        self.latency_decay = latency_decay
+        self._lock = threading.Lock()
+        self._next = 0
+
+    def _rotated(self, candidates: list[Node]) -> list[Node]:
+        # Rotating the start point spreads ties over every node instead of favoring the first
+        start = self._next % len(candidates)
+        self._next += 1
+        return candidates[start:] + candidates[:start]
+
+    def _choose(self, candidates: list[Node]) -> Node:
+        if len(candidates) == 1:
+            return candidates[0]
+        if self.strategy is LoadBalancing.RoundRobin:
+            return self._rotated(candidates)[0]
+        if self.strategy is LoadBalancing.LeastOutstanding:
+            return min(self._rotated(candidates), key=lambda node: node.in_flight)
+        first, second = random.sample(candidates, 2)
+        if first.in_flight != second.in_flight:
+            return first if first.in_flight < second.in_flight else second
+        return first if (first.latency or 0.0) <= (second.latency or 0.0) else second
+
+    def _available(self, node: Node, now: float) -> bool:
+        if node.state is CircuitState.Open and now >= node.open_until:
+            node.state = CircuitState.HalfOpen
+        if node.state is CircuitState.HalfOpen:
+            return not node.trial_in_flight
+        return node.state is CircuitState.Closed
+
+    def _open(self, node: Node, now: float) -> None:
+        if self.health is None:  # pragma: no cover
+            return
+        if node.state is CircuitState.HalfOpen:
+            node.open_duration = min(node.open_duration * 2, self.health.max_open_duration)
+        elif node.state is CircuitState.Closed:
+            node.open_duration = self.health.open_duration
+        logger.warning("Ejecting Tika server %s for %.1f seconds", node.url, node.open_duration)
+        node.state = CircuitState.Open
+        node.open_until = now + node.open_duration
+        node.trial_in_flight = False
+        node.outcomes.clear()
+
+    def _close(self, node: Node) -> None:
+        if node.state is not CircuitState.Closed:
+            logger.info("Tika server %s is healthy again", node.url)
+        node.state = CircuitState.Closed
+        node.trial_in_flight = False
+        node.outcomes.clear()
+
+    def _is_latency_outlier(self, node: Node) -> bool:
+        if self.health is None or self.health.latency_factor is None or node.latency is None:
+            return False
+        if len(node.outcomes) < self.health.min_requests:
+            return False
+        others = sorted(
+            other.latency
+            for other in self.nodes
+            if other is not node and other.latency is not None and other.state is CircuitState.Closed
+        )
+        if not others:
+            return False
+        return node.latency > self.health.latency_factor * others[len(others) // 2]
+
+    def acquire(self, avoid: Node | None = None) -> Node:
+        """
+        Choose the node for the next request and count it as in flight.
+
+        Args:
+            avoid: A node to pass over, unless it is the only one available
+
+        Returns:
+            The chosen node
+
+        Raises:
+            NoHealthyServerError: Every server has an open circuit
+
+        """
+        with self._lock:
+            if self.health is None:
+                candidates = self.nodes
+            else:
+                now = monotonic()
+                candidates = [node for node in self.nodes if self._available(node, now)]
+                if not candidates:
+                    msg = "No Tika server is currently available, all circuits are open"
+                    raise NoHealthyServerError(msg)
+            if avoid is not None and len(candidates) > 1:
+                candidates = [node for node in candidates if node is not avoid] or candidates
+            node = self._choose(candidates)
+            if node.state is CircuitState.HalfOpen:
+                node.trial_in_flight = True
+            node.in_flight += 1
+            node.requests += 1
+            return node
+
+    def record(self, node: Node, *, latency: float | None, failed: bool) -> None:
+        """
+        Record the outcome of a request to the node.
+
+        A request with neither a latency nor a failure, for example one which was cancelled, tells nothing about
+        the node's health.
+
+        Args:
+            node: The node the request went to
+            latency: Seconds until the response headers arrived, None if no response was received
+            failed: Whether the failure should be attributed to the node
+
+        """
+        with self._lock:
+            if failed:
+                node.failures += 1
+            if latency is not None:
+                if node.latency is None:
+                    node.latency = latency
+                else:
+                    node.latency += self.latency_decay * (latency - node.latency)
+            if self.health is not None:
+                self._update_circuit(node, latency=latency, failed=failed)
+
+    def _update_circuit(self, node: Node, *, latency: float | None, failed: bool) -> None:
+        if self.health is None:  # pragma: no cover
+            return
+        if not failed and latency is None:
+            node.trial_in_flight = False
+            return
+        now = monotonic()
+        if node.state is CircuitState.HalfOpen:
+            if failed:
+                self._open(node, now)
+            else:
+                self._close(node)
+            return
+        if node.state is not CircuitState.Closed:
+            return
+        node.outcomes.append(failed)
+        error_rate_exceeded = len(node.outcomes) >= self.health.min_requests and (
+            sum(node.outcomes) / len(node.outcomes) >= self.health.failure_rate
+        )
+        if error_rate_exceeded or self._is_latency_outlier(node):
+            self._open(node, now)
+
+    def record_probe(self, node: Node, *, healthy: bool) -> None:
+        """
+        Record the result of an active health probe of the node.
+
+        A successful probe lets an open circuit try a request straight away, while consecutive failures open it.
+
+        Args:
+            node: The probed node
+            healthy: Whether the probe succeeded
+
+        """
+        if self.health is None:  # pragma: no cover
+            return
+        with self._lock:
+            if healthy:
+                node.probe_failures = 0
+                if node.state is CircuitState.Open:
+                    node.state = CircuitState.HalfOpen
+                return
+            node.probe_failures += 1
+            if node.probe_failures >= self.health.probe_failures and node.state is not CircuitState.Open:
+                self._open(node, monotonic())
+
+    def release(self, node: Node) -> None:
+        """Mark a request to the node as finished."""
+        with self._lock:
+            node.in_flight -= 1
+
+    def stats(self) -> list[NodeStats]:
+        """Snapshot the counters of every node."""
+        with self._lock:
+            return [node.stats() for node in self.nodes]
+
+    def route(self, request: Request) -> Node:
+        """
+        Choose a node for the request and point the request at it, keeping the path and query.
+
+        Honors a RouteHint in the request extensions.
+
+        Args:
+            request: The request to route
+
+        Returns:
+            The chosen node, counted as in flight
+
+        """
+        hint: RouteHint | None = request.extensions.get(ROUTE_EXTENSION)
+        node = self.acquire(hint.avoid if hint is not None else None)
+        if hint is not None:
+            hint.node = node
+        request.url = request.url.copy_with(scheme=node.url.scheme, host=node.url.host, port=node.url.port)
+        request.headers["Host"] = node.host_header
+        return node
+
+
+class _SyncReleasingStream(SyncByteStream):
+    def __init__(self, stream: SyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    def __iter__(self) -> Iterator[bytes]:
+        yield from self._stream
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+class _AsyncReleasingStream(AsyncByteStream):
+    def __init__(self, stream: AsyncByteStream, release: Callable[[], None]) -> None:
+        self._stream = stream
+        self._release: Callable[[], None] | None = release
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._stream:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            if self._release is not None:
+                self._release()
+                self._release = None
+
+
+def _mounted(mounts: Mapping[str, T | None] | None) -> dict[URLPattern, T | None]:
+    # Most specific patterns first, as httpx orders its own mounts
+    return dict(sorted((URLPattern(key), transport) for key, transport in (mounts or {}).items()))
+
+
+class SyncBalancingTransport(BaseTransport):
+    """
+    Spreads requests over the nodes of a pool, delegating the actual I/O to a single pooled transport.
+
+    A request stays in flight on its node until its response is closed.  The transport is chosen once the request
+    points at its node, so proxies apply per server, as httpx applies its mounts.
+
+    Args:
+        transport: Sends requests without a proxy
+        pool: The servers requests are spread over
+        mounts: Transports for URL patterns, as httpx's mounts, such as proxies.  None sends with transport
+
+    """
+
+    def __init__(
+        self,
+        transport: BaseTransport,
+        pool: NodePool,
+        mounts: Mapping[str, BaseTransport | None] | None = None,
+    ) -> None:
+        self.transport = transport
+        self.pool = pool
+        self.mounts = _mounted(mounts)
+
+    def transport_for_url(self, url: URL) -> BaseTransport:
+        """
+        Choose the transport for a URL, the first mount matching it, else the default transport.
+
+        Args:
+            url: The URL, already pointing at its node
+
+        Returns:
+            The transport
+
+        """
+        for pattern, transport in self.mounts.items():
+            if pattern.matches(url):
+                return self.transport if transport is None else transport
+        return self.transport
+
+    def handle_request(self, request: Request) -> Response:
+        node = self.pool.route(request)
+        start = perf_counter()
+        try:
+            response = self.transport_for_url(request.url).handle_request(request)
+        except BaseException as err:
+            # Cancellation must release the node too, but says nothing about the node's health
+            self.pool.record(node, latency=None, failed=isinstance(err, Exception))
+            self.pool.release(node)
+            raise
+        self.pool.record(node, latency=perf_counter() - start, failed=response.status_code in NODE_FAILURE_STATUSES)
+        response.stream = _SyncReleasingStream(response.stream, lambda: self.pool.release(node))  # type: ignore[arg-type]
+        return response
+
+    def close(self) -> None:
+        self.transport.close()
+        for transport in self.mounts.values():
+            if transport is not None:
+                transport.close()
+
+
+class AsyncBalancingTransport(AsyncBaseTransport):
+    """
+    Spreads requests over the nodes of a pool, delegating the actual I/O to a single pooled transport.
+
+    A request stays in flight on its node until its response is closed.  The transport is chosen once the request
+    points at its node, so proxies apply per server, as httpx applies its mounts.
+
+    Args:
+        transport: Sends requests without a proxy
+        pool: The servers requests are spread over
+        mounts: Transports for URL patterns, as httpx's mounts, such as proxies.  None sends with transport
+
+    """
+
+    def __init__(
+        self,
+        transport: AsyncBaseTransport,
+        pool: NodePool,
+        mounts: Mapping[str, AsyncBaseTransport | None] | None = None,
+    ) -> None:
+        self.transport = transport
+        self.pool = pool
+        self.mounts = _mounted(mounts)
+
+    def transport_for_url(self, url: URL) -> AsyncBaseTransport:
+        """
+        Choose the transport for a URL, the first mount matching it, else the default transport.
+
+        Args:
+            url: The URL, already pointing at its node
+
+        Returns:
+            The transport
+
+        """
+        for pattern, transport in self.mounts.items():
+            if pattern.matches(url):
+                return self.transport if transport is None else transport
+        return self.transport
+
+    async def handle_async_request(self, request: Request) -> Response:
+        node = self.pool.route(request)
+        start = perf_counter()
+        try:
+            response = await self.transport_for_url(request.url).handle_async_request(request)
+        except BaseException as err:
+            # Cancellation must release the node too, but says nothing about the node's health
+            self.pool.record(node, latency=None, failed=isinstance(err, Exception))
+            self.pool.release(node)
+            raise
+        self.pool.record(node, latency=perf_counter() - start, failed=response.status_code in NODE_FAILURE_STATUSES)
+        response.stream = _AsyncReleasingStream(response.stream, lambda: self.pool.release(node))  # type: ignore[arg-type]
+        return response
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+        for transport in self.mounts.values():
+            if transport is not None:
+                await transport.aclose()
@@ -4,8 +4,13 @@
 
 from __future__ import annotations
 
+import json
+import logging
+import time
 from abc import ABC
 from abc import abstractmethod
+from dataclasses import dataclass
+from functools import partial
 from mimetypes import guess_type
 from typing import TYPE_CHECKING
 from typing import Any
@@ -13,25 +18,192 @@ from typing import Generic
 from typing import TypeVar
 from urllib.parse import quote
 
+from anyio import Event
+from anyio import create_task_group
+from anyio import move_on_after
+from anyio import sleep
 from anyio.to_thread import run_sync
 from httpx import AsyncClient
 from httpx import Client
+from httpx import HTTPError
 
+from tika_client._balancer import ROUTE_EXTENSION
+from tika_client._balancer import RouteHint
+from tika_client._cache import VERSION_ACCEPT
+from tika_client._cache import VERSION_ENDPOINT
+from tika_client._cache import VERSION_RETRY_INTERVAL
+from tika_client._cache import cache_key
+from tika_client._cache import content_digest
+from tika_client._cache import file_digest
+from tika_client._constants import DEFAULT_COMPRESS_LEVEL
 from tika_client._constants import MIN_COMPRESS_LEN
+from tika_client._constants import UPLOAD_CHUNK_SIZE
+from tika_client._multipart import AsyncFileMultipart
+from tika_client._upload import UploadMode
+from tika_client._upload import agzip_chunks
+from tika_client._upload import aiter_buffer_chunks
+from tika_client._upload import aiter_file_chunks
+from tika_client._upload import gzip_chunks
+from tika_client._upload import iter_buffer_chunks
+from tika_client._upload import iter_file_chunks
 from tika_client.data_models import TikaResponse
 
 if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
     from collections.abc import Coroutine
+    from collections.abc import Mapping
     from pathlib import Path
 
+    from httpx import Response
+
+    from tika_client._cache import MemoryCache
+    from tika_client._cache import ResultCache
+    from tika_client._coalesce import Coalescer
+    from tika_client._compression import CompressionAdvisor
+    from tika_client._compression import CompressionTally
+    from tika_client._hedging import Hedger
+    from tika_client._json import JsonDecoder
+    from tika_client._options import ParseOptions
+    from tika_client._retry import Retrier
+
 
 T = TypeVar("T", bound="Client | AsyncClient")
 
+logger = logging.getLogger("tika_client")
+
+
+@dataclass
+class ResourceConfig:
+    """
+    Settings and shared state for every resource created by one client.
+
+    Args:
+        compress: Whether to compress content sent to the server
+        compress_level: The gzip level content is compressed with
+        retrier: Retries transient failures when set, shared so the retry budget covers the whole client
+        hedger: Hedges slow requests of the async client when set
+        upload_mode: How from_file sends documents
+        chunk_size: The bytes read from a document at once when streaming it
+        compression: Decides which content is worth compressing when set, shared so it learns from every upload
+        json_decoder: Decodes the JSON responses of the server
+        cache: Caches the JSON responses of the server on disk when set
+        memory_cache: Caches the decoded JSON responses of the server in memory when set, in front of the cache
+        coalescer: Lets identical calls in flight at once share one request when set
+        parse_options: The parse settings sent with every request, unless a request overrides them
+        server_version: The version of the Tika server, once asked for the cache keys
+        version_retry_at: The monotonic time after which the version is asked again, once its request failed
+
+    """
+
+    compress: bool = False
+    compress_level: int = DEFAULT_COMPRESS_LEVEL
+    retrier: Retrier | None = None
+    hedger: Hedger | None = None
+    upload_mode: UploadMode = UploadMode.Multipart
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+    compression: CompressionAdvisor | None = None
+    json_decoder: JsonDecoder = json.loads
+    cache: ResultCache | None = None
+    memory_cache: MemoryCache | None = None
+    coalescer: Coalescer | None = None
+    parse_options: ParseOptions | None = None
+    server_version: str | None = None
+    version_retry_at: float = 0.0
+
 
 class BaseResource(ABC, Generic[T]):
-    def __init__(self, client: T, *, compress: bool) -> None:
+    def __init__(self, client: T, config: ResourceConfig) -> None:
         self.client = client
-        self.compress = compress
+        self.config = config
+
+    @property
+    def compress(self) -> bool:
+        """Whether content sent to the server is compressed."""
+        return self.config.compress
+
+    def should_compress(
+        self,
+        size: int,
+        mime_type: str | None = None,
+        sample: Callable[[], bytes | memoryview] | None = None,
+    ) -> bool:
+        """
+        Decide whether a body is compressed.
+
+        Args:
+            size: The uncompressed size in bytes
+            mime_type: The MIME type of the body, if known
+            sample: Returns the first bytes of the body, for estimating how well it compresses
+
+        Returns:
+            Whether to gzip the body
+
+        """
+        if not self.compress:
+            return False
+        advisor = self.config.compression
+        if advisor is None:
+            return size > MIN_COMPRESS_LEN
+        return advisor.decide(size, mime_type, sample)
+
+    def compression_tally(self, mime_type: str | None) -> CompressionTally | None:
+        """
+        Start measuring a compressed body, when the client learns from its compression outcomes.
+
+        Args:
+            mime_type: The MIME type of the body, if known
+
+        Returns:
+            The tally to compress the body through, if any
+
+        """
+        advisor = self.config.compression
+        return advisor.tally(mime_type) if advisor is not None else None
+
+    def sample_file(self, filepath: Path) -> bytes:
+        """
+        Read the start of a file, for estimating how well it compresses.
+
+        Args:
+            filepath: The file to sample
+
+        Returns:
+            Up to the policy's sample size of bytes from the start of the file
+
+        """
+        size = self.config.compression.policy.sample_size if self.config.compression is not None else 0
+        with filepath.open("rb") as handle:
+            return handle.read(size)
+
+    def sample_buffer(self, content: bytes) -> memoryview:
+        """
+        View the start of a buffer, for estimating how well it compresses.
+
+        Args:
+            content: The buffer to sample
+
+        Returns:
+            Up to the policy's sample size of bytes from the start of the buffer, without copying it
+
+        """
+        size = self.config.compression.policy.sample_size if self.config.compression is not None else 0
+        return memoryview(content)[:size]
+
+    @staticmethod
+    def file_type(filepath: Path, mime_type: str | None) -> str | None:
+        """
+        Determine the MIME type of a file, as given or guessed from its name.
+
+        Args:
+            filepath: The file
+            mime_type: The MIME type given by the caller, if any
+
+        Returns:
+            The MIME type, if it is known
+
+        """
+        return mime_type or guess_type(filepath.name)[0]
 
     @staticmethod
     def get_content_headers(filename: str, disposition: str = "attachment") -> dict[str, str]:
@@ -76,6 +248,8 @@ class BaseResource(ABC, Generic[T]):
         endpoint: str,
         filepath: Path,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> Any | Coroutine[Any, Any, Any]:  # noqa: ANN401
         """
         Given an endpoint, file and a mime type, does a multi-part form data upload of the file to the end point.
@@ -86,6 +260,30 @@ class BaseResource(ABC, Generic[T]):
             endpoint: The endpoint to send the file to
             filepath: The path to the file to send
             mime_type: The mime type of the file to send, if it's not provided, it will be guessed
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            The JSON response of the server
+
+        """
+
+    @abstractmethod
+    def put_stream(  # pragma: no cover
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Any | Coroutine[Any, Any, Any]:  # noqa: ANN401
+        """
+        Given an endpoint, file and a mime type, does an HTTP PUT with the raw file streamed as the body.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, Tika will detect it
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response of the server
@@ -98,6 +296,8 @@ class BaseResource(ABC, Generic[T]):
         endpoint: str,
         content: str | bytes,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> Any | Coroutine[Any, Any, Any]:  # noqa: ANN401
         """
         Give, an endpoint, content and optional mime type, does an HTTP PUT with the given content.
@@ -108,12 +308,223 @@ class BaseResource(ABC, Generic[T]):
             endpoint: The endpoint to send the content to
             content: The content to send
             mime_type: The mime type of the content, if it's not provided, it will be guessed
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response of the server
 
         """
 
+    def get_stream_headers(self, filepath: Path, mime_type: str | None) -> dict[str, str]:
+        """
+        Build the headers for streaming a file as the raw request body.
+
+        Args:
+            filepath: The file to send
+            mime_type: The mime type of the file, if any
+
+        Returns:
+            The headers
+
+        """
+        headers = self.get_content_headers(filepath.name)
+        # Known up front, so the body is not sent with chunked transfer encoding
+        headers["Content-Length"] = str(filepath.stat().st_size)
+        if mime_type is not None:
+            headers["Content-Type"] = mime_type
+        return headers
+
+    def decode_json(self, response: Response) -> Any:  # noqa: ANN401
+        """
+        Decode the JSON body of a response with the client's decoder.
+
+        Args:
+            response: The response, already read
+
+        Returns:
+            The decoded JSON
+
+        """
+        return self.config.json_decoder(response.content)
+
+    @property
+    def caching(self) -> bool:
+        """Whether responses are cached, on disk or in memory."""
+        return self.config.cache is not None or self.config.memory_cache is not None
+
+    def hash_file(self, filepath: Path) -> str:
+        """
+        Hash a file's content for a cache key, unless a cache remembers its hash.
+
+        Args:
+            filepath: The file
+
+        Returns:
+            The hex SHA-256 digest
+
+        """
+        cache = self.config.cache
+        chunk_size = self.config.chunk_size
+        # Hashing reads the whole file, unless it is unchanged since it was last hashed
+        hasher = partial(cache.file_digest if cache is not None else file_digest, chunk_size=chunk_size)
+        memory = self.config.memory_cache
+        return memory.file_digest(filepath, hasher) if memory is not None else hasher(filepath)
+
+    def remembered_json(self, key: str) -> Any:  # noqa: ANN401
+        """
+        Look up a decoded response in the memory cache.
+
+        Args:
+            key: The key of the response
+
+        Returns:
+            The decoded JSON, or None if it is not in memory
+
+        """
+        memory = self.config.memory_cache
+        return memory.get(key) if memory is not None else None
+
+    def remember_json(self, key: str, content: bytes) -> Any:  # noqa: ANN401
+        """
+        Decode a response, keeping it in the memory cache.
+
+        Args:
+            key: The key of the response
+            content: The response body
+
+        Returns:
+            The decoded JSON
+
+        """
+        value = self.config.json_decoder(content)
+        memory = self.config.memory_cache
+        if memory is not None:
+            memory.put(key, value, len(content))
+        return value
+
+    @property
+    def keyed(self) -> bool:
+        """Whether requests need a key, to be cached or coalesced."""
+        return self.caching or self.config.coalescer is not None
+
+    def parse_headers(self, options: ParseOptions | None) -> dict[str, str]:
+        """
+        Build the headers for a request's parse settings, over the client's defaults.
+
+        Args:
+            options: The settings of the request, if any
+
+        Returns:
+            The headers, empty when nothing is set
+
+        """
+        defaults = self.config.parse_options
+        if options is None:
+            options = defaults
+        elif defaults is not None:
+            options = defaults.merged(options)
+        return options.headers() if options is not None else {}
+
+    def result_key(
+        self,
+        digest: str,
+        endpoint: str,
+        mime_type: str | None,
+        server_version: str | None,
+        headers: Mapping[str, str],
+    ) -> str:
+        """
+        Build the key a JSON response is cached or coalesced under.
+
+        Args:
+            digest: The hash of the uploaded content
+            endpoint: The endpoint the content is sent to, whatever the upload mode
+            mime_type: The mime type given for the content, if any
+            server_version: The version of the Tika server, None when the response is not cached
+            headers: The parse settings headers sent with the content
+
+        Returns:
+            The key
+
+        """
+        if mime_type is not None:
+            headers = {**headers, "Content-Type": mime_type}
+        # Calls in flight at once go to the same server, so coalescing alone does not need its version
+        return cache_key(digest, endpoint, headers, server_version or "")
+
+    def file_result_key(  # noqa: PLR0913
+        self,
+        digest: str,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None,
+        *,
+        server_version: str | None,
+        headers: Mapping[str, str],
+    ) -> str:
+        """
+        Build the key a file's JSON response is cached or coalesced under.
+
+        The file's name and its type, as given or guessed from the name, are part of the key.  Both are sent with the
+        upload, and Tika reports them back, so identical content under another name is another result.
+
+        Args:
+            digest: The hash of the file's content
+            endpoint: The endpoint the file is sent to, whatever the upload mode
+            filepath: The file
+            mime_type: The mime type given for the file, if any
+            server_version: The version of the Tika server, None when the response is not cached
+            headers: The parse settings headers sent with the file
+
+        Returns:
+            The key
+
+        """
+        return self.result_key(
+            digest,
+            endpoint,
+            self.file_type(filepath, mime_type),
+            server_version,
+            {**headers, **self.get_content_headers(filepath.name)},
+        )
+
+    @property
+    def version_unavailable(self) -> bool:
+        """Whether the version request failed recently, so is not worth sending again yet."""
+        return time.monotonic() < self.config.version_retry_at
+
+    def version_failed(self, reason: str) -> None:
+        """
+        Remember the version request failed, so calls until the retry interval passes go uncached without asking.
+
+        Args:
+            reason: Why the request failed, for the log
+
+        """
+        self.config.version_retry_at = time.monotonic() + VERSION_RETRY_INTERVAL
+        logger.warning(
+            "Not caching for %.0f seconds, the Tika server version request failed: %s",
+            VERSION_RETRY_INTERVAL,
+            reason,
+        )
+
+    def version_response(self, response: Response) -> str | None:
+        """
+        Remember the server version from the response to a version request.
+
+        Args:
+            response: The response, already read
+
+        Returns:
+            The version, or None if the server did not answer it
+
+        """
+        if response.is_error:
+            self.version_failed(f"HTTP {response.status_code}")
+            return None
+        self.config.server_version = response.text.strip()
+        return self.config.server_version
+
     @staticmethod
     def decoded_response(resp_json: dict[str, Any]) -> TikaResponse:
         """
@@ -130,11 +541,85 @@ class BaseResource(ABC, Generic[T]):
 
 
 class SyncResource(BaseResource[Client]):
+    def put_file(
+        self,
+        endpoint: str,
+        multipart_endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Upload a file in the client's upload mode.
+
+        Args:
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            Returns the JSON response of the server
+
+        """
+        headers = self.parse_headers(options)
+        if not self.keyed:
+            return self.decode_json(
+                self.send_file(endpoint, multipart_endpoint, filepath, mime_type, extra_headers=headers),
+            )
+        server_version = self.server_version() if self.caching else None
+        key = self.file_result_key(
+            self.hash_file(filepath),
+            endpoint,
+            filepath,
+            mime_type,
+            server_version=server_version,
+            headers=headers,
+        )
+        return self.shared_json(
+            key,
+            lambda: self.send_file(endpoint, multipart_endpoint, filepath, mime_type, extra_headers=headers),
+            cached=server_version is not None,
+        )
+
+    def send_file(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        multipart_endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        Upload a file in the client's upload mode, returning the response.
+
+        Args:
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+        if self.config.upload_mode is UploadMode.Stream:
+            return self.send_raw(endpoint, filepath, mime_type, stream=stream, extra_headers=extra_headers)
+        return self.send_multipart(multipart_endpoint, filepath, mime_type, stream=stream, extra_headers=extra_headers)
+
     def put_multipart(
         self,
         endpoint: str,
         filepath: Path,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> Any:  # noqa: ANN401
         """
         Given an endpoint, file and a mime type, does a multi-part form data upload of the file to the end point.
@@ -143,31 +628,143 @@ class SyncResource(BaseResource[Client]):
             endpoint: The endpoint to send the file to
             filepath: The path to the file to send
             mime_type: The mime type of the file to send, if it's not provided, it will be guessed
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             Returns the JSON response of the server
 
         """
-        with filepath.open("rb") as handler:
-            response = self.client.post(
+        return self.decode_json(
+            self.send_multipart(endpoint, filepath, mime_type, extra_headers=self.parse_headers(options)),
+        )
+
+    def send_multipart(
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        Upload the file as multi-part form data to the end point, returning the response.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, it will be guessed
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+
+        def send() -> Response:
+            # Opened for every attempt, so a retry streams the file from disk again
+            with filepath.open("rb") as handler:
+                request = self.client.build_request(
+                    "POST",
+                    endpoint,
+                    files={
+                        "upload-file": (
+                            filepath.name,
+                            handler,
+                            mime_type or guess_type(filepath.name)[0] or "",
+                        ),
+                    },
+                    headers={**BaseResource.get_content_headers(filepath.name), **(extra_headers or {})},
+                )
+                # The whole body is sent before the response is returned, even when streaming it
+                return self.client.send(request, stream=stream)
+
+        return self.send_with_retries(send)
+
+    def put_stream(
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Given an endpoint, file and a mime type, does an HTTP PUT with the raw file streamed as the body.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, Tika will detect it
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            Returns the JSON response of the server
+
+        """
+        return self.decode_json(self.send_raw(endpoint, filepath, mime_type, extra_headers=self.parse_headers(options)))
+
+    def send_raw(
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        PUT the raw file streamed as the body to the end point, returning the response.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, Tika will detect it
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+        headers = self.get_stream_headers(filepath, mime_type)
+        headers.update(extra_headers or {})
+        file_type = self.file_type(filepath, mime_type)
+        compressed = self.should_compress(
+            int(headers["Content-Length"]),
+            file_type,
+            lambda: self.sample_file(filepath),
+        )
+        if compressed:
+            # The compressed length is not known until the end, so the body is sent chunked
+            del headers["Content-Length"]
+            headers["Content-Encoding"] = "gzip"
+
+        def send() -> Response:
+            # A new iterator for every attempt, so a retry streams the file from disk again
+            chunks = iter_file_chunks(filepath, self.config.chunk_size)
+            request = self.client.build_request(
+                "PUT",
                 endpoint,
-                files={
-                    "upload-file": (
-                        filepath.name,
-                        handler,
-                        mime_type or guess_type(filepath.name)[0] or "",
-                    ),
-                },
-                headers=BaseResource.get_content_headers(filepath.name),
+                content=(
+                    gzip_chunks(chunks, self.config.compress_level, self.compression_tally(file_type))
+                    if compressed
+                    else chunks
+                ),
+                headers=headers,
             )
-        response.raise_for_status()
-        return response.json()
+            return self.client.send(request, stream=stream)
+
+        return self.send_with_retries(send)
 
     def put_content(
         self,
         endpoint: str,
         content: str | bytes,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> Any:  # noqa: ANN401
         """
         Give, an endpoint, content and optional mime type, does an HTTP PUT with the given content.
@@ -176,37 +773,272 @@ class SyncResource(BaseResource[Client]):
             endpoint: The endpoint to send the content to
             content: The content to send
             mime_type: The mime type of the content, if it's not provided, it will be guessed
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             Returns the JSON response of the server
 
         """
+        headers = self.parse_headers(options)
+        if not self.keyed:
+            return self.decode_json(self.send_content(endpoint, content, mime_type, extra_headers=headers))
+        server_version = self.server_version() if self.caching else None
         content_bytes = content.encode() if isinstance(content, str) else content
-        content_length = len(content_bytes)
+        key = self.result_key(content_digest(content_bytes), endpoint, mime_type, server_version, headers)
+        return self.shared_json(
+            key,
+            lambda: self.send_content(endpoint, content_bytes, mime_type, extra_headers=headers),
+            cached=server_version is not None,
+        )
 
-        headers = {}
-        if self.compress and content_length > MIN_COMPRESS_LEN:
-            from gzip import compress  # noqa: PLC0415
+    def server_version(self) -> str | None:
+        """
+        Ask the server for its version, once per client, for the result cache keys.
 
-            content_bytes = compress(content_bytes)
-            content_length = len(content_bytes)
-            headers["Content-Encoding"] = "gzip"
+        Returns:
+            The version, or None if the server could not be asked, now or within the retry interval
+
+        """
+        if self.config.server_version is not None:
+            return self.config.server_version
+        if self.version_unavailable:
+            return None
+        try:
+            response = self.client.get(VERSION_ENDPOINT, headers=VERSION_ACCEPT)
+        except HTTPError as err:
+            self.version_failed(repr(err))
+            return None
+        return self.version_response(response)
+
+    def shared_json(self, key: str, send: Callable[[], Response], *, cached: bool) -> Any:  # noqa: ANN401
+        """
+        Decode a response, sharing one request between identical calls in flight at once when coalescing.
+
+        Args:
+            key: The key of the response
+            send: Sends the request and returns the successful response
+            cached: Whether the caches may answer and keep the response
+
+        Returns:
+            The decoded JSON
+
+        """
+
+        def fetch() -> Any:  # noqa: ANN401
+            if cached:
+                return self.cached_json(key, send)
+            return self.decode_json(send())
+
+        coalescer = self.config.coalescer
+        return coalescer.call(key, fetch) if coalescer is not None else fetch()
+
+    def cached_json(self, key: str, send: Callable[[], Response]) -> Any:  # noqa: ANN401
+        """
+        Decode a response from the memory cache, the result cache, or the server when neither holds it yet.
+
+        Args:
+            key: The key of the response
+            send: Sends the request and returns the successful response
+
+        Returns:
+            The decoded JSON
+
+        """
+        value = self.remembered_json(key)
+        if value is not None:
+            return value
+        cache = self.config.cache
+        content = cache.get(key) if cache is not None else None
+        if content is None:
+            content = send().content
+            if cache is not None:
+                cache.put(key, content)
+        return self.remember_json(key, content)
+
+    def send_content(
+        self,
+        endpoint: str,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        PUT the given content to the end point, returning the response.
+
+        Args:
+            endpoint: The endpoint to send the content to
+            content: The content to send
+            mime_type: The mime type of the content, if it's not provided, it will be guessed
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
 
-        headers["Content-Length"] = str(content_length)
+        Returns:
+            The successful response
+
+        """
+        content_bytes = content.encode() if isinstance(content, str) else content
+        compressed = self.should_compress(len(content_bytes), mime_type, lambda: self.sample_buffer(content_bytes))
+
+        headers = {}
+        if compressed:
+            # Compressed chunk by chunk while sending, so no compressed copy of the whole buffer is held
+            headers["Content-Encoding"] = "gzip"
+        else:
+            headers["Content-Length"] = str(len(content_bytes))
         if mime_type is not None:
             headers["Content-Type"] = mime_type
+        headers.update(extra_headers or {})
+
+        def send() -> Response:
+            body = (
+                gzip_chunks(
+                    iter_buffer_chunks(content_bytes, self.config.chunk_size),
+                    self.config.compress_level,
+                    self.compression_tally(mime_type),
+                )
+                if compressed
+                else content_bytes
+            )
+            request = self.client.build_request("PUT", endpoint, content=body, headers=headers)
+            return self.client.send(request, stream=stream)
+
+        return self.send_with_retries(send)
+
+    def send_with_retries(self, send: Callable[[], Response]) -> Response:
+        """
+        Send a request, retrying transient failures when the client has a retry policy.
+
+        Args:
+            send: Sends one attempt of the request and returns its response
+
+        Returns:
+            The successful response
+
+        Raises:
+            httpx.HTTPStatusError: The final attempt returned an error status
 
-        response = self.client.put(endpoint, content=content_bytes, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        """
+        retrier = self.config.retrier
+        if retrier is not None:
+            retrier.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                response = send()
+            except Exception as err:
+                delay = retrier.next_delay(attempt, error=err) if retrier is not None else None
+                if delay is None:
+                    raise
+                logger.info("Retrying after %r, attempt %d in %.2f seconds", err, attempt + 1, delay)
+            else:
+                delay = retrier.next_delay(attempt, response=response) if retrier is not None else None
+                if delay is None:
+                    if response.is_error:
+                        # Reading a streamed error response releases its connection, and its body is kept on the error
+                        response.read()
+                    response.raise_for_status()
+                    return response
+                response.close()
+                logger.info(
+                    "Retrying after HTTP %d, attempt %d in %.2f seconds",
+                    response.status_code,
+                    attempt + 1,
+                    delay,
+                )
+            time.sleep(delay)
+            attempt += 1
 
 
 class AsyncResource(BaseResource[AsyncClient]):
+    async def put_file(
+        self,
+        endpoint: str,
+        multipart_endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Upload a file in the client's upload mode.
+
+        Args:
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            Returns the JSON response of the server
+
+        """
+        headers = self.parse_headers(options)
+        if not self.keyed:
+            return self.decode_json(
+                await self.send_file(endpoint, multipart_endpoint, filepath, mime_type, extra_headers=headers),
+            )
+        server_version = await self.server_version() if self.caching else None
+        # Even the stat for a remembered hash may block on network storage, so it is looked up in a worker thread too
+        digest = await run_sync(self.hash_file, filepath)
+        key = self.file_result_key(
+            digest,
+            endpoint,
+            filepath,
+            mime_type,
+            server_version=server_version,
+            headers=headers,
+        )
+        return await self.shared_json(
+            key,
+            lambda: self.send_file(endpoint, multipart_endpoint, filepath, mime_type, extra_headers=headers),
+            cached=server_version is not None,
+        )
+
+    async def send_file(  # noqa: PLR0913
+        self,
+        endpoint: str,
+        multipart_endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        Upload a file in the client's upload mode, returning the response.
+
+        Args:
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+        if self.config.upload_mode is UploadMode.Stream:
+            return await self.send_raw(endpoint, filepath, mime_type, stream=stream, extra_headers=extra_headers)
+        return await self.send_multipart(
+            multipart_endpoint,
+            filepath,
+            mime_type,
+            stream=stream,
+            extra_headers=extra_headers,
+        )
+
     async def put_multipart(
         self,
         endpoint: str,
         filepath: Path,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> Any:  # noqa: ANN401
         """
         Given an endpoint, file and a mime type, does a multi-part form data upload of the file to the end point.
@@ -215,31 +1047,145 @@ class AsyncResource(BaseResource[AsyncClient]):
             endpoint: The endpoint to send the file to
             filepath: The path to the file to send
             mime_type: The mime type of the file to send, if it's not provided, it will be guessed
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             Returns the JSON response of the server
 
         """
-        with filepath.open("rb") as handler:
-            response = await self.client.post(
+        return self.decode_json(
+            await self.send_multipart(endpoint, filepath, mime_type, extra_headers=self.parse_headers(options)),
+        )
+
+    async def send_multipart(
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        Upload the file as multi-part form data to the end point, returning the response.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, it will be guessed
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+        form = AsyncFileMultipart(
+            "upload-file",
+            filepath,
+            mime_type or guess_type(filepath.name)[0] or "",
+            self.config.chunk_size,
+        )
+        headers = self.get_content_headers(filepath.name)
+        # Even the size is not read on the event loop, it may be slow on network storage
+        headers.update(form.headers((await run_sync(filepath.stat)).st_size))
+        headers.update(extra_headers or {})
+
+        async def send(extensions: dict[str, Any]) -> Response:
+            # Iterating the form reads the file again, so a retry or hedge streams it from disk again
+            request = self.client.build_request("POST", endpoint, content=form, headers=headers, extensions=extensions)
+            return await self.client.send(request, stream=stream)
+
+        return await self.send_with_retries(send)
+
+    async def put_stream(
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Any:  # noqa: ANN401
+        """
+        Given an endpoint, file and a mime type, does an HTTP PUT with the raw file streamed as the body.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, Tika will detect it
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            Returns the JSON response of the server
+
+        """
+        return self.decode_json(
+            await self.send_raw(endpoint, filepath, mime_type, extra_headers=self.parse_headers(options)),
+        )
+
+    async def send_raw(
+        self,
+        endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        PUT the raw file streamed as the body to the end point, returning the response.
+
+        Args:
+            endpoint: The endpoint to send the file to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send, if it's not provided, Tika will detect it
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+        headers = await run_sync(self.get_stream_headers, filepath, mime_type)
+        headers.update(extra_headers or {})
+        file_type = self.file_type(filepath, mime_type)
+        # Sampling reads and compresses the start of the file, so it is kept off the event loop too
+        compressed = self.compress and await run_sync(
+            self.should_compress,
+            int(headers["Content-Length"]),
+            file_type,
+            lambda: self.sample_file(filepath),
+        )
+        if compressed:
+            # The compressed length is not known until the end, so the body is sent chunked
+            del headers["Content-Length"]
+            headers["Content-Encoding"] = "gzip"
+
+        async def send(extensions: dict[str, Any]) -> Response:
+            # A new iterator for every attempt, so a retry or hedge streams the file from disk again
+            chunks = aiter_file_chunks(filepath, self.config.chunk_size)
+            request = self.client.build_request(
+                "PUT",
                 endpoint,
-                files={
-                    "upload-file": (
-                        filepath.name,
-                        handler,
-                        mime_type or guess_type(filepath.name)[0] or "",
-                    ),
-                },
-                headers=self.get_content_headers(filepath.name),
+                content=(
+                    agzip_chunks(chunks, self.config.compress_level, self.compression_tally(file_type))
+                    if compressed
+                    else chunks
+                ),
+                headers=headers,
+                extensions=extensions,
             )
-        response.raise_for_status()
-        return response.json()
+            return await self.client.send(request, stream=stream)
+
+        return await self.send_with_retries(send)
 
     async def put_content(
         self,
         endpoint: str,
         content: str | bytes,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> Any:  # noqa: ANN401
         """
         Give, an endpoint, content and optional mime type, does an HTTP PUT with the given content.
@@ -248,26 +1194,254 @@ class AsyncResource(BaseResource[AsyncClient]):
             endpoint: The endpoint to send the content to
             content: The content to send
             mime_type: The mime type of the content, if it's not provided, it will be guessed
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             Returns the JSON response of the server
 
         """
+        headers = self.parse_headers(options)
+        if not self.keyed:
+            return self.decode_json(await self.send_content(endpoint, content, mime_type, extra_headers=headers))
+        server_version = await self.server_version() if self.caching else None
         content_bytes = content.encode() if isinstance(content, str) else content
-        content_length = len(content_bytes)
+        digest = await run_sync(content_digest, content_bytes)
+        key = self.result_key(digest, endpoint, mime_type, server_version, headers)
+        return await self.shared_json(
+            key,
+            lambda: self.send_content(endpoint, content_bytes, mime_type, extra_headers=headers),
+            cached=server_version is not None,
+        )
 
-        headers = {}
-        if self.compress and content_length > MIN_COMPRESS_LEN:
-            from gzip import compress  # noqa: PLC0415
+    async def server_version(self) -> str | None:
+        """
+        Ask the server for its version, once per client, for the result cache keys.
 
-            content_bytes = await run_sync(compress, content_bytes)
-            content_length = len(content_bytes)
-            headers["Content-Encoding"] = "gzip"
+        Returns:
+            The version, or None if the server could not be asked, now or within the retry interval
+
+        """
+        if self.config.server_version is not None:
+            return self.config.server_version
+        if self.version_unavailable:
+            return None
+        try:
+            response = await self.client.get(VERSION_ENDPOINT, headers=VERSION_ACCEPT)
+        except HTTPError as err:
+            self.version_failed(repr(err))
+            return None
+        return self.version_response(response)
+
+    async def shared_json(
+        self,
+        key: str,
+        send: Callable[[], Awaitable[Response]],
+        *,
+        cached: bool,
+    ) -> Any:  # noqa: ANN401
+        """
+        Decode a response, sharing one request between identical calls in flight at once when coalescing.
+
+        Args:
+            key: The key of the response
+            send: Sends the request and returns the successful response
+            cached: Whether the caches may answer and keep the response
+
+        Returns:
+            The decoded JSON
+
+        """
+
+        async def fetch() -> Any:  # noqa: ANN401
+            if cached:
+                return await self.cached_json(key, send)
+            return self.decode_json(await send())
+
+        coalescer = self.config.coalescer
+        return await coalescer.acall(key, fetch) if coalescer is not None else await fetch()
+
+    async def cached_json(self, key: str, send: Callable[[], Awaitable[Response]]) -> Any:  # noqa: ANN401
+        """
+        Decode a response from the memory cache, the result cache, or the server when neither holds it yet.
+
+        The database is only used from worker threads, keeping its disk access off the event loop.  The memory cache
+        is used directly, it only holds its lock for a dictionary update.
+
+        Args:
+            key: The key of the response
+            send: Sends the request and returns the successful response
+
+        Returns:
+            The decoded JSON
+
+        """
+        value = self.remembered_json(key)
+        if value is not None:
+            return value
+        cache = self.config.cache
+        content = await run_sync(cache.get, key) if cache is not None else None
+        if content is None:
+            content = (await send()).content
+            if cache is not None:
+                await run_sync(cache.put, key, content)
+        return self.remember_json(key, content)
+
+    async def send_content(
+        self,
+        endpoint: str,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        stream: bool = False,
+        extra_headers: Mapping[str, str] | None = None,
+    ) -> Response:
+        """
+        PUT the given content to the end point, returning the response.
+
+        Args:
+            endpoint: The endpoint to send the content to
+            content: The content to send
+            mime_type: The mime type of the content, if it's not provided, it will be guessed
+            stream: Whether the response body is left to be streamed by the caller, who must close the response
+            extra_headers: Further request headers, overriding the client's defaults
+
+        Returns:
+            The successful response
+
+        """
+        content_bytes = content.encode() if isinstance(content, str) else content
+        # Sampling compresses the start of the buffer, so it is kept off the event loop
+        compressed = self.compress and await run_sync(
+            self.should_compress,
+            len(content_bytes),
+            mime_type,
+            lambda: self.sample_buffer(content_bytes),
+        )
 
-        headers["Content-Length"] = str(content_length)
+        headers = {}
+        if compressed:
+            # Compressed chunk by chunk while sending, so no compressed copy of the whole buffer is held
+            headers["Content-Encoding"] = "gzip"
+        else:
+            headers["Content-Length"] = str(len(content_bytes))
         if mime_type is not None:
             headers["Content-Type"] = mime_type
+        headers.update(extra_headers or {})
+
+        async def send(extensions: dict[str, Any]) -> Response:
+            body = (
+                agzip_chunks(
+                    aiter_buffer_chunks(content_bytes, self.config.chunk_size),
+                    self.config.compress_level,
+                    self.compression_tally(mime_type),
+                )
+                if compressed
+                else content_bytes
+            )
+            request = self.client.build_request("PUT", endpoint, content=body, headers=headers, extensions=extensions)
+            return await self.client.send(request, stream=stream)
+
+        return await self.send_with_retries(send)
+
+    async def send_hedged(self, send: Callable[[dict[str, Any]], Awaitable[Response]]) -> Response:
+        """
+        Send one attempt of a request, hedging it to another server if it is slow and the client hedges.
+
+        Args:
+            send: Sends the request with the given request extensions and returns its response
+
+        Returns:
+            The first response received
+
+        """
+        hedger = self.config.hedger
+        if hedger is None:
+            return await send({})
+        hedger.budget.deposit()
+        delay = hedger.delay()
 
-        response = await self.client.put(endpoint, content=content_bytes, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        winner: Response | None = None
+        errors: list[Exception] = []
+        primary_route = RouteHint()
+        primary_done = Event()
+        # A hedge's latency counts from the original request, which is what the caller waited
+        primary_start = time.perf_counter()
+
+        async with create_task_group() as tg:
+
+            async def attempt(route: RouteHint, *, hedge: bool) -> None:
+                nonlocal winner
+                try:
+                    response = await send({ROUTE_EXTENSION: route})
+                except Exception as err:  # noqa: BLE001
+                    # Raised after both attempts, if neither produced a response
+                    errors.append(err)
+                    return
+                finally:
+                    if not hedge:
+                        primary_done.set()
+                if winner is not None:  # pragma: no cover
+                    await response.aclose()
+                    return
+                winner = response
+                hedger.record(time.perf_counter() - primary_start)
+                if hedge:
+                    hedger.record_win()
+                # The slower request is no longer needed
+                tg.cancel_scope.cancel()
+
+            tg.start_soon(lambda: attempt(primary_route, hedge=False))
+            if delay is not None:
+                with move_on_after(delay):
+                    await primary_done.wait()
+                if not primary_done.is_set() and hedger.try_fire():
+                    logger.debug("Hedging a request still running after %.3f seconds", delay)
+                    tg.start_soon(lambda: attempt(RouteHint(avoid=primary_route.node), hedge=True))
+
+        if winner is None:
+            raise errors[0]
+        return winner
+
+    async def send_with_retries(self, send: Callable[[dict[str, Any]], Awaitable[Response]]) -> Response:
+        """
+        Send a request, retrying transient failures when the client has a retry policy.
+
+        Args:
+            send: Sends one attempt of the request with the given request extensions and returns its response
+
+        Returns:
+            The successful response
+
+        Raises:
+            httpx.HTTPStatusError: The final attempt returned an error status
+
+        """
+        retrier = self.config.retrier
+        if retrier is not None:
+            retrier.budget.deposit()
+        attempt = 1
+        while True:
+            try:
+                response = await self.send_hedged(send)
+            except Exception as err:
+                delay = retrier.next_delay(attempt, error=err) if retrier is not None else None
+                if delay is None:
+                    raise
+                logger.info("Retrying after %r, attempt %d in %.2f seconds", err, attempt + 1, delay)
+            else:
+                delay = retrier.next_delay(attempt, response=response) if retrier is not None else None
+                if delay is None:
+                    if response.is_error:
+                        # Reading a streamed error response releases its connection, and its body is kept on the error
+                        await response.aread()
+                    response.raise_for_status()
+                    return response
+                await response.aclose()
+                logger.info(
+                    "Retrying after HTTP %d, attempt %d in %.2f seconds",
+                    response.status_code,
+                    attempt + 1,
+                    delay,
+                )
+            await sleep(delay)
+            attempt += 1
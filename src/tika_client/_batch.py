@@ -0,0 +1,229 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import AsyncIterable
+from concurrent.futures import FIRST_COMPLETED
+from concurrent.futures import wait
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Generic
+from typing import TypeVar
+
+from anyio import Lock
+from anyio import Semaphore
+from anyio import create_memory_object_stream
+from anyio import create_task_group
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from concurrent.futures import Executor
+    from concurrent.futures import Future
+    from pathlib import Path
+
+    from anyio.abc import TaskGroup
+    from anyio.streams.memory import MemoryObjectSendStream
+
+T = TypeVar("T")
+
+
+@dataclass(frozen=True)
+class BatchResult(Generic[T]):
+    """
+    The outcome of a single file of a batch.
+
+    Args:
+        index: The position of the file in the input
+        path: The file which was sent
+        result: The response, None if the request failed
+        error: The exception raised by the request, None if it succeeded
+
+    """
+
+    index: int
+    path: Path
+    result: T | None = None
+    error: Exception | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the request succeeded."""
+        return self.error is None
+
+
+class _BatchRunner(Generic[T]):
+    """Runs one batch, feeding results to a memory stream which the consumer iterates."""
+
+    def __init__(
+        self,
+        fn: Callable[[Path], Awaitable[T]],
+        send_stream: MemoryObjectSendStream[BatchResult[T]],
+        *,
+        max_concurrency: int,
+        ordered: bool,
+        window: int,
+    ) -> None:
+        self.fn = fn
+        self.send_stream = send_stream
+        self.ordered = ordered
+        self.slots = Semaphore(max_concurrency)
+        # Bounds how far ahead of the oldest unyielded file new files may start
+        self.reorder_slots = Semaphore(window)
+        self.pending: dict[int, BatchResult[T]] = {}
+        self.emit_lock = Lock()
+        self.next_index = 0
+
+    async def run(self, index: int, path: Path) -> BatchResult[T]:
+        try:
+            return BatchResult(index, path, result=await self.fn(path))
+        except Exception as err:  # noqa: BLE001
+            # Returned to the consumer instead of aborting the other files
+            return BatchResult(index, path, error=err)
+
+    async def unordered_worker(self, index: int, path: Path) -> None:
+        try:
+            # The slot is held until the result is taken, so finished results cannot pile up
+            await self.send_stream.send(await self.run(index, path))
+        finally:
+            self.slots.release()
+
+    async def ordered_worker(self, index: int, path: Path) -> None:
+        try:
+            self.pending[index] = await self.run(index, path)
+        finally:
+            self.slots.release()
+        async with self.emit_lock:
+            while self.next_index in self.pending:
+                await self.send_stream.send(self.pending.pop(self.next_index))
+                self.next_index += 1
+                self.reorder_slots.release()
+
+    async def start(self, workers: TaskGroup, index: int, path: Path) -> None:
+        if self.ordered:
+            await self.reorder_slots.acquire()
+        await self.slots.acquire()
+        workers.start_soon(self.ordered_worker if self.ordered else self.unordered_worker, index, path)
+
+    async def dispatch(self, paths: Iterable[Path] | AsyncIterable[Path]) -> None:
+        async with self.send_stream, create_task_group() as workers:
+            if isinstance(paths, AsyncIterable):
+                index = 0
+                async for path in paths:
+                    await self.start(workers, index, path)
+                    index += 1
+            else:
+                for index, path in enumerate(paths):
+                    await self.start(workers, index, path)
+
+
+@asynccontextmanager
+async def run_batch(
+    fn: Callable[[Path], Awaitable[T]],
+    paths: Iterable[Path] | AsyncIterable[Path],
+    *,
+    max_concurrency: int,
+    ordered: bool,
+    window: int | None,
+) -> AsyncIterator[AsyncIterator[BatchResult[T]]]:
+    """
+    Run fn over every path with bounded concurrency, yielding the results as an async iterator.
+
+    Paths are only taken from the input as capacity frees up, and a finished result is held until the consumer takes
+    it, so memory stays bounded no matter how many paths are given.  Leaving the context early cancels the requests
+    still running.
+
+    Args:
+        fn: Sends a single file, for example `client.metadata.from_file`
+        paths: The files to send
+        max_concurrency: The most requests in flight at once
+        ordered: Whether to yield results in input order instead of as they complete
+        window: When ordered, the most files started but not yet yielded, defaults to twice max_concurrency
+
+    Yields:
+        The results
+
+    """
+    if max_concurrency < 1:
+        msg = "max_concurrency must be at least 1"
+        raise ValueError(msg)
+    if window is None:
+        window = 2 * max_concurrency
+    elif window < 1:
+        msg = "window must be at least 1"
+        raise ValueError(msg)
+
+    send_stream, receive_stream = create_memory_object_stream[BatchResult[T]]()
+    runner = _BatchRunner(fn, send_stream, max_concurrency=max_concurrency, ordered=ordered, window=window)
+
+    async with receive_stream, create_task_group() as tg:
+        tg.start_soon(runner.dispatch, paths)
+        yield receive_stream
+        tg.cancel_scope.cancel()
+
+
+def _run_one(fn: Callable[[Path], T], index: int, path: Path) -> BatchResult[T]:
+    try:
+        return BatchResult(index, path, result=fn(path))
+    except Exception as err:  # noqa: BLE001
+        # Returned to the consumer instead of aborting the other files
+        return BatchResult(index, path, error=err)
+
+
+def map_in_executor(
+    executor: Executor,
+    fn: Callable[[Path], T],
+    paths: Iterable[Path],
+    *,
+    ordered: bool,
+    max_in_flight: int,
+) -> Generator[BatchResult[T], None, None]:
+    """
+    Run fn over every path on an executor, yielding the results.
+
+    At most max_in_flight paths are submitted but not yet yielded, so memory stays bounded no matter how many paths
+    are given.  Closing the iterator early cancels the submitted calls which have not started.
+
+    Args:
+        executor: Runs the calls, a thread or process pool
+        fn: Sends a single file, for example `client.metadata.from_file`.  Must be picklable for a process pool
+        paths: The files to send
+        ordered: Whether to yield results in input order instead of as they complete
+        max_in_flight: The most files submitted but not yet yielded
+
+    Yields:
+        The results
+
+    """
+    if max_in_flight < 1:
+        msg = "max_in_flight must be at least 1"
+        raise ValueError(msg)
+
+    # In submission order, which is input order
+    in_flight: deque[Future[BatchResult[T]]] = deque()
+    remaining = enumerate(paths)
+    try:
+        while True:
+            for index, path in remaining:
+                in_flight.append(executor.submit(_run_one, fn, index, path))
+                if len(in_flight) >= max_in_flight:
+                    break
+            if not in_flight:
+                return
+            if ordered:
+                yield in_flight.popleft().result()
+            else:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    in_flight.remove(future)
+                    yield future.result()
+    finally:
+        for future in in_flight:
+            future.cancel()
@@ -0,0 +1,141 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import marshal
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from enum import Enum
+from functools import partial
+from multiprocessing.util import Finalize
+from operator import attrgetter
+from typing import TYPE_CHECKING
+from typing import Any
+
+from tika_client._batch import BatchResult
+from tika_client._batch import map_in_executor
+from tika_client.client import TikaClient
+from tika_client.data_models import TikaResponse
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from collections.abc import Mapping
+    from collections.abc import Sequence
+    from multiprocessing.context import BaseContext
+    from pathlib import Path
+
+
+class BulkEndpoint(str, Enum):
+    """The resource method each worker process of a bulk extraction calls."""
+
+    Metadata = "metadata.from_file"
+    Text = "tika.as_text.from_file"
+    Html = "tika.as_html.from_file"
+    RecursiveText = "rmeta.as_text.from_file"
+    RecursiveHtml = "rmeta.as_html.from_file"
+    RecursiveMetadata = "rmeta.as_metadata.from_file"
+
+
+# The client of the current worker process, created by _init_worker
+_worker_client: TikaClient | None = None
+
+
+def _init_worker(tika_url: str | Sequence[str], client_options: Mapping[str, Any]) -> None:
+    global _worker_client  # noqa: PLW0603
+    # Never inherited from the parent, a forked copy of a live connection pool is not safe to use
+    _worker_client = TikaClient(tika_url, **client_options)
+    # Runs on worker exit, unlike atexit hooks, which multiprocessing skips
+    Finalize(_worker_client, _worker_client.__exit__, args=(None, None, None), exitpriority=10)
+
+
+def _portable(error: Exception) -> Exception:
+    # Many exceptions, such as httpx.HTTPStatusError, cannot be rebuilt from their pickled form
+    try:
+        pickle.loads(pickle.dumps(error))  # noqa: S301
+    except Exception:  # noqa: BLE001
+        return RuntimeError(f"{type(error).__name__}: {error}")
+    return error
+
+
+def _extract(endpoint: BulkEndpoint, path: Path) -> bytes:
+    if _worker_client is None:  # pragma: no cover
+        msg = "The bulk worker was not initialized"
+        raise RuntimeError(msg)
+    try:
+        response: TikaResponse | list[TikaResponse] = attrgetter(endpoint.value)(_worker_client)(path)
+    except Exception as err:  # noqa: BLE001
+        raise _portable(err) from None
+    # marshal is the fastest way to move the plain decoded JSON between processes
+    if isinstance(response, list):
+        return marshal.dumps([item.data for item in response])
+    return marshal.dumps(response.data)
+
+
+def _decode(result: BatchResult[bytes]) -> BatchResult[TikaResponse | list[TikaResponse]]:
+    if result.result is None:
+        return BatchResult(result.index, result.path, error=result.error)
+    data = marshal.loads(result.result)  # noqa: S302
+    if isinstance(data, list):
+        return BatchResult(result.index, result.path, result=[TikaResponse(item) for item in data])
+    return BatchResult(result.index, result.path, result=TikaResponse(data))
+
+
+def bulk_extract(  # noqa: PLR0913
+    tika_url: str | Sequence[str],
+    paths: Iterable[Path],
+    *,
+    endpoint: BulkEndpoint = BulkEndpoint.Text,
+    processes: int | None = None,
+    ordered: bool = True,
+    max_in_flight: int | None = None,
+    mp_context: BaseContext | None = None,
+    client_options: Mapping[str, Any] | None = None,
+) -> Iterator[BatchResult[TikaResponse | list[TikaResponse]]]:
+    """
+    Extract many files using a pool of worker processes, each with its own TikaClient.
+
+    Decoding large responses is CPU bound and holds the GIL, so threads cannot spread it over several cores.  Each
+    worker decodes its responses and sends the plain data back in a compact binary form.
+
+    The spawn start method is used unless another multiprocessing context is given, so the calling script must guard
+    its entry point with `if __name__ == "__main__":`.
+
+    Args:
+        tika_url: The Tika server URL, or several to balance over
+        paths: The files to send
+        endpoint: The resource method called for each file
+        processes: The number of worker processes, by default the number of CPUs
+        ordered: Whether to yield results in input order instead of as they complete
+        max_in_flight: The most files submitted but not yet yielded, defaults to twice the process count
+        mp_context: The multiprocessing context the workers are started with
+        client_options: Keyword arguments for each worker's TikaClient
+
+    Yields:
+        The results, with per file errors returned instead of raised
+
+    """
+    processes = processes or os.cpu_count() or 1
+    executor = ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=mp_context or multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(tika_url, dict(client_options or {})),
+    )
+    results = map_in_executor(
+        executor,
+        partial(_extract, endpoint),
+        paths,
+        ordered=ordered,
+        max_in_flight=max_in_flight or 2 * processes,
+    )
+    try:
+        for result in results:
+            yield _decode(result)
+    finally:
+        results.close()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,478 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Final
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Mapping
+
+logger = logging.getLogger("tika_client")
+
+VERSION_ENDPOINT: Final[str] = "/version"
+# The version resource only produces plain text, and refuses the client's default JSON Accept header
+VERSION_ACCEPT: Final[dict[str, str]] = {"Accept": "text/plain"}
+# Seconds before a failed version request is tried again, instead of doubling the requests of every call meanwhile
+VERSION_RETRY_INTERVAL: Final[float] = 60.0
+
+_SCHEMA: Final[tuple[str, ...]] = (
+    (
+        "CREATE TABLE IF NOT EXISTS results "
+        "(key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, used REAL NOT NULL)"
+    ),
+    "CREATE INDEX IF NOT EXISTS results_used ON results (used)",
+    (
+        "CREATE TABLE IF NOT EXISTS files "
+        "(path TEXT PRIMARY KEY, size INTEGER NOT NULL, mtime_ns INTEGER NOT NULL, digest TEXT NOT NULL)"
+    ),
+)
+
+# The files whose hashes the memory cache remembers, each costs a few hundred bytes
+_MAX_REMEMBERED_FILES: Final[int] = 65536
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """
+    Counters of a result cache.
+
+    Args:
+        hits: Lookups answered from the cache
+        misses: Lookups which had to ask the server
+        stores: Responses added to the cache
+        evictions: Responses dropped to stay within the size limit, or once expired
+        entries: Responses currently held
+        size: Bytes of responses currently held
+
+    """
+
+    hits: int
+    misses: int
+    stores: int
+    evictions: int
+    entries: int
+    size: int
+
+
+def content_digest(content: bytes) -> str:
+    """
+    Hash content for a cache key.
+
+    Args:
+        content: The content to hash
+
+    Returns:
+        The hex SHA-256 digest
+
+    """
+    return hashlib.sha256(content).hexdigest()
+
+
+def file_digest(filepath: Path, chunk_size: int) -> str:
+    """
+    Hash a file's content for a cache key, a chunk at a time.
+
+    Args:
+        filepath: The file
+        chunk_size: The bytes read at once
+
+    Returns:
+        The hex SHA-256 digest
+
+    """
+    digest = hashlib.sha256()
+    with filepath.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(digest: str, endpoint: str, headers: Mapping[str, str], server_version: str) -> str:
+    """
+    Build the key a response is cached under.
+
+    Args:
+        digest: The hash of the uploaded content
+        endpoint: The endpoint the content is sent to
+        headers: The request headers which change the response
+        server_version: The version of the Tika server which parses the content
+
+    Returns:
+        The key
+
+    """
+    # Header names are case insensitive and their order carries no meaning
+    parts = [digest, endpoint, server_version, *sorted(f"{name.lower()}:{value}" for name, value in headers.items())]
+    return hashlib.sha256("\n".join(parts).encode()).hexdigest()
+
+
+class ResultCache:
+    """
+    A persistent cache of Tika's responses, in a SQLite database.
+
+    Responses are keyed by a hash of the uploaded content, the endpoint, the request headers which change the parse
+    and the Tika server version, so a document is only parsed once.  The request headers include the file name, which
+    Tika reports back.  When the cached responses grow beyond max_size, the least recently used are dropped.
+
+    The hash of each file is remembered with its size and modification time, so a file which has not changed since is
+    not read again to look it up.  The database may be shared by several clients, threads and processes.  A failing
+    database is logged and treated as a cache miss, never failing the request.
+
+    Args:
+        path: The database file, created if missing
+        max_size: The most bytes of responses kept
+
+    """
+
+    def __init__(self, path: Path | str, max_size: int = 1024**3) -> None:
+        self.path = Path(path)
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # A copy in another process, such as a bulk_extract worker, opens its own connection to the same database
+        return (self.__class__, (self.path, self.max_size))
+
+    @property
+    def _db(self) -> sqlite3.Connection:
+        # Opened on first use, from whichever thread that is, always with the lock held
+        if self._connection is None:
+            connection = sqlite3.connect(self.path, timeout=30.0, check_same_thread=False)
+            # Readers do not wait for writers, which matters with several processes
+            connection.execute("PRAGMA journal_mode=WAL")
+            with connection:
+                for statement in _SCHEMA:
+                    connection.execute(statement)
+            self._connection = connection
+        return self._connection
+
+    def get(self, key: str) -> bytes | None:
+        """
+        Look up a response, marking it as recently used.
+
+        Args:
+            key: The key from cache_key
+
+        Returns:
+            The response body, or None if it is not cached
+
+        """
+        with self._lock:
+            try:
+                db = self._db
+                row = db.execute("SELECT value FROM results WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    with db:
+                        db.execute("UPDATE results SET used = ? WHERE key = ?", (time.time(), key))
+            except sqlite3.Error:
+                logger.warning("Result cache lookup failed", exc_info=True)
+                row = None
+            if row is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            return bytes(row[0])
+
+    def put(self, key: str, value: bytes) -> None:
+        """
+        Store a response, dropping the least recently used responses if the cache grows too large.
+
+        Args:
+            key: The key from cache_key
+            value: The response body
+
+        """
+        if len(value) > self.max_size:
+            return
+        with self._lock:
+            try:
+                db = self._db
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO results (key, value, size, used) VALUES (?, ?, ?, ?)",
+                        (key, value, len(value), time.time()),
+                    )
+                    self._evict(db)
+            except sqlite3.Error:
+                logger.warning("Result cache store failed", exc_info=True)
+                return
+            self._stores += 1
+
+    def _evict(self, db: sqlite3.Connection) -> None:
+        (size,) = db.execute("SELECT total(size) FROM results").fetchone()
+        excess = size - self.max_size
+        if excess <= 0:
+            return
+        dropped = []
+        for key, entry_size in db.execute("SELECT key, size FROM results ORDER BY used"):
+            dropped.append((key,))
+            excess -= entry_size
+            if excess <= 0:
+                break
+        db.executemany("DELETE FROM results WHERE key = ?", dropped)
+        self._evictions += len(dropped)
+
+    def file_digest(self, filepath: Path, chunk_size: int) -> str:
+        """
+        Hash a file's content, reusing the hash remembered for it if its size and modification time are unchanged.
+
+        Args:
+            filepath: The file
+            chunk_size: The bytes read at once while hashing
+
+        Returns:
+            The hex SHA-256 digest
+
+        """
+        stat = filepath.stat()
+        path = str(filepath.resolve())
+        with self._lock:
+            try:
+                row = self._db.execute(
+                    "SELECT digest FROM files WHERE path = ? AND size = ? AND mtime_ns = ?",
+                    (path, stat.st_size, stat.st_mtime_ns),
+                ).fetchone()
+            except sqlite3.Error:
+                logger.warning("Result cache file lookup failed", exc_info=True)
+                row = None
+        if row is not None:
+            return str(row[0])
+
+        # Without the lock, other threads keep using the cache while a large file is read
+        hexdigest = file_digest(filepath, chunk_size)
+
+        with self._lock:
+            try:
+                db = self._db
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO files (path, size, mtime_ns, digest) VALUES (?, ?, ?, ?)",
+                        (path, stat.st_size, stat.st_mtime_ns, hexdigest),
+                    )
+            except sqlite3.Error:
+                logger.warning("Result cache file store failed", exc_info=True)
+        return hexdigest
+
+    def stats(self) -> CacheStats:
+        """
+        Report the cache's counters and size.
+
+        Hits, misses, stores and evictions count this process's use of the cache, the size covers the whole database.
+
+        Returns:
+            A snapshot of the counters
+
+        """
+        with self._lock:
+            try:
+                entries, size = self._db.execute("SELECT count(*), total(size) FROM results").fetchone()
+            except sqlite3.Error:
+                logger.warning("Result cache size query failed", exc_info=True)
+                entries, size = 0, 0
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                entries=entries,
+                size=int(size),
+            )
+
+    def clear(self) -> None:
+        """Drop every cached response and remembered file hash."""
+        with self._lock:
+            db = self._db
+            with db:
+                db.execute("DELETE FROM results")
+                db.execute("DELETE FROM files")
+
+    def close(self) -> None:
+        """Close the database connection, it is opened again if the cache is used afterwards."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+@dataclass
+class _MemoryEntry:
+    value: Any
+    size: int
+    expires: float | None
+
+
+class MemoryCache:
+    """
+    An in-process cache of Tika's decoded responses, for documents requested again and again.
+
+    Responses are keyed as in ResultCache, by a hash of the content, the endpoint, the request headers which change
+    the parse and the Tika server version, and answered without touching the disk or decoding JSON again.  The size of
+    a response is the length of its body as the server sent it.  When the cached responses grow beyond max_size, the
+    least recently used are dropped, and a response older than ttl seconds is never answered.
+
+    The hash of each file is remembered with its size and modification time, as ResultCache does.  Answered responses
+    are shared between callers, so should not be modified.  The cache is safe to use from several threads, and from
+    the event loop, which it never blocks for longer than a dictionary update.
+
+    Args:
+        max_size: The most bytes of responses kept
+        ttl: The seconds a response is kept, None to keep it until it is evicted
+
+    """
+
+    def __init__(self, max_size: int = 64 * 1024**2, ttl: float | None = None) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[str, _MemoryEntry] = OrderedDict()
+        self._files: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._stores = 0
+        self._evictions = 0
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        # A copy in another process, such as a bulk_extract worker, starts empty, its memory is its own
+        return (self.__class__, (self.max_size, self.ttl))
+
+    def get(self, key: str) -> Any:  # noqa: ANN401
+        """
+        Look up a response, marking it as recently used.
+
+        Args:
+            key: The key from cache_key
+
+        Returns:
+            The decoded response, or None if it is not cached or has expired
+
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires is not None and entry.expires <= time.monotonic():
+                self._drop(key)
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry.value
+
+    def put(self, key: str, value: Any, size: int) -> None:  # noqa: ANN401
+        """
+        Store a response, dropping the least recently used responses if the cache grows too large.
+
+        Args:
+            key: The key from cache_key
+            value: The decoded response
+            size: The length of the response body
+
+        """
+        if size > self.max_size:
+            return
+        expires = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._size -= self._entries.pop(key).size
+            self._entries[key] = _MemoryEntry(value, size, expires)
+            self._size += size
+            self._stores += 1
+            while self._size > self.max_size:
+                self._drop(next(iter(self._entries)))
+
+    def _drop(self, key: str) -> None:
+        self._size -= self._entries.pop(key).size
+        self._evictions += 1
+
+    @staticmethod
+    def _signature(filepath: Path) -> tuple[str, int, int]:
+        stat = filepath.stat()
+        return str(filepath.resolve()), stat.st_size, stat.st_mtime_ns
+
+    def known_digest(self, filepath: Path) -> str | None:
+        """
+        Return the remembered hash of a file, if its size and modification time are unchanged.
+
+        Args:
+            filepath: The file
+
+        Returns:
+            The hex SHA-256 digest, or None if the file has to be hashed
+
+        """
+        path, size, mtime_ns = self._signature(filepath)
+        with self._lock:
+            remembered = self._files.get(path)
+            if remembered is None or remembered[:2] != (size, mtime_ns):
+                return None
+            self._files.move_to_end(path)
+            return remembered[2]
+
+    def file_digest(self, filepath: Path, hasher: Callable[[Path], str]) -> str:
+        """
+        Hash a file's content, reusing the hash remembered for it if its size and modification time are unchanged.
+
+        Args:
+            filepath: The file
+            hasher: Hashes the file when its hash is not remembered, such as ResultCache.file_digest
+
+        Returns:
+            The hex SHA-256 digest
+
+        """
+        digest = self.known_digest(filepath)
+        if digest is not None:
+            return digest
+        path, size, mtime_ns = self._signature(filepath)
+        # Without the lock, other threads keep using the cache while a large file is read
+        digest = hasher(filepath)
+        with self._lock:
+            self._files[path] = (size, mtime_ns, digest)
+            self._files.move_to_end(path)
+            if len(self._files) > _MAX_REMEMBERED_FILES:
+                self._files.popitem(last=False)
+        return digest
+
+    def stats(self) -> CacheStats:
+        """
+        Report the cache's counters and size.
+
+        Returns:
+            A snapshot of the counters
+
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                stores=self._stores,
+                evictions=self._evictions,
+                entries=len(self._entries),
+                size=self._size,
+            )
+
+    def clear(self) -> None:
+        """Drop every cached response and remembered file hash."""
+        with self._lock:
+            self._entries.clear()
+            self._files.clear()
+            self._size = 0
@@ -0,0 +1,153 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+from typing import Any
+
+from anyio import Event
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+
+
+@dataclass(frozen=True)
+class CoalescingStats:
+    """
+    Counters of coalesced requests.
+
+    Args:
+        sent: The requests made on behalf of every identical call in flight at the time
+        coalesced: The calls which shared the response of another call's request instead of sending their own
+
+    """
+
+    sent: int
+    coalesced: int
+
+
+class _Flight:
+    # One request in flight for the async client, awaited by every identical call
+    __slots__ = ("done", "error", "result", "settled")
+
+    def __init__(self) -> None:
+        self.done = Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.settled = False
+
+
+class Coalescer:
+    """
+    Lets identical calls made at the same time share one request, for one client.
+
+    Calls are identical when their keys are, built from the content hash, the endpoint and the request headers.  Only
+    calls which overlap share a request, a call made after it finished sends its own.  Every caller gets the same
+    decoded response, or the same error.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._futures: dict[str, Future[Any]] = {}
+        self._flights: dict[str, _Flight] = {}
+        self.sent = 0
+        self.coalesced = 0
+
+    def call(self, key: str, fetch: Callable[[], Any]) -> Any:  # noqa: ANN401
+        """
+        Run fetch, unless an identical call is already running it, in which case wait for its result.
+
+        Args:
+            key: Identifies the request
+            fetch: Makes the request and decodes the response
+
+        Returns:
+            The result of fetch, from this call or the identical one
+
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            if future is None:
+                future = self._futures[key] = Future()
+                self.sent += 1
+                leader = True
+            else:
+                self.coalesced += 1
+                leader = False
+        if not leader:
+            return future.result()
+        try:
+            result = fetch()
+        except BaseException as err:
+            self._settle(key)
+            future.set_exception(err)
+            raise
+        self._settle(key)
+        future.set_result(result)
+        return result
+
+    def _settle(self, key: str) -> None:
+        # Calls arriving from now on send their own request
+        with self._lock:
+            del self._futures[key]
+
+    async def acall(self, key: str, fetch: Callable[[], Awaitable[Any]]) -> Any:  # noqa: ANN401
+        """
+        Await fetch, unless an identical call is already awaiting it, in which case wait for its result.
+
+        If the call making the request is cancelled, the waiting calls do not fail with it, one of them makes the
+        request instead.
+
+        Args:
+            key: Identifies the request
+            fetch: Makes the request and decodes the response
+
+        Returns:
+            The result of fetch, from this call or the identical one
+
+        """
+        # The flights are only touched from the event loop, the counters may be read from any thread
+        while (flight := self._flights.get(key)) is not None:
+            with self._lock:
+                self.coalesced += 1
+            await flight.done.wait()
+            if flight.settled:
+                if flight.error is not None:
+                    raise flight.error
+                return flight.result
+            # The request was cancelled, so was never shared
+            with self._lock:
+                self.coalesced -= 1
+
+        flight = self._flights[key] = _Flight()
+        with self._lock:
+            self.sent += 1
+        try:
+            flight.result = await fetch()
+        except Exception as err:
+            flight.error = err
+            flight.settled = True
+            raise
+        else:
+            flight.settled = True
+            return flight.result
+        finally:
+            del self._flights[key]
+            flight.done.set()
+
+    def stats(self) -> CoalescingStats:
+        """
+        Report how many requests were sent and how many calls shared them.
+
+        Returns:
+            A snapshot of the counters
+
+        """
+        with self._lock:
+            return CoalescingStats(sent=self.sent, coalesced=self.coalesced)
@@ -0,0 +1,303 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from enum import Enum
+from importlib import import_module
+from typing import TYPE_CHECKING
+from typing import Any
+from typing import Final
+
+from tika_client.data_models import DublinCoreKey
+from tika_client.data_models import OtherTikaKeys
+from tika_client.data_models import TikaKey
+from tika_client.data_models import TikaResponse
+from tika_client.data_models import XmpKey
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+    from collections.abc import Iterable
+    from collections.abc import Mapping
+    from pathlib import Path
+
+_EPOCH: Final = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND: Final = timedelta(microseconds=1)
+
+
+class ColumnType(str, Enum):
+    """How the values of a column are converted."""
+
+    Text = "text"
+    TextList = "text_list"
+    Integer = "integer"
+    # An Integer column where 0 is missing, as TikaResponse reads its counts and sizes
+    Count = "count"
+    Datetime = "datetime"
+
+
+@dataclass(frozen=True)
+class Column:
+    """
+    A column of a columnar export, read from the same key of each response's data.
+
+    Tika sends a list when a key has several values.  Except in TextList columns, only the first is kept, as Tika's
+    own Metadata.get does.  Values which cannot be converted, such as a date in an unknown format, are missing.
+    """
+
+    name: str
+    key: str
+    type: ColumnType = ColumnType.Text
+
+
+# The fields of TikaResponse, under the same names and read by the same rules
+RESPONSE_COLUMNS: Final[tuple[Column, ...]] = (
+    Column("type", TikaKey.ContentType),
+    Column("parsers", TikaKey.Parsers, ColumnType.TextList),
+    Column("content", TikaKey.Content),
+    Column("content_length", TikaKey.ContentLength, ColumnType.Count),
+    Column("created", DublinCoreKey.Created, ColumnType.Datetime),
+    Column("modified", DublinCoreKey.Modified, ColumnType.Datetime),
+    Column("title", DublinCoreKey.Title),
+    Column("xmp_created", XmpKey.Created, ColumnType.Datetime),
+    Column("page_count", XmpKey.NumPages, ColumnType.Count),
+    Column("character_count", OtherTikaKeys.CharacterCount, ColumnType.Count),
+    Column("revision", OtherTikaKeys.Revision, ColumnType.Count),
+    Column("language", OtherTikaKeys.Language),
+    Column("last_author", OtherTikaKeys.LastAuthor),
+)
+
+
+@dataclass(frozen=True)
+class ArrayColumn:
+    """
+    A converted column, backed by the standard library's array module.
+
+    Integer and Count columns hold signed 64-bit integers and Datetime columns microseconds since the Unix epoch, in
+    UTC.  Text and TextList columns hold their values in a list, the lists of a TextList column shared with the
+    responses' data.
+    valid is 1 for each row with a value, 0 for a missing one, which holds 0 or None.
+    """
+
+    type: ColumnType
+    values: array[int] | list[Any]
+    valid: bytearray
+
+    def __len__(self) -> int:
+        return len(self.valid)
+
+    def to_pylist(self) -> list[Any]:
+        """
+        Convert the column to Python values.
+
+        Returns:
+            The values, None for missing rows and datetimes in UTC
+
+        """
+        if self.type == ColumnType.Datetime:
+            return [
+                _EPOCH + value * _MICROSECOND if ok else None for value, ok in zip(self.values, self.valid, strict=True)
+            ]
+        return [value if ok else None for value, ok in zip(self.values, self.valid, strict=True)]
+
+
+def _first(value: Any) -> Any:  # noqa: ANN401
+    if isinstance(value, list):
+        return value[0] if value else None
+    return value
+
+
+def _integer(value: Any) -> int | None:  # noqa: ANN401
+    # int() would truncate 1.7, and JSON's true is not a number
+    if isinstance(value, bool) or (isinstance(value, float) and not value.is_integer()):
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def _count(value: Any) -> int | None:  # noqa: ANN401
+    return _integer(value) or None
+
+
+def _microseconds(value: Any) -> int | None:  # noqa: ANN401
+    try:
+        parsed = TikaResponse.parse_datetime_string(value)
+    except (TypeError, ValueError):
+        return None
+    if parsed is None:
+        return None
+    if parsed.tzinfo is None:
+        # Taken as UTC, there is nothing better to go on
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return (parsed - _EPOCH) // _MICROSECOND
+
+
+def _int64_column(column_type: ColumnType, raw: list[Any], convert: Callable[[Any], int | None]) -> ArrayColumn:
+    values = array("q")
+    valid = bytearray(len(raw))
+    append = values.append
+    # The same dates and counts repeat down a column, each distinct value is converted once
+    seen: dict[Any, int | None] = {None: None}
+    for row, value in enumerate(map(_first, raw)):
+        try:
+            converted = seen[value]
+        except KeyError:
+            converted = seen[value] = convert(value)
+        except TypeError:
+            # Unhashable, so not a value Tika sends for these keys
+            converted = None
+        if converted is None or not -(2**63) <= converted < 2**63:
+            append(0)
+        else:
+            append(converted)
+            valid[row] = 1
+    return ArrayColumn(column_type, values, valid)
+
+
+def _text_column(raw: list[Any]) -> ArrayColumn:
+    values = list(map(_first, raw))
+    return ArrayColumn(ColumnType.Text, values, bytearray(value is not None for value in values))
+
+
+def _text_list_column(raw: list[Any]) -> ArrayColumn:
+    # Tika's lists are referenced, not copied, sparing an allocation per row
+    values = [value if value is None or isinstance(value, list) else [value] for value in raw]
+    return ArrayColumn(ColumnType.TextList, values, bytearray(value is not None for value in values))
+
+
+def _convert(column_type: ColumnType, raw: list[Any]) -> ArrayColumn:
+    if column_type == ColumnType.Integer:
+        return _int64_column(column_type, raw, _integer)
+    if column_type == ColumnType.Count:
+        return _int64_column(column_type, raw, _count)
+    if column_type == ColumnType.Datetime:
+        return _int64_column(column_type, raw, _microseconds)
+    if column_type == ColumnType.TextList:
+        return _text_list_column(raw)
+    return _text_column(raw)
+
+
+def _pyarrow() -> Any:  # noqa: ANN401
+    try:
+        return import_module("pyarrow")
+    except ImportError as err:
+        msg = "Arrow and Parquet output needs pyarrow, install it with the arrow extra"
+        raise ImportError(msg) from err
+
+
+def _arrow_array(pa: Any, column: ArrayColumn) -> Any:  # noqa: ANN401
+    if column.type == ColumnType.Text:
+        return pa.array(column.values, type=pa.string())
+    if column.type == ColumnType.TextList:
+        return pa.array(column.values, type=pa.list_(pa.string()))
+    # Both buffers are handed over without converting each value.  The validity bytes become Arrow's validity bitmap
+    # through a cast to booleans
+    count = len(column)
+    valid = pa.Array.from_buffers(pa.uint8(), count, [None, pa.py_buffer(column.valid)]).cast(pa.bool_())
+    values = pa.Array.from_buffers(pa.int64(), count, [valid.buffers()[1], pa.py_buffer(column.values)])
+    if column.type == ColumnType.Datetime:
+        return values.cast(pa.timestamp("us", tz="UTC"))
+    return values
+
+
+class ResponseColumns:
+    """
+    Gathers chosen keys of many responses into typed columns, instead of a dictionary per response.
+
+    Adding a response only keeps a reference to each raw value.  The values are converted a column at a time when the
+    columns are requested, into arrays of the standard library or, when pyarrow is installed, an Arrow table.
+    """
+
+    def __init__(self, columns: Iterable[Column | str] = RESPONSE_COLUMNS) -> None:
+        """
+        Start an empty set of columns.
+
+        Args:
+            columns: The columns to gather, by default the fields of TikaResponse.  A plain key is gathered as a Text
+                column of the same name
+
+        """
+        self.columns = tuple(column if isinstance(column, Column) else Column(column, column) for column in columns)
+        names = [column.name for column in self.columns]
+        if len(set(names)) != len(names):
+            msg = f"Column names must be unique, got {names}"
+            raise ValueError(msg)
+        self._raw: list[list[Any]] = [[] for _ in self.columns]
+        self._rows = 0
+
+    def __len__(self) -> int:
+        return self._rows
+
+    def add(self, response: TikaResponse | Mapping[str, Any]) -> None:
+        """
+        Add one response as a row.
+
+        Args:
+            response: The response, or its decoded JSON data
+
+        """
+        self.extend((response,))
+
+    def extend(self, responses: Iterable[TikaResponse | Mapping[str, Any]]) -> None:
+        """
+        Add many responses, a row each.
+
+        Args:
+            responses: The responses, or their decoded JSON data
+
+        """
+        rows = [response.data if isinstance(response, TikaResponse) else response for response in responses]
+        for column, raw in zip(self.columns, self._raw, strict=True):
+            key = column.key
+            raw.extend([data.get(key) for data in rows])
+        self._rows += len(rows)
+
+    def clear(self) -> None:
+        """Drop every row, keeping the columns."""
+        for raw in self._raw:
+            raw.clear()
+        self._rows = 0
+
+    def to_arrays(self) -> dict[str, ArrayColumn]:
+        """
+        Convert the rows added so far, without needing pyarrow.
+
+        Returns:
+            Each column by name, in the order given
+
+        """
+        return {column.name: _convert(column.type, raw) for column, raw in zip(self.columns, self._raw, strict=True)}
+
+    def to_arrow(self) -> Any:  # noqa: ANN401
+        """
+        Convert the rows added so far to an Arrow table.
+
+        Integer and Count columns become int64, Datetime columns microsecond timestamps in UTC, Text columns strings
+        and TextList columns lists of strings.
+
+        Returns:
+            A pyarrow.Table
+
+        """
+        pa = _pyarrow()
+        return pa.table({name: _arrow_array(pa, column) for name, column in self.to_arrays().items()})
+
+    def write_parquet(self, path: Path, **options: Any) -> None:  # noqa: ANN401
+        """
+        Write the rows added so far to a Parquet file.
+
+        Args:
+            path: The file to write
+            options: Keyword arguments for pyarrow.parquet.write_table, such as compression
+
+        """
+        table = self.to_arrow()
+        import_module("pyarrow.parquet").write_table(table, path, **options)
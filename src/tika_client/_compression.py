@@ -0,0 +1,295 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from dataclasses import field
+from typing import TYPE_CHECKING
+
+from tika_client._constants import MIN_COMPRESS_LEN
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# Formats which are compressed already, gzipping them again only costs CPU
+COMPRESSED_TYPES: frozenset[str] = frozenset(
+    {
+        "application/epub+zip",
+        "application/gzip",
+        "application/java-archive",
+        "application/vnd.oasis.opendocument.presentation",
+        "application/vnd.oasis.opendocument.spreadsheet",
+        "application/vnd.oasis.opendocument.text",
+        "application/vnd.openxmlformats-officedocument.presentationml.presentation",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        "application/vnd.rar",
+        "application/x-7z-compressed",
+        "application/x-bzip2",
+        "application/x-gzip",
+        "application/x-rar-compressed",
+        "application/x-xz",
+        "application/zip",
+        "application/zstd",
+        "image/avif",
+        "image/gif",
+        "image/heic",
+        "image/jp2",
+        "image/jpeg",
+        "image/png",
+        "image/webp",
+    },
+)
+COMPRESSED_TYPE_PREFIXES: tuple[str, ...] = ("audio/", "video/")
+
+
+@dataclass(frozen=True)
+class CompressionPolicy:
+    """
+    Settings for deciding which uploads are worth compressing, when the client compresses.
+
+    Known compressed formats are never compressed.  For other types, the first block of the upload is compressed as a
+    sample, and the upload is only compressed if the sample shrinks enough.  Once a MIME type has been sampled a few
+    times, its learned ratio is used instead, re-sampling now and then to follow changes.
+
+    Args:
+        min_size: Uploads up to this many bytes are sent uncompressed
+        skip_types: MIME types which are never compressed
+        skip_prefixes: MIME type prefixes which are never compressed
+        sample_size: The bytes from the start of an upload compressed to estimate its ratio
+        max_ratio: Compress when the compressed size is at most this fraction of the original
+        learn_after: The samples of a MIME type needed before its learned ratio is trusted
+        resample_every: Once trusted, sample one in this many uploads of a MIME type again
+        learning_rate: The weight of a new observation in the learned ratio of a MIME type
+
+    """
+
+    min_size: int = MIN_COMPRESS_LEN
+    skip_types: frozenset[str] = COMPRESSED_TYPES
+    skip_prefixes: tuple[str, ...] = COMPRESSED_TYPE_PREFIXES
+    sample_size: int = 64 * 1024
+    max_ratio: float = 0.9
+    learn_after: int = 5
+    resample_every: int = 50
+    learning_rate: float = 0.2
+
+
+@dataclass(frozen=True)
+class CompressionStats:
+    """
+    Counters of compression decisions and their outcomes.
+
+    Args:
+        compressed: The number of uploads compressed
+        skipped: The number of uploads sent uncompressed because they would not shrink enough
+        bytes_in: The uncompressed bytes of compressed uploads
+        bytes_out: The compressed bytes of compressed uploads
+        bytes_saved: The bytes not sent thanks to compression
+        cpu_seconds: The CPU time spent compressing uploads and samples
+        cpu_seconds_saved: The CPU time estimated to have been saved by skipping uploads, at the measured cost per byte
+            of compressing uploads
+        sample_bytes: The bytes compressed as samples
+        sample_cpu_seconds: The part of cpu_seconds spent compressing samples
+
+    """
+
+    compressed: int
+    skipped: int
+    bytes_in: int
+    bytes_out: int
+    bytes_saved: int
+    cpu_seconds: float
+    cpu_seconds_saved: float
+    sample_bytes: int
+    sample_cpu_seconds: float
+
+
+@dataclass
+class _TypeHistory:
+    ratio: float = 1.0
+    samples: int = 0
+    uploads: int = 0
+
+
+@dataclass
+class CompressionTally:
+    """
+    Measures a single compressed upload, reporting to its advisor once the upload is complete.
+
+    Args:
+        advisor: The advisor which decided to compress
+        mime_type: The MIME type learned from the outcome
+
+    """
+
+    advisor: CompressionAdvisor
+    mime_type: str
+    bytes_in: int = 0
+    bytes_out: int = 0
+    cpu_seconds: float = 0.0
+    _done: bool = field(default=False, repr=False)
+
+    def compress(self, compressor: zlib._Compress, chunk: bytes | memoryview) -> bytes:
+        """Compress a chunk, measuring its size and the CPU time taken."""
+        start = time.thread_time()
+        compressed = compressor.compress(chunk)
+        self.cpu_seconds += time.thread_time() - start
+        self.bytes_in += len(chunk)
+        self.bytes_out += len(compressed)
+        return compressed
+
+    def flush(self, compressor: zlib._Compress) -> bytes:
+        """Finish the compressed stream and report the outcome."""
+        start = time.thread_time()
+        compressed = compressor.flush()
+        self.cpu_seconds += time.thread_time() - start
+        self.bytes_out += len(compressed)
+        if not self._done:
+            self._done = True
+            self.advisor.record(self)
+        return compressed
+
+
+class CompressionAdvisor:
+    """
+    Decides which uploads to compress and learns from the outcomes, for one client.
+
+    Thread safe, a single advisor is shared by every resource of a client.
+
+    Args:
+        policy: The compression settings
+        level: The gzip level uploads and samples are compressed with
+
+    """
+
+    def __init__(self, policy: CompressionPolicy, level: int) -> None:
+        self.policy = policy
+        self.level = level
+        self._lock = threading.Lock()
+        self._types: dict[str, _TypeHistory] = {}
+        self._compressed = 0
+        self._skipped = 0
+        self._skipped_bytes = 0
+        self._bytes_in = 0
+        self._bytes_out = 0
+        self._cpu_seconds = 0.0
+        self._sample_bytes = 0
+        self._sample_cpu_seconds = 0.0
+
+    @staticmethod
+    def _normalize(mime_type: str | None) -> str:
+        return (mime_type or "").split(";", 1)[0].strip().lower()
+
+    def _learn(self, history: _TypeHistory, ratio: float) -> None:
+        if history.samples == 0:
+            history.ratio = ratio
+        else:
+            history.ratio += self.policy.learning_rate * (ratio - history.ratio)
+        history.samples += 1
+
+    def _sample_ratio(self, sample: bytes | memoryview) -> float:
+        if not sample:
+            return 1.0
+        start = time.thread_time()
+        compressed = zlib.compress(sample, self.level)
+        cpu = time.thread_time() - start
+        with self._lock:
+            self._sample_bytes += len(sample)
+            self._sample_cpu_seconds += cpu
+        return len(compressed) / len(sample)
+
+    def _skip(self, size: int) -> bool:
+        with self._lock:
+            self._skipped += 1
+            self._skipped_bytes += size
+        return False
+
+    def decide(self, size: int, mime_type: str | None, sample: Callable[[], bytes | memoryview] | None = None) -> bool:
+        """
+        Decide whether an upload is compressed.
+
+        Args:
+            size: The uncompressed size of the upload
+            mime_type: The MIME type of the upload, if known
+            sample: Returns the first bytes of the upload, only called when a sample is needed.  Without it, an
+                unknown MIME type is compressed
+
+        Returns:
+            Whether to compress the upload
+
+        """
+        if size <= self.policy.min_size:
+            return False
+        key = self._normalize(mime_type)
+        if key in self.policy.skip_types or key.startswith(self.policy.skip_prefixes):
+            return self._skip(size)
+
+        with self._lock:
+            history = self._types.setdefault(key, _TypeHistory())
+            history.uploads += 1
+            # Content of an unknown type has nothing in common from one upload to the next, so it is always sampled
+            trusted = (
+                bool(key)
+                and history.samples >= self.policy.learn_after
+                and history.uploads % self.policy.resample_every != 0
+            )
+            learned = history.samples > 0
+            learned_ratio = history.ratio
+
+        if trusted or (sample is None and learned):
+            ratio = learned_ratio
+        elif sample is None:
+            return True
+        else:
+            ratio = self._sample_ratio(sample())
+            with self._lock:
+                self._learn(history, ratio)
+
+        if ratio > self.policy.max_ratio:
+            return self._skip(size)
+        return True
+
+    def tally(self, mime_type: str | None) -> CompressionTally:
+        """
+        Start measuring a compressed upload.
+
+        Args:
+            mime_type: The MIME type of the upload, if known
+
+        Returns:
+            The tally to compress the upload's chunks through
+
+        """
+        return CompressionTally(self, self._normalize(mime_type))
+
+    def record(self, tally: CompressionTally) -> None:
+        """Learn from the outcome of a compressed upload."""
+        with self._lock:
+            self._compressed += 1
+            self._bytes_in += tally.bytes_in
+            self._bytes_out += tally.bytes_out
+            self._cpu_seconds += tally.cpu_seconds
+            if tally.bytes_in:
+                self._learn(self._types.setdefault(tally.mime_type, _TypeHistory()), tally.bytes_out / tally.bytes_in)
+
+    def stats(self) -> CompressionStats:
+        """Snapshot the compression counters."""
+        with self._lock:
+            # Samples are kept out of the cost per byte, their bytes are not in bytes_in
+            cpu_per_byte = self._cpu_seconds / self._bytes_in if self._bytes_in else 0.0
+            return CompressionStats(
+                compressed=self._compressed,
+                skipped=self._skipped,
+                bytes_in=self._bytes_in,
+                bytes_out=self._bytes_out,
+                bytes_saved=self._bytes_in - self._bytes_out,
+                cpu_seconds=self._cpu_seconds + self._sample_cpu_seconds,
+                cpu_seconds_saved=self._skipped_bytes * cpu_per_byte,
+                sample_bytes=self._sample_bytes,
+                sample_cpu_seconds=self._sample_cpu_seconds,
+            )
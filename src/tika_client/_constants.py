@@ -6,3 +6,7 @@ from typing import Final
 
 # Only compress content which is larger than this
 MIN_COMPRESS_LEN: Final[int] = 1024
+# The zlib default, a good balance of speed and size
+DEFAULT_COMPRESS_LEVEL: Final[int] = 6
+# Bytes read from a document at once when streaming it to the server
+UPLOAD_CHUNK_SIZE: Final[int] = 64 * 1024
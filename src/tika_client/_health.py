@@ -0,0 +1,145 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from httpx import Client
+from httpx import HTTPError
+from httpx import TransportError
+
+if TYPE_CHECKING:
+    from tika_client._balancer import Node
+    from tika_client._balancer import NodePool
+
+logger = logging.getLogger("tika_client")
+
+
+class CircuitState(str, Enum):
+    """The circuit breaker state of a Tika server."""
+
+    # Requests flow normally
+    Closed = "closed"
+    # The server is considered down and receives no requests
+    Open = "open"
+    # A single trial request is allowed through to decide whether to close again
+    HalfOpen = "half-open"
+
+
+class NoHealthyServerError(TransportError):
+    """Every Tika server has an open circuit, so there is nowhere to send the request."""
+
+
+@dataclass(frozen=True)
+class HealthPolicy:
+    """
+    Settings for detecting unhealthy Tika servers and routing around them.
+
+    A server's circuit opens when too many recent requests failed, when its latency is far above the other servers'
+    or when health probes fail.  After open_duration a single trial request is let through, closing the circuit on
+    success and doubling the open time, up to max_open_duration, on failure.
+
+    Args:
+        check_interval: Seconds between background health probes of every server, None to only detect passively
+        check_timeout: Seconds a health probe may take before the server is considered unresponsive
+        check_path: The path probed on each server
+        probe_failures: Consecutive failed probes before the circuit opens
+        window: The number of recent requests considered for the error rate
+        min_requests: The number of requests in the window before the error rate is acted on
+        failure_rate: The fraction of failed requests in the window which opens the circuit
+        latency_factor: Open the circuit when a server's average latency exceeds the median of the other servers by
+            this factor, None to disable
+        open_duration: Seconds a circuit first stays open
+        max_open_duration: The longest a circuit stays open after repeated failed trials
+
+    """
+
+    check_interval: float | None = 10.0
+    check_timeout: float = 2.0
+    check_path: str = "/"
+    probe_failures: int = 2
+    window: int = 20
+    min_requests: int = 5
+    failure_rate: float = 0.5
+    latency_factor: float | None = 5.0
+    open_duration: float = 30.0
+    max_open_duration: float = 300.0
+
+
+class HealthChecker:
+    """
+    Probes every server of a pool on a background thread, feeding the results to the pool's circuit breakers.
+
+    The probes use their own small client, so they work the same for the sync and async clients and are never
+    queued behind extraction requests in the main connection pool.
+
+    Args:
+        pool: The pool whose servers are probed
+        policy: The health settings
+        headers: Headers to send with every probe
+        trust_env: Whether the probes use the proxies of the environment, as the client does
+
+    """
+
+    def __init__(
+        self,
+        pool: NodePool,
+        policy: HealthPolicy,
+        headers: dict[str, str],
+        *,
+        trust_env: bool = True,
+    ) -> None:
+        self.pool = pool
+        self.policy = policy
+        self._client = Client(timeout=policy.check_timeout, headers=headers, trust_env=trust_env)
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def probe(self, node: Node) -> bool:
+        """
+        Probe a single server.
+
+        Args:
+            node: The server to probe
+
+        Returns:
+            True if the server responded without a server side error
+
+        """
+        try:
+            response = self._client.get(node.url.join(self.policy.check_path))
+        except HTTPError:
+            logger.debug("Health probe of %s failed", node.url, exc_info=True)
+            return False
+        return not response.is_server_error
+
+    def check_once(self) -> None:
+        """Probe every server once, updating its circuit."""
+        for node in self.pool.nodes:
+            self.pool.record_probe(node, healthy=self.probe(node))
+
+    def _run(self) -> None:
+        interval = self.policy.check_interval
+        while interval is not None and not self._stop.wait(interval):
+            self.check_once()
+
+    def start(self) -> None:
+        """Start probing in a daemon thread, if an interval is configured."""
+        if self.policy.check_interval is None or self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name="tika-client-health", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop the probing thread and close the probe client."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        self._client.close()
@@ -0,0 +1,115 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+
+from tika_client._retry import RetryBudget
+
+
+@dataclass(frozen=True)
+class HedgingPolicy:
+    """
+    Settings for hedging slow requests by sending a duplicate to another Tika server.
+
+    When a request has not finished within the given percentile of recent request latencies, a duplicate is sent to
+    a different server.  The first response is used and the other request is cancelled.  Meant for clients with
+    several servers, with a single server the duplicate goes to the same server.
+
+    Args:
+        percentile: The latency percentile, between 0 and 100, after which a request is hedged
+        min_samples: The number of completed requests needed before any request is hedged
+        window: The number of recent request latencies the percentile is taken over
+        max_extra_load: Hedges allowed as a fraction of the requests made within the budget window
+        budget_window: Seconds of history the hedging budget considers
+
+    """
+
+    percentile: float = 95.0
+    min_samples: int = 20
+    window: int = 1000
+    max_extra_load: float = 0.05
+    budget_window: float = 10.0
+
+
+@dataclass(frozen=True)
+class HedgingStats:
+    """
+    Counters of hedged requests.
+
+    Args:
+        fired: The number of duplicate requests sent
+        won: The number of duplicates which finished before the original request
+        denied: The number of requests which were slow enough to hedge, but the extra load budget was spent
+
+    """
+
+    fired: int
+    won: int
+    denied: int
+
+
+class Hedger:
+    """
+    Tracks recent latencies and the extra load budget for hedging, for one client.
+
+    Args:
+        policy: The hedging settings
+
+    """
+
+    def __init__(self, policy: HedgingPolicy) -> None:
+        self.policy = policy
+        self.budget = RetryBudget(policy.max_extra_load, 0.0, policy.budget_window)
+        self._latencies: deque[float] = deque(maxlen=policy.window)
+        self._lock = threading.Lock()
+        self.fired = 0
+        self.won = 0
+
+    def delay(self) -> float | None:
+        """
+        Return how long to wait for a request before hedging it.
+
+        Returns:
+            Seconds to wait for the original request, or None while there are too few samples to judge
+
+        """
+        with self._lock:
+            if len(self._latencies) < self.policy.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(len(ordered) - 1, int(len(ordered) * self.policy.percentile / 100))
+        return ordered[index]
+
+    def record(self, latency: float) -> None:
+        """Record the latency of a completed request."""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def try_fire(self) -> bool:
+        """
+        Spend from the budget to send a hedge.
+
+        Returns:
+            Whether the hedge may be sent
+
+        """
+        if not self.budget.withdraw():
+            return False
+        with self._lock:
+            self.fired += 1
+        return True
+
+    def record_win(self) -> None:
+        """Count a hedge which finished first."""
+        with self._lock:
+            self.won += 1
+
+    def stats(self) -> HedgingStats:
+        """Snapshot the hedging counters."""
+        with self._lock:
+            return HedgingStats(fired=self.fired, won=self.won, denied=self.budget.denied)
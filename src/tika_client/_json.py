@@ -0,0 +1,61 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Callable
+from importlib import import_module
+from typing import Any
+from typing import TypeAlias
+
+logger = logging.getLogger("tika_client")
+
+# Decodes a JSON document from its UTF-8 bytes
+JsonDecoder: TypeAlias = Callable[[bytes], Any]
+
+
+def _with_fallback(decoder: JsonDecoder, error: type[Exception]) -> JsonDecoder:
+    def decode(content: bytes) -> Any:  # noqa: ANN401
+        try:
+            return decoder(content)
+        except error:
+            # Stricter than the standard library, which accepts NaN, out of range numbers and lone surrogates
+            return json.loads(content)
+
+    return decode
+
+
+def _orjson() -> JsonDecoder:
+    orjson = import_module("orjson")
+    return _with_fallback(orjson.loads, orjson.JSONDecodeError)
+
+
+def _msgspec() -> JsonDecoder:
+    msgspec = import_module("msgspec")
+    # A reusable decoder avoids setting up its state for every document
+    return _with_fallback(import_module("msgspec.json").Decoder().decode, msgspec.DecodeError)
+
+
+def best_json_decoder() -> JsonDecoder:
+    """
+    Pick the fastest JSON decoder installed, for the json_decoder option of the clients.
+
+    orjson is preferred, then msgspec, falling back to the standard library's json module.  Documents the faster
+    decoder rejects, such as those holding NaN, are decoded again with the standard library.  Unlike it, orjson
+    decodes integers wider than 64 bits as floats.
+
+    Returns:
+        The decoder
+
+    """
+    for factory in (_orjson, _msgspec):
+        try:
+            decoder = factory()
+        except ImportError:
+            continue
+        logger.debug("Decoding JSON with %s", factory.__name__.lstrip("_"))
+        return decoder
+    return json.loads
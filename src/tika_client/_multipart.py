@@ -0,0 +1,85 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING
+
+from tika_client._upload import aiter_file_chunks
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from pathlib import Path
+
+# The same escaping of form parameters httpx and browsers apply
+_FORM_ESCAPES = {'"': "%22", "\\": "\\\\", **{chr(c): f"%{c:02X}" for c in range(0x20) if chr(c) != "\x1b"}}
+_FORM_ESCAPES_RE = re.compile("|".join(re.escape(c) for c in _FORM_ESCAPES))
+
+
+def _form_param(name: str, value: str) -> str:
+    return f'{name}="{_FORM_ESCAPES_RE.sub(lambda match: _FORM_ESCAPES[match.group(0)], value)}"'
+
+
+class AsyncFileMultipart:
+    """
+    A multipart form with a single file field, read without blocking the event loop.
+
+    httpx only accepts blocking file objects for multipart uploads, so every chunk read would stall the event loop.
+    This encodes the same body, but reads the file through anyio in a worker thread.  Each iteration reads the file
+    again, so the body can be resent by a retry or a hedge.
+
+    Args:
+        field: The form field name
+        filepath: The file to send
+        content_type: The content type of the file part
+        chunk_size: The most bytes read from the file at once
+        boundary: The multipart boundary, random by default
+
+    """
+
+    def __init__(
+        self,
+        field: str,
+        filepath: Path,
+        content_type: str,
+        chunk_size: int,
+        boundary: bytes | None = None,
+    ) -> None:
+        self.filepath = filepath
+        self.chunk_size = chunk_size
+        self.boundary = boundary or os.urandom(16).hex().encode("ascii")
+        self.preamble = b"".join(
+            [
+                b"--%s\r\n" % self.boundary,
+                f"Content-Disposition: form-data; {_form_param('name', field)}; ".encode(),
+                _form_param("filename", filepath.name).encode(),
+                f"\r\nContent-Type: {content_type}\r\n\r\n".encode(),
+            ],
+        )
+        self.epilogue = b"\r\n--%s--\r\n" % self.boundary
+
+    def headers(self, file_size: int) -> dict[str, str]:
+        """
+        Build the headers of the request carrying this form.
+
+        Args:
+            file_size: The size of the file in bytes
+
+        Returns:
+            The content type and length headers
+
+        """
+        return {
+            "Content-Type": f"multipart/form-data; boundary={self.boundary.decode('ascii')}",
+            "Content-Length": str(len(self.preamble) + file_size + len(self.epilogue)),
+        }
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        """Encode the form, reading the file in chunks."""
+        yield self.preamble
+        async for chunk in aiter_file_chunks(self.filepath, self.chunk_size):
+            yield chunk
+        yield self.epilogue
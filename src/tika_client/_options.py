@@ -0,0 +1,95 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from dataclasses import fields
+from dataclasses import replace
+from enum import Enum
+
+
+class OcrStrategy(str, Enum):
+    """How Tika's PDF parser uses OCR."""
+
+    NoOcr = "no_ocr"
+    OcrOnly = "ocr_only"
+    OcrAndText = "ocr_and_text_extraction"
+    Auto = "auto"
+
+
+@dataclass(frozen=True)
+class ParseOptions:
+    """
+    Per request settings for the Tika server's parse, sent as request headers.
+
+    They bound the work one document may cost the server, such as a PDF of many thousand pages or a deeply nested
+    archive.  Unset fields send no header, leaving the server's own configuration in place.  Which settings an
+    endpoint honors depends on the Tika server version.
+
+    Args:
+        write_limit: The most characters of text extracted, for the recursive metadata endpoints on their own
+        throw_on_write_limit: Whether reaching the write limit fails the request, instead of returning the text so far
+        max_embedded_resources: The most embedded documents parsed, for the recursive metadata endpoints
+        skip_ocr: Whether to skip OCR of images entirely
+        ocr_language: The Tesseract languages used for OCR, such as "eng+deu"
+        ocr_timeout: Seconds Tesseract may spend on one image
+        pdf_ocr_strategy: Whether the PDF parser extracts text, runs OCR on the pages, or both
+        pdf_extract_inline_images: Whether the PDF parser extracts inline images, so they may be OCRed
+        timeout: Seconds the server may spend parsing the document before giving up
+
+    """
+
+    write_limit: int | None = None
+    throw_on_write_limit: bool | None = None
+    max_embedded_resources: int | None = None
+    skip_ocr: bool | None = None
+    ocr_language: str | None = None
+    ocr_timeout: int | None = None
+    pdf_ocr_strategy: OcrStrategy | None = None
+    pdf_extract_inline_images: bool | None = None
+    timeout: float | None = None
+
+    def headers(self) -> dict[str, str]:
+        """
+        Build the request headers for the set fields.
+
+        Returns:
+            The headers, empty if no field is set
+
+        """
+        headers: dict[str, str] = {}
+        if self.write_limit is not None:
+            headers["writeLimit"] = str(self.write_limit)
+        if self.throw_on_write_limit is not None:
+            headers["throwOnWriteLimitReached"] = str(self.throw_on_write_limit).lower()
+        if self.max_embedded_resources is not None:
+            headers["maxEmbeddedResources"] = str(self.max_embedded_resources)
+        if self.skip_ocr is not None:
+            headers["X-Tika-OCRskipOcr"] = str(self.skip_ocr).lower()
+        if self.ocr_language is not None:
+            headers["X-Tika-OCRLanguage"] = self.ocr_language
+        if self.ocr_timeout is not None:
+            headers["X-Tika-OCRtimeoutSeconds"] = str(self.ocr_timeout)
+        if self.pdf_ocr_strategy is not None:
+            headers["X-Tika-PDFOcrStrategy"] = OcrStrategy(self.pdf_ocr_strategy).value
+        if self.pdf_extract_inline_images is not None:
+            headers["X-Tika-PDFextractInlineImages"] = str(self.pdf_extract_inline_images).lower()
+        if self.timeout is not None:
+            headers["X-Tika-Timeout-Millis"] = str(round(self.timeout * 1000))
+        return headers
+
+    def merged(self, overrides: ParseOptions) -> ParseOptions:
+        """
+        Combine these options with more specific ones.
+
+        Args:
+            overrides: Options whose set fields take precedence, such as those of one request
+
+        Returns:
+            The combined options
+
+        """
+        values = {field.name: getattr(overrides, field.name) for field in fields(overrides)}
+        return replace(self, **{name: value for name, value in values.items() if value is not None})
@@ -0,0 +1,65 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from httpx import AsyncHTTPTransport
+    from httpx import HTTPTransport
+    from httpx import Limits
+
+
+@dataclass(frozen=True)
+class PoolStats:
+    """
+    A point in time snapshot of the HTTP connection pool occupancy.
+
+    Args:
+        max_connections: The configured maximum number of connections, None if unbounded
+        max_keepalive_connections: The configured maximum number of idle connections kept alive
+        connections: The number of currently open connections
+        active: The number of connections currently serving a request
+        idle: The number of open connections waiting to be reused
+        waiting: The number of requests queued for a free connection
+
+    """
+
+    max_connections: int | None
+    max_keepalive_connections: int | None
+    connections: int
+    active: int
+    idle: int
+    waiting: int
+
+
+def pool_stats(transport: HTTPTransport | AsyncHTTPTransport, limits: Limits) -> PoolStats:
+    """
+    Snapshot the occupancy of the connection pool behind the given transport.
+
+    httpx does not expose its pool publicly, so this reads the underlying httpcore pool.  The numbers are only
+    advisory, the pool may change while they are being gathered.
+
+    Args:
+        transport: The transport owning the pool
+        limits: The limits the transport was created with
+
+    Returns:
+        The pool statistics
+
+    """
+    pool = transport._pool  # noqa: SLF001
+    connections = pool.connections
+    idle = sum(1 for connection in connections if connection.is_idle())
+    waiting = sum(1 for request in list(getattr(pool, "_requests", [])) if request.is_queued())
+    return PoolStats(
+        max_connections=limits.max_connections,
+        max_keepalive_connections=limits.max_keepalive_connections,
+        connections=len(connections),
+        active=len(connections) - idle,
+        idle=idle,
+        waiting=waiting,
+    )
@@ -3,8 +3,12 @@
 # SPDX-License-Identifier: MPL-2.0
 from __future__ import annotations
 
+from http import HTTPStatus
 from typing import TYPE_CHECKING
 from typing import Final
+from urllib.parse import quote
+
+from httpx import HTTPStatusError
 
 from tika_client._base import AsyncResource
 from tika_client._base import SyncResource
@@ -12,12 +16,28 @@ from tika_client._base import SyncResource
 if TYPE_CHECKING:
     from pathlib import Path
 
+    from tika_client._options import ParseOptions
     from tika_client.data_models import TikaResponse
 
 ENDPOINT: Final[str] = "/meta"
 MULTI_PART_ENDPOINT: Final[str] = f"{ENDPOINT}/form"
 
 
+def field_endpoint(key: str) -> str:
+    """
+    Return the endpoint for a single metadata key.
+
+    Args:
+        key: The metadata key, such as a TikaKey, DublinCoreKey or XmpKey
+
+    Returns:
+        The endpoint path, with the key escaped
+
+    """
+    # Namespaced keys keep their colon, as in Tika's own documentation
+    return f"{ENDPOINT}/{quote(key, safe=':')}"
+
+
 class SyncMetadata(SyncResource):
     """
     Handles interaction with the /meta endpoint of a Tika server REST API.
@@ -26,21 +46,67 @@ class SyncMetadata(SyncResource):
     https://cwiki.apache.org/confluence/display/TIKA/TikaServer#TikaServer-MetadataResource
     """
 
-    def from_file(self, filepath: Path, mime_type: str | None = None) -> TikaResponse:
+    def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         PUT the provided document to the metadata endpoint using multipart file encoding.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        resp = self.put_multipart(MULTI_PART_ENDPOINT, filepath, mime_type)
+        resp = self.put_file(ENDPOINT, MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
         return self.decoded_response(resp)
 
+    def field(
+        self,
+        filepath: Path,
+        key: str,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> str | list[str] | None:
+        """
+        PUT the provided document to the metadata endpoint, returning only one key.
+
+        The server sends back just that key, so nothing else is transferred or decoded.  The file is always sent as the
+        raw request body, there is no multipart form for a single key.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            key: The metadata key, such as TikaKey.ContentType or XmpKey.NumPages
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            The value, a list when the key has several values, or None if the document has no such key
+
+        """
+        try:
+            response = self.send_raw(
+                field_endpoint(key),
+                filepath,
+                mime_type,
+                extra_headers=self.parse_headers(options),
+            )
+        except HTTPStatusError as err:
+            # How the server says the document has no such key
+            if err.response.status_code != HTTPStatus.NOT_FOUND:
+                raise
+            return None
+        value: str | list[str] | None = self.decode_json(response).get(key)
+        return value
+
 
 class AsyncMetadata(AsyncResource):
     """
@@ -50,17 +116,63 @@ class AsyncMetadata(AsyncResource):
     https://cwiki.apache.org/confluence/display/TIKA/TikaServer#TikaServer-MetadataResource
     """
 
-    async def from_file(self, filepath: Path, mime_type: str | None = None) -> TikaResponse:
+    async def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         PUT the provided document to the metadata endpoint using multipart file encoding.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        resp = await self.put_multipart(MULTI_PART_ENDPOINT, filepath, mime_type)
+        resp = await self.put_file(ENDPOINT, MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
         return self.decoded_response(resp)
+
+    async def field(
+        self,
+        filepath: Path,
+        key: str,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> str | list[str] | None:
+        """
+        PUT the provided document to the metadata endpoint, returning only one key.
+
+        The server sends back just that key, so nothing else is transferred or decoded.  The file is always sent as the
+        raw request body, there is no multipart form for a single key.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            key: The metadata key, such as TikaKey.ContentType or XmpKey.NumPages
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            The value, a list when the key has several values, or None if the document has no such key
+
+        """
+        try:
+            response = await self.send_raw(
+                field_endpoint(key),
+                filepath,
+                mime_type,
+                extra_headers=self.parse_headers(options),
+            )
+        except HTTPStatusError as err:
+            # How the server says the document has no such key
+            if err.response.status_code != HTTPStatus.NOT_FOUND:
+                raise
+            return None
+        value: str | list[str] | None = self.decode_json(response).get(key)
+        return value
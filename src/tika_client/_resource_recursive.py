@@ -4,78 +4,251 @@
 
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
 from typing import TYPE_CHECKING
 from typing import Final
 
 from tika_client._base import AsyncResource
 from tika_client._base import SyncResource
+from tika_client._streaming import aiter_json_array
+from tika_client._streaming import iter_json_array
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Iterator
+    from contextlib import AbstractAsyncContextManager
     from pathlib import Path
 
     from httpx import AsyncClient
     from httpx import Client
 
+    from tika_client._base import ResourceConfig
+    from tika_client._options import ParseOptions
     from tika_client.data_models import TikaResponse
 
-HTML_ENDPOINT: Final[str] = "/rmeta"
+HTML_ENDPOINT: Final[str] = "/rmeta/html"
 HTML_MULTI_PART_ENDPOINT: Final[str] = "/rmeta/form/html"
 PLAIN_TEXT_ENDPOINT: Final[str] = "/rmeta/text"
 PLAIN_TEXT_MULTI_PART_ENDPOINT: Final[str] = "/rmeta/form/text"
+METADATA_ENDPOINT: Final[str] = "/rmeta/ignore"
+METADATA_MULTI_PART_ENDPOINT: Final[str] = "/rmeta/form/ignore"
 
 
 class SyncTikaRmetaBase(SyncResource):
     def common_call(
         self,
         endpoint: str,
+        multipart_endpoint: str,
         filepath: Path,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> list[TikaResponse]:
         """
-        Given a specific endpoint and a file, do a multipart put to the endpoint.
+        Given a specific endpoint and a file, upload the file to the endpoint.
 
         Args:
-            endpoint: The endpoint to send the file to
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
             filepath: The path to the file to send
             mime_type: The mime type of the file to send
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             A list of JSON responses from the Tika server
 
         """
-        return [self.decoded_response(item) for item in self.put_multipart(endpoint, filepath, mime_type)]
+        return [
+            self.decoded_response(item)
+            for item in self.put_file(endpoint, multipart_endpoint, filepath, mime_type, options=options)
+        ]
+
+    def stream_call(
+        self,
+        endpoint: str,
+        multipart_endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Iterator[TikaResponse]:
+        """
+        Given a specific endpoint and a file, upload the file to the endpoint and parse the response as it arrives.
+
+        Args:
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send
+            options: Parse settings for this request, over the client's defaults
+
+        Yields:
+            Each document's response from the Tika server, as soon as it is received
+
+        """
+        response = self.send_file(
+            endpoint,
+            multipart_endpoint,
+            filepath,
+            mime_type,
+            stream=True,
+            extra_headers=self.parse_headers(options),
+        )
+        try:
+            for item in iter_json_array(response.iter_bytes(), self.config.json_decoder):
+                yield self.decoded_response(item)
+        finally:
+            response.close()
 
 
 class SyncRecursiveMetaHtml(SyncTikaRmetaBase):
-    def from_file(self, filepath: Path, mime_type: str | None = None) -> list[TikaResponse]:
+    def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> list[TikaResponse]:
         """
         Return the formatted (as HTML) document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             A list of JSON responses from the Tika server
 
         """
-        return self.common_call(HTML_MULTI_PART_ENDPOINT, filepath, mime_type)
+        return self.common_call(HTML_ENDPOINT, HTML_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
+
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Iterator[TikaResponse]:
+        """
+        Return the formatted (as HTML) document data, one embedded document at a time.
+
+        Only one document is held at once, however many the file contains.  The request is sent when iteration starts.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            An iterator of JSON responses from the Tika server, in the order the server sends them
+
+        """
+        return self.stream_call(HTML_ENDPOINT, HTML_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
 
 
 class SyncRecursiveMetaPlain(SyncTikaRmetaBase):
-    def from_file(self, filepath: Path, mime_type: str | None = None) -> list[TikaResponse]:
+    def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> list[TikaResponse]:
         """
         Return the plain text document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            A list of JSON responses from the Tika server
+
+        """
+        return self.common_call(
+            PLAIN_TEXT_ENDPOINT,
+            PLAIN_TEXT_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            options=options,
+        )
+
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Iterator[TikaResponse]:
+        """
+        Return the plain text document data, one embedded document at a time.
+
+        Only one document is held at once, however many the file contains.  The request is sent when iteration starts.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            An iterator of JSON responses from the Tika server, in the order the server sends them
+
+        """
+        return self.stream_call(
+            PLAIN_TEXT_ENDPOINT,
+            PLAIN_TEXT_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            options=options,
+        )
+
+
+class SyncRecursiveMetaOnly(SyncTikaRmetaBase):
+    def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> list[TikaResponse]:
+        """
+        Return the metadata of the document and each embedded document, without their content.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             A list of JSON responses from the Tika server
 
         """
-        return self.common_call(PLAIN_TEXT_MULTI_PART_ENDPOINT, filepath, mime_type)
+        return self.common_call(METADATA_ENDPOINT, METADATA_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
+
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Iterator[TikaResponse]:
+        """
+        Return the metadata of the document and each embedded document, without their content, one at a time.
+
+        Only one document is held at once, however many the file contains.  The request is sent when iteration starts.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            An iterator of JSON responses from the Tika server, in the order the server sends them
+
+        """
+        return self.stream_call(METADATA_ENDPOINT, METADATA_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
 
 
 class SyncRecursive(SyncResource):
@@ -86,65 +259,241 @@ class SyncRecursive(SyncResource):
     https://cwiki.apache.org/confluence/display/TIKA/TikaServer#TikaServer-RecursiveMetadataandContent
     """
 
-    def __init__(self, client: Client, *, compress: bool) -> None:
-        super().__init__(client, compress=compress)
+    def __init__(self, client: Client, config: ResourceConfig) -> None:
+        super().__init__(client, config)
         # No support for XML endpoint.  Who wants that?
-        self.as_html = SyncRecursiveMetaHtml(self.client, compress=compress)
-        self.as_text = SyncRecursiveMetaPlain(self.client, compress=compress)
+        self.as_html = SyncRecursiveMetaHtml(self.client, self.config)
+        self.as_text = SyncRecursiveMetaPlain(self.client, self.config)
+        self.as_metadata = SyncRecursiveMetaOnly(self.client, self.config)
 
 
 class AsyncTikaRmetaBase(AsyncResource):
     async def common_call(
         self,
         endpoint: str,
+        multipart_endpoint: str,
         filepath: Path,
         mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
     ) -> list[TikaResponse]:
         """
-        Given a specific endpoint and a file, do a multipart put to the endpoint.
+        Given a specific endpoint and a file, upload the file to the endpoint.
 
         Args:
-            endpoint: The endpoint to send the file to
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
             filepath: The path to the file to send
             mime_type: The mime type of the file to send
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             A list of JSON responses from the Tika server
 
         """
-        return [self.decoded_response(item) for item in await self.put_multipart(endpoint, filepath, mime_type)]
+        return [
+            self.decoded_response(item)
+            for item in await self.put_file(endpoint, multipart_endpoint, filepath, mime_type, options=options)
+        ]
+
+    @asynccontextmanager
+    async def stream_call(
+        self,
+        endpoint: str,
+        multipart_endpoint: str,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> AsyncIterator[AsyncIterator[TikaResponse]]:
+        """
+        Given a specific endpoint and a file, upload the file to the endpoint and parse the response as it arrives.
+
+        Args:
+            endpoint: The endpoint a streamed file is sent to
+            multipart_endpoint: The endpoint a multipart upload is sent to
+            filepath: The path to the file to send
+            mime_type: The mime type of the file to send
+            options: Parse settings for this request, over the client's defaults
+
+        Yields:
+            An iterator of each document's response from the Tika server, as soon as it is received
+
+        """
+        response = await self.send_file(
+            endpoint,
+            multipart_endpoint,
+            filepath,
+            mime_type,
+            stream=True,
+            extra_headers=self.parse_headers(options),
+        )
+        try:
+            yield (
+                self.decoded_response(item)
+                async for item in aiter_json_array(response.aiter_bytes(), self.config.json_decoder)
+            )
+        finally:
+            await response.aclose()
 
 
 class AsyncRecursiveMetaHtml(AsyncTikaRmetaBase):
-    async def from_file(self, filepath: Path, mime_type: str | None = None) -> list[TikaResponse]:
+    async def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> list[TikaResponse]:
         """
         Return the formatted (as HTML) document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             A list of JSON responses from the Tika server
 
         """
-        return await self.common_call(HTML_MULTI_PART_ENDPOINT, filepath, mime_type)
+        return await self.common_call(HTML_ENDPOINT, HTML_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
+
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> AbstractAsyncContextManager[AsyncIterator[TikaResponse]]:
+        """
+        Return the formatted (as HTML) document data, one embedded document at a time.
+
+        Only one document is held at once, however many the file contains.  Entering the context sends the request,
+        leaving it closes the response, even if not every document was read.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            A context manager of an async iterator of JSON responses from the Tika server
+
+        """
+        return self.stream_call(HTML_ENDPOINT, HTML_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
 
 
 class AsyncRecursiveMetaPlain(AsyncTikaRmetaBase):
-    async def from_file(self, filepath: Path, mime_type: str | None = None) -> list[TikaResponse]:
+    async def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> list[TikaResponse]:
         """
         Return the plain text document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             A list of JSON responses from the Tika server
 
         """
-        return await self.common_call(PLAIN_TEXT_MULTI_PART_ENDPOINT, filepath, mime_type)
+        return await self.common_call(
+            PLAIN_TEXT_ENDPOINT,
+            PLAIN_TEXT_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            options=options,
+        )
+
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> AbstractAsyncContextManager[AsyncIterator[TikaResponse]]:
+        """
+        Return the plain text document data, one embedded document at a time.
+
+        Only one document is held at once, however many the file contains.  Entering the context sends the request,
+        leaving it closes the response, even if not every document was read.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            A context manager of an async iterator of JSON responses from the Tika server
+
+        """
+        return self.stream_call(
+            PLAIN_TEXT_ENDPOINT,
+            PLAIN_TEXT_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            options=options,
+        )
+
+
+class AsyncRecursiveMetaOnly(AsyncTikaRmetaBase):
+    async def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> list[TikaResponse]:
+        """
+        Return the metadata of the document and each embedded document, without their content.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            A list of JSON responses from the Tika server
+
+        """
+        return await self.common_call(
+            METADATA_ENDPOINT,
+            METADATA_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            options=options,
+        )
+
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> AbstractAsyncContextManager[AsyncIterator[TikaResponse]]:
+        """
+        Return the metadata of the document and each embedded document, without their content, one at a time.
+
+        Only one document is held at once, however many the file contains.  Entering the context sends the request,
+        leaving it closes the response, even if not every document was read.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Returns:
+            A context manager of an async iterator of JSON responses from the Tika server
+
+        """
+        return self.stream_call(METADATA_ENDPOINT, METADATA_MULTI_PART_ENDPOINT, filepath, mime_type, options=options)
 
 
 class AsyncRecursive(AsyncResource):
@@ -155,8 +504,9 @@ class AsyncRecursive(AsyncResource):
     https://cwiki.apache.org/confluence/display/TIKA/TikaServer#TikaServer-RecursiveMetadataandContent
     """
 
-    def __init__(self, client: AsyncClient, *, compress: bool) -> None:
-        super().__init__(client, compress=compress)
+    def __init__(self, client: AsyncClient, config: ResourceConfig) -> None:
+        super().__init__(client, config)
         # No support for XML endpoint.  Who wants that?
-        self.as_html = AsyncRecursiveMetaHtml(self.client, compress=compress)
-        self.as_text = AsyncRecursiveMetaPlain(self.client, compress=compress)
+        self.as_html = AsyncRecursiveMetaHtml(self.client, self.config)
+        self.as_text = AsyncRecursiveMetaPlain(self.client, self.config)
+        self.as_metadata = AsyncRecursiveMetaOnly(self.client, self.config)
@@ -3,84 +3,193 @@
 # SPDX-License-Identifier: MPL-2.0
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from contextlib import contextmanager
 from typing import TYPE_CHECKING
 from typing import Final
 
 from tika_client._base import AsyncResource
 from tika_client._base import SyncResource
+from tika_client._streaming import AsyncTextStream
+from tika_client._streaming import TextStream
 
 PLAIN_TEXT_ENDPOINT: Final[str] = "/tika/text"
 PLAIN_TEXT_MULTI_PART_ENDPOINT: Final[str] = "/tika/form/text"
 HTML_ENDPOINT: Final[str] = "/tika"
 HTML_MULTI_PART_ENDPOINT: Final[str] = "/tika/form"
+# Asks for the text itself, instead of the text escaped into a JSON document
+PLAIN_TEXT_ACCEPT: Final[dict[str, str]] = {"Accept": "text/plain"}
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+    from collections.abc import Iterator
     from pathlib import Path
 
     from httpx import AsyncClient
     from httpx import Client
 
+    from tika_client._base import ResourceConfig
+    from tika_client._options import ParseOptions
     from tika_client.data_models import TikaResponse
 
 
 class SyncTikaHtml(SyncResource):
-    def from_file(self, filepath: Path, mime_type: str | None = None) -> TikaResponse:
+    def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the formatted (as HTML) document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        return self.decoded_response(self.put_multipart(HTML_MULTI_PART_ENDPOINT, filepath, mime_type))
-
-    def from_buffer(self, content: str | bytes, mime_type: str | None = None) -> TikaResponse:
+        return self.decoded_response(
+            self.put_file(HTML_ENDPOINT, HTML_MULTI_PART_ENDPOINT, filepath, mime_type, options=options),
+        )
+
+    def from_buffer(
+        self,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the HTML formatted document data from a given string of document content.
 
         Args:
             content: The content to be sent to the Tika server
             mime_type: The mime type of the content to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        return self.decoded_response(self.put_content(HTML_ENDPOINT, content, mime_type))
+        return self.decoded_response(self.put_content(HTML_ENDPOINT, content, mime_type, options=options))
 
 
 class SyncTikaPlain(SyncResource):
-    def from_file(self, filepath: Path, mime_type: str | None = None) -> TikaResponse:
+    def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the plain text document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        return self.decoded_response(self.put_multipart(PLAIN_TEXT_MULTI_PART_ENDPOINT, filepath, mime_type))
-
-    def from_buffer(self, content: str | bytes, mime_type: str | None = None) -> TikaResponse:
+        return self.decoded_response(
+            self.put_file(PLAIN_TEXT_ENDPOINT, PLAIN_TEXT_MULTI_PART_ENDPOINT, filepath, mime_type, options=options),
+        )
+
+    def from_buffer(
+        self,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the plain text document data from a given string of document content.
 
         Args:
             content: The content to be sent to the Tika server
             mime_type: The mime type of the content to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the
 
         """
-        return self.decoded_response(self.put_content(PLAIN_TEXT_ENDPOINT, content, mime_type))
+        return self.decoded_response(self.put_content(PLAIN_TEXT_ENDPOINT, content, mime_type, options=options))
+
+    @contextmanager
+    def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Iterator[TextStream]:
+        """
+        Stream the plain text of a document, without holding all of it at once.
+
+        Entering the context sends the request, leaving it closes the response, even if not all of the text was read.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Yields:
+            The text, to iterate in decoded chunks
+
+        """
+        response = self.send_file(
+            PLAIN_TEXT_ENDPOINT,
+            PLAIN_TEXT_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            stream=True,
+            extra_headers={**self.parse_headers(options), **PLAIN_TEXT_ACCEPT},
+        )
+        try:
+            yield TextStream(response)
+        finally:
+            response.close()
+
+    @contextmanager
+    def stream_from_buffer(
+        self,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> Iterator[TextStream]:
+        """
+        Stream the plain text of a given string of document content, without holding all of it at once.
+
+        Args:
+            content: The content to be sent to the Tika server
+            mime_type: The mime type of the content to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Yields:
+            The text, to iterate in decoded chunks
+
+        """
+        response = self.send_content(
+            PLAIN_TEXT_ENDPOINT,
+            content,
+            mime_type,
+            stream=True,
+            extra_headers={**self.parse_headers(options), **PLAIN_TEXT_ACCEPT},
+        )
+        try:
+            yield TextStream(response)
+        finally:
+            response.close()
 
 
 class SyncTika(SyncResource):
@@ -91,70 +200,175 @@ class SyncTika(SyncResource):
     https://cwiki.apache.org/confluence/display/TIKA/TikaServer#TikaServer-TikaResource
     """
 
-    def __init__(self, client: Client, *, compress: bool) -> None:
-        super().__init__(client, compress=compress)
-        self.as_html = SyncTikaHtml(self.client, compress=compress)
-        self.as_text = SyncTikaPlain(self.client, compress=compress)
+    def __init__(self, client: Client, config: ResourceConfig) -> None:
+        super().__init__(client, config)
+        self.as_html = SyncTikaHtml(self.client, self.config)
+        self.as_text = SyncTikaPlain(self.client, self.config)
 
 
 class AsyncTikaHtml(AsyncResource):
-    async def from_file(self, filepath: Path, mime_type: str | None = None) -> TikaResponse:
+    async def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the formatted (as HTML) document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        return self.decoded_response(await self.put_multipart(HTML_MULTI_PART_ENDPOINT, filepath, mime_type))
-
-    async def from_buffer(self, content: str | bytes, mime_type: str | None = None) -> TikaResponse:
+        return self.decoded_response(
+            await self.put_file(HTML_ENDPOINT, HTML_MULTI_PART_ENDPOINT, filepath, mime_type, options=options),
+        )
+
+    async def from_buffer(
+        self,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the HTML formatted document data from a given string of document content.
 
         Args:
             content: The content to be sent to the Tika server
             mime_type: The mime type of the content to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        return self.decoded_response(await self.put_content(HTML_ENDPOINT, content, mime_type))
+        return self.decoded_response(await self.put_content(HTML_ENDPOINT, content, mime_type, options=options))
 
 
 class AsyncTikaPlain(AsyncResource):
-    async def from_file(self, filepath: Path, mime_type: str | None = None) -> TikaResponse:
+    async def from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the plain text document data.
 
         Args:
             filepath: The path to the file to be sent to the Tika server
             mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the Tika server
 
         """
-        return self.decoded_response(await self.put_multipart(PLAIN_TEXT_MULTI_PART_ENDPOINT, filepath, mime_type))
-
-    async def from_buffer(self, content: str | bytes, mime_type: str | None = None) -> TikaResponse:
+        return self.decoded_response(
+            await self.put_file(
+                PLAIN_TEXT_ENDPOINT,
+                PLAIN_TEXT_MULTI_PART_ENDPOINT,
+                filepath,
+                mime_type,
+                options=options,
+            ),
+        )
+
+    async def from_buffer(
+        self,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> TikaResponse:
         """
         Return the plain text document data from a given string of document content.
 
         Args:
             content: The content to be sent to the Tika server
             mime_type: The mime type of the content to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
 
         Returns:
             The JSON response from the
 
         """
-        return self.decoded_response(await self.put_content(PLAIN_TEXT_ENDPOINT, content, mime_type))
+        return self.decoded_response(await self.put_content(PLAIN_TEXT_ENDPOINT, content, mime_type, options=options))
+
+    @asynccontextmanager
+    async def stream_from_file(
+        self,
+        filepath: Path,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> AsyncIterator[AsyncTextStream]:
+        """
+        Stream the plain text of a document, without holding all of it at once.
+
+        Entering the context sends the request, leaving it closes the response, even if not all of the text was read.
+
+        Args:
+            filepath: The path to the file to be sent to the Tika server
+            mime_type: The mime type of the file to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Yields:
+            The text, to iterate in decoded chunks
+
+        """
+        response = await self.send_file(
+            PLAIN_TEXT_ENDPOINT,
+            PLAIN_TEXT_MULTI_PART_ENDPOINT,
+            filepath,
+            mime_type,
+            stream=True,
+            extra_headers={**self.parse_headers(options), **PLAIN_TEXT_ACCEPT},
+        )
+        try:
+            yield AsyncTextStream(response)
+        finally:
+            await response.aclose()
+
+    @asynccontextmanager
+    async def stream_from_buffer(
+        self,
+        content: str | bytes,
+        mime_type: str | None = None,
+        *,
+        options: ParseOptions | None = None,
+    ) -> AsyncIterator[AsyncTextStream]:
+        """
+        Stream the plain text of a given string of document content, without holding all of it at once.
+
+        Args:
+            content: The content to be sent to the Tika server
+            mime_type: The mime type of the content to be sent to the Tika server
+            options: Parse settings for this request, over the client's defaults
+
+        Yields:
+            The text, to iterate in decoded chunks
+
+        """
+        response = await self.send_content(
+            PLAIN_TEXT_ENDPOINT,
+            content,
+            mime_type,
+            stream=True,
+            extra_headers={**self.parse_headers(options), **PLAIN_TEXT_ACCEPT},
+        )
+        try:
+            yield AsyncTextStream(response)
+        finally:
+            await response.aclose()
 
 
 class AsyncTika(AsyncResource):
@@ -165,7 +379,7 @@ class AsyncTika(AsyncResource):
     https://cwiki.apache.org/confluence/display/TIKA/TikaServer#TikaServer-TikaResource
     """
 
-    def __init__(self, client: AsyncClient, *, compress: bool) -> None:
-        super().__init__(client, compress=compress)
-        self.as_html = AsyncTikaHtml(self.client, compress=compress)
-        self.as_text = AsyncTikaPlain(self.client, compress=compress)
+    def __init__(self, client: AsyncClient, config: ResourceConfig) -> None:
+        super().__init__(client, config)
+        self.as_html = AsyncTikaHtml(self.client, self.config)
+        self.as_text = AsyncTikaPlain(self.client, self.config)
@@ -0,0 +1,210 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import random
+import threading
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from httpx import NetworkError
+from httpx import PoolTimeout
+from httpx import RemoteProtocolError
+from httpx import TimeoutException
+from httpx import codes
+
+from tika_client._health import NoHealthyServerError
+
+if TYPE_CHECKING:
+    from httpx import Response
+
+# Statuses worth trying again, the server or something in front of it is temporarily unable to answer
+RETRY_STATUSES: frozenset[int] = frozenset(
+    {codes.TOO_MANY_REQUESTS, codes.BAD_GATEWAY, codes.SERVICE_UNAVAILABLE, codes.GATEWAY_TIMEOUT},
+)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Settings for retrying extraction requests which failed for transient reasons.
+
+    Connection errors, timeouts and the retry_statuses are retried with exponential backoff.  A global budget caps
+    retries at a fraction of the requests made, so that retries cannot multiply the load on an overloaded server.
+
+    Args:
+        max_attempts: The most times a request is sent, including the first attempt
+        backoff_base: Seconds to wait before the first retry, doubling for each further retry
+        backoff_max: The longest wait between attempts
+        jitter: Whether to randomize each wait between zero and its backoff, spreading out retries from many clients
+        retry_statuses: Response statuses which are retried
+        respect_retry_after: Whether to wait as long as a Retry-After header asks.  When it asks for longer than
+            backoff_max, the request is not retried
+        budget_ratio: Retries allowed as a fraction of the requests made within the budget window
+        budget_min_per_second: Retries always allowed per second, so that low traffic can still retry
+        budget_window: Seconds of history the budget considers
+
+    """
+
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    jitter: bool = True
+    retry_statuses: frozenset[int] = RETRY_STATUSES
+    respect_retry_after: bool = True
+    budget_ratio: float = 0.1
+    budget_min_per_second: float = 1.0
+    budget_window: float = 10.0
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """
+    Parse a Retry-After header, either delay seconds or an HTTP date.
+
+    Args:
+        value: The header value
+
+    Returns:
+        The seconds to wait, or None if the header is missing or invalid
+
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(tz=timezone.utc)).total_seconds())
+
+
+class RetryBudget:
+    """
+    Limits retries to a fraction of recent requests plus a small fixed allowance.
+
+    Thread safe, a single budget is shared by every resource of a client.
+
+    Args:
+        ratio: Retries allowed per request made within the window
+        min_per_second: Retries always allowed per second
+        window: Seconds of history considered
+
+    """
+
+    def __init__(self, ratio: float, min_per_second: float, window: float) -> None:
+        self.ratio = ratio
+        self.reserve = min_per_second * window
+        self.window = window
+        self._requests: deque[float] = deque()
+        self._retries: deque[float] = deque()
+        self._lock = threading.Lock()
+        self.granted = 0
+        self.denied = 0
+
+    def _prune(self, now: float) -> None:
+        horizon = now - self.window
+        for history in (self._requests, self._retries):
+            while history and history[0] < horizon:
+                history.popleft()
+
+    def deposit(self) -> None:
+        """Count a new request, earning a fraction of a retry."""
+        with self._lock:
+            now = monotonic()
+            self._prune(now)
+            self._requests.append(now)
+
+    def withdraw(self) -> bool:
+        """
+        Spend a retry, if the budget allows one.
+
+        Returns:
+            Whether the retry may be made
+
+        """
+        with self._lock:
+            now = monotonic()
+            self._prune(now)
+            if len(self._retries) >= self.reserve + self.ratio * len(self._requests):
+                self.denied += 1
+                return False
+            self._retries.append(now)
+            self.granted += 1
+            return True
+
+
+class Retrier:
+    """
+    Decides whether and when a failed attempt is retried, for one client.
+
+    Args:
+        policy: The retry settings
+
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.budget = RetryBudget(policy.budget_ratio, policy.budget_min_per_second, policy.budget_window)
+
+    @staticmethod
+    def is_transient(error: BaseException) -> bool:
+        """Whether the error is a transient transport failure worth retrying."""
+        if isinstance(error, PoolTimeout):
+            # The local pool is exhausted, retrying only adds to the queue
+            return False
+        return isinstance(error, (TimeoutException, NetworkError, RemoteProtocolError, NoHealthyServerError))
+
+    def _backoff(self, attempt: int) -> float:
+        delay = min(self.policy.backoff_max, self.policy.backoff_base * 2.0 ** (attempt - 1))
+        if self.policy.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+        return delay
+
+    def next_delay(
+        self,
+        attempt: int,
+        *,
+        response: Response | None = None,
+        error: BaseException | None = None,
+    ) -> float | None:
+        """
+        Decide whether a failed attempt is retried.
+
+        Args:
+            attempt: The number of the attempt which just finished, starting from 1
+            response: The response of the attempt, if one was received
+            error: The error raised by the attempt, if any
+
+        Returns:
+            Seconds to wait before the next attempt, or None if the attempt must not be retried
+
+        """
+        if attempt >= self.policy.max_attempts:
+            return None
+        if error is not None and not self.is_transient(error):
+            return None
+        if response is not None and response.status_code not in self.policy.retry_statuses:
+            return None
+
+        delay = self._backoff(attempt)
+        if response is not None and self.policy.respect_retry_after:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                if retry_after > self.policy.backoff_max:
+                    return None
+                delay = retry_after
+
+        if not self.budget.withdraw():
+            return None
+        return delay
@@ -0,0 +1,273 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import json
+import re
+from typing import TYPE_CHECKING
+from typing import Any
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+    from collections.abc import AsyncIterator
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+
+    from httpx import Headers
+    from httpx import Response
+
+    from tika_client._json import JsonDecoder
+
+# Inside an element, only brackets and the start of strings change the nesting
+_STRUCTURE = re.compile(rb'[\[\]{}"]')
+_WHITESPACE = b" \t\r\n"
+_OPEN = b"[{"
+_QUOTE = ord('"')
+_BACKSLASH = ord("\\")
+_ARRAY_START = ord("[")
+_ARRAY_END = ord("]")
+_COMMA = ord(",")
+
+
+class JsonArrayParser:
+    """
+    Parses a JSON array of objects or arrays incrementally, as its bytes arrive.
+
+    Only the element being received is buffered.  Each element is decoded once it is complete, so the whole array is
+    never held, as raw bytes or decoded.  The scan jumps between brackets and quotes rather than stepping through each
+    byte, so long strings such as extracted content are skipped over quickly.
+
+    Args:
+        loads: Decodes each complete element
+
+    """
+
+    def __init__(self, loads: JsonDecoder = json.loads) -> None:
+        self._loads = loads
+        self._buffer = bytearray()
+        # Where scanning resumes in the buffer
+        self._pos = 0
+        # The start of the element being received, if one has started
+        self._start: int | None = None
+        self._depth = 0
+        self._in_string = False
+        self._opened = False
+        # Whether an element was completed, and a comma seen since, so the next separator is known
+        self._after_element = False
+        self._after_comma = False
+        self.finished = False
+
+    def feed(self, data: bytes) -> list[Any]:
+        """
+        Add the next bytes of the array.
+
+        Args:
+            data: The bytes received
+
+        Returns:
+            The elements completed by these bytes, decoded
+
+        Raises:
+            ValueError: The bytes are not a JSON array of objects or arrays
+
+        """
+        if self.finished:
+            if data.strip():
+                msg = "Unexpected data after the end of the JSON array"
+                raise ValueError(msg)
+            return []
+        self._buffer += data
+        elements: list[Any] = []
+        while (self._start is not None or self._next_element()) and self._scan_element():
+            elements.append(self._pop_element())
+        return elements
+
+    def close(self) -> None:
+        """
+        Check the array was complete.
+
+        Raises:
+            ValueError: The array ended early
+
+        """
+        if not self.finished:
+            msg = "The JSON array ended before it was closed"
+            raise ValueError(msg)
+
+    def _next_element(self) -> bool:
+        """Skip to the start of the next element, returning whether one has started."""
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self._pos = pos
+            if pos == len(buffer):
+                return False
+
+            char = buffer[pos]
+            if not self._opened:
+                if char != _ARRAY_START:
+                    msg = f"Expected a JSON array, found {chr(char)!r}"
+                    raise ValueError(msg)
+                self._opened = True
+            elif char == _ARRAY_END:
+                if self._after_comma:
+                    msg = "Unexpected comma before the end of the JSON array"
+                    raise ValueError(msg)
+                self._finish(pos + 1)
+                return False
+            elif self._after_element:
+                self._take_comma(char)
+            elif char not in _OPEN:
+                msg = f"Expected a JSON object or array, found {chr(char)!r}"
+                raise ValueError(msg)
+            else:
+                self._start = pos
+                self._after_comma = False
+                return True
+            pos += 1
+
+    def _take_comma(self, char: int) -> None:
+        """Check the separator after an element is a comma."""
+        if char != _COMMA:
+            msg = f"Expected ',' or ']' after a JSON array element, found {chr(char)!r}"
+            raise ValueError(msg)
+        self._after_element = False
+        self._after_comma = True
+
+    def _finish(self, end: int) -> None:
+        """Mark the array as closed at end, checking nothing but whitespace follows."""
+        if self._buffer[end:].strip():
+            msg = "Unexpected data after the end of the JSON array"
+            raise ValueError(msg)
+        self.finished = True
+        self._buffer.clear()
+        self._pos = 0
+
+    def _scan_element(self) -> bool:
+        """Scan the element being received, returning whether it is complete."""
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            if self._in_string:
+                quote = buffer.find(b'"', pos)
+                if quote == -1:
+                    self._pos = len(buffer)
+                    return False
+                # A quote after an odd number of backslashes is escaped.  The opening quote stops the count.
+                backslashes = 0
+                while buffer[quote - 1 - backslashes] == _BACKSLASH:
+                    backslashes += 1
+                self._in_string = backslashes % 2 == 1
+                pos = quote + 1
+                continue
+
+            match = _STRUCTURE.search(buffer, pos)
+            if match is None:
+                self._pos = len(buffer)
+                return False
+            char = buffer[match.start()]
+            pos = match.end()
+            if char == _QUOTE:
+                self._in_string = True
+            elif char in _OPEN:
+                self._depth += 1
+            else:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._pos = pos
+                    return True
+
+    def _pop_element(self) -> Any:  # noqa: ANN401
+        """Decode the completed element and drop it from the buffer."""
+        end = self._pos
+        element = self._loads(bytes(self._buffer[self._start : end]))
+        del self._buffer[:end]
+        self._pos = 0
+        self._start = None
+        self._after_element = True
+        return element
+
+
+def iter_json_array(chunks: Iterable[bytes], loads: JsonDecoder = json.loads) -> Iterator[Any]:
+    """
+    Parse a JSON array from the chunks of its bytes.
+
+    Args:
+        chunks: The bytes of the array, in pieces of any size
+        loads: Decodes each element
+
+    Yields:
+        Each element of the array, decoded as soon as it is complete
+
+    Raises:
+        ValueError: The bytes are not a complete JSON array of objects or arrays
+
+    """
+    parser = JsonArrayParser(loads)
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    parser.close()
+
+
+async def aiter_json_array(chunks: AsyncIterable[bytes], loads: JsonDecoder = json.loads) -> AsyncIterator[Any]:
+    """
+    Parse a JSON array from the chunks of its bytes as they arrive.
+
+    Args:
+        chunks: The bytes of the array, in pieces of any size
+        loads: Decodes each element
+
+    Yields:
+        Each element of the array, decoded as soon as it is complete
+
+    Raises:
+        ValueError: The bytes are not a complete JSON array of objects or arrays
+
+    """
+    parser = JsonArrayParser(loads)
+    async for chunk in chunks:
+        for element in parser.feed(chunk):
+            yield element
+    parser.close()
+
+
+class BaseTextStream:
+    """
+    The extracted plain text of a document, read from the response in decoded chunks.
+
+    The charset the server declares is decoded incrementally, so a character split between chunks is still decoded
+    correctly.
+
+    Args:
+        response: The streamed response, closed by whoever opened it
+
+    """
+
+    def __init__(self, response: Response) -> None:
+        self.response = response
+
+    @property
+    def headers(self) -> Headers:
+        """The response headers, including any metadata the server sends as headers."""
+        return self.response.headers
+
+    @property
+    def encoding(self) -> str | None:
+        """The charset the text is decoded from."""
+        return self.response.encoding
+
+
+class TextStream(BaseTextStream):
+    def __iter__(self) -> Iterator[str]:
+        """Iterate the text in decoded chunks, as it is received."""
+        return self.response.iter_text()
+
+
+class AsyncTextStream(BaseTextStream):
+    def __aiter__(self) -> AsyncIterator[str]:
+        """Iterate the text in decoded chunks, as it is received."""
+        return self.response.aiter_text()
@@ -0,0 +1,159 @@
+# SPDX-FileCopyrightText: 2023-present Trenton H <rda0128ou@mozmail.com>
+#
+# SPDX-License-Identifier: MPL-2.0
+
+from __future__ import annotations
+
+import zlib
+from enum import Enum
+from typing import TYPE_CHECKING
+
+from anyio import open_file
+from anyio.to_thread import run_sync
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+    from collections.abc import AsyncIterator
+    from collections.abc import Iterable
+    from collections.abc import Iterator
+    from pathlib import Path
+
+    from tika_client._compression import CompressionTally
+
+# zlib window bits selecting the gzip container, with the largest window
+GZIP_WBITS = 16 + zlib.MAX_WBITS
+
+
+class UploadMode(str, Enum):
+    """How from_file sends a document to the Tika server."""
+
+    # A multipart form upload to the /form endpoints
+    Multipart = "multipart"
+    # The raw file as the body of a PUT to the plain endpoints, read in fixed size chunks
+    Stream = "stream"
+
+
+def iter_file_chunks(filepath: Path, chunk_size: int) -> Iterator[bytes]:
+    """
+    Read a file in fixed size chunks.
+
+    Args:
+        filepath: The file to read
+        chunk_size: The most bytes read at once
+
+    Yields:
+        The chunks of the file
+
+    """
+    with filepath.open("rb") as handle:
+        while chunk := handle.read(chunk_size):
+            yield chunk
+
+
+async def aiter_file_chunks(filepath: Path, chunk_size: int) -> AsyncIterator[bytes]:
+    """
+    Read a file in fixed size chunks, without blocking the event loop.
+
+    Args:
+        filepath: The file to read
+        chunk_size: The most bytes read at once
+
+    Yields:
+        The chunks of the file
+
+    """
+    async with await open_file(filepath, "rb") as handle:
+        while chunk := await handle.read(chunk_size):
+            yield chunk
+
+
+def iter_buffer_chunks(content: bytes, chunk_size: int) -> Iterator[memoryview]:
+    """
+    Split a buffer into fixed size chunks, without copying it.
+
+    Args:
+        content: The buffer
+        chunk_size: The most bytes per chunk
+
+    Yields:
+        Views of the chunks of the buffer
+
+    """
+    view = memoryview(content)
+    for start in range(0, len(view), chunk_size):
+        yield view[start : start + chunk_size]
+
+
+async def aiter_buffer_chunks(content: bytes, chunk_size: int) -> AsyncIterator[memoryview]:
+    """
+    Split a buffer into fixed size chunks, without copying it.
+
+    Args:
+        content: The buffer
+        chunk_size: The most bytes per chunk
+
+    Yields:
+        Views of the chunks of the buffer
+
+    """
+    for chunk in iter_buffer_chunks(content, chunk_size):
+        yield chunk
+
+
+def _compress(compressor: zlib._Compress, chunk: bytes | memoryview, tally: CompressionTally | None) -> bytes:
+    return tally.compress(compressor, chunk) if tally is not None else compressor.compress(chunk)
+
+
+def _flush(compressor: zlib._Compress, tally: CompressionTally | None) -> bytes:
+    return tally.flush(compressor) if tally is not None else compressor.flush()
+
+
+def gzip_chunks(
+    chunks: Iterable[bytes | memoryview],
+    level: int,
+    tally: CompressionTally | None = None,
+) -> Iterator[bytes]:
+    """
+    Compress a stream of chunks into a gzip stream, one chunk at a time.
+
+    Only the compressor's window is held, so memory stays bounded however long the input is.
+
+    Args:
+        chunks: The uncompressed input
+        level: The compression level, from 1 (fastest) to 9 (smallest)
+        tally: When given, measures the compression and reports it once the stream is complete
+
+    Yields:
+        The compressed output, skipping empty pieces while the compressor buffers
+
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    for chunk in chunks:
+        if compressed := _compress(compressor, chunk, tally):
+            yield compressed
+    yield _flush(compressor, tally)
+
+
+async def agzip_chunks(
+    chunks: AsyncIterable[bytes | memoryview],
+    level: int,
+    tally: CompressionTally | None = None,
+) -> AsyncIterator[bytes]:
+    """
+    Compress a stream of chunks into a gzip stream, one chunk at a time, without blocking the event loop.
+
+    Args:
+        chunks: The uncompressed input
+        level: The compression level, from 1 (fastest) to 9 (smallest)
+        tally: When given, measures the compression and reports it once the stream is complete
+
+    Yields:
+        The compressed output, skipping empty pieces while the compressor buffers
+
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, GZIP_WBITS)
+    async for chunk in chunks:
+        # Measured in the worker thread, where the CPU time is spent
+        if compressed := await run_sync(_compress, compressor, chunk, tally):
+            yield compressed
+    yield _flush(compressor, tally)
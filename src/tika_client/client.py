@@ -4,34 +4,91 @@
 
 from __future__ import annotations
 
+import json
 import logging
+import os
 from abc import ABC
 from abc import abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AbstractAsyncContextManager
 from contextlib import AbstractContextManager
 from functools import cached_property
 from typing import TYPE_CHECKING
 from typing import Generic
+from typing import ParamSpec
 from typing import TypeVar
 
+from anyio.to_thread import run_sync
+from httpx import URL
 from httpx import AsyncClient
+from httpx import AsyncHTTPTransport
 from httpx import Client
+from httpx import HTTPTransport
+from httpx import Limits
+from httpx import Timeout
+from httpx._utils import get_environment_proxies
 
 from tika_client.__about__ import __version__
+from tika_client._balancer import AsyncBalancingTransport
+from tika_client._balancer import LoadBalancing
+from tika_client._balancer import NodePool
+from tika_client._balancer import NodeStats
+from tika_client._balancer import SyncBalancingTransport
 from tika_client._base import AsyncResource
+from tika_client._base import ResourceConfig
 from tika_client._base import SyncResource
+from tika_client._batch import map_in_executor
+from tika_client._batch import run_batch
+from tika_client._coalesce import Coalescer
+from tika_client._compression import CompressionAdvisor
+from tika_client._compression import CompressionPolicy
+from tika_client._compression import CompressionStats
+from tika_client._constants import DEFAULT_COMPRESS_LEVEL
+from tika_client._constants import UPLOAD_CHUNK_SIZE
+from tika_client._health import HealthChecker
+from tika_client._health import HealthPolicy
+from tika_client._hedging import Hedger
+from tika_client._hedging import HedgingPolicy
+from tika_client._hedging import HedgingStats
+from tika_client._pool import PoolStats
+from tika_client._pool import pool_stats
 from tika_client._resource_meta import AsyncMetadata
 from tika_client._resource_meta import SyncMetadata
 from tika_client._resource_recursive import AsyncRecursive
 from tika_client._resource_recursive import SyncRecursive
 from tika_client._resource_tika import AsyncTika
 from tika_client._resource_tika import SyncTika
+from tika_client._retry import Retrier
+from tika_client._retry import RetryPolicy
+from tika_client._upload import UploadMode
 
 if TYPE_CHECKING:
+    from collections.abc import AsyncIterable
+    from collections.abc import AsyncIterator
+    from collections.abc import Awaitable
+    from collections.abc import Callable
+    from collections.abc import Generator
+    from collections.abc import Iterable
+    from collections.abc import Sequence
+    from concurrent.futures import Future
+    from pathlib import Path
     from types import TracebackType
 
+    from httpx import AsyncBaseTransport
+    from httpx import BaseTransport
+
+    from tika_client._batch import BatchResult
+    from tika_client._cache import CacheStats
+    from tika_client._cache import MemoryCache
+    from tika_client._cache import ResultCache
+    from tika_client._coalesce import CoalescingStats
+    from tika_client._json import JsonDecoder
+    from tika_client._options import ParseOptions
+
 T = TypeVar("T", bound="Client | AsyncClient")
 R = TypeVar("R", bound="SyncResource | AsyncResource")
+V = TypeVar("V")
+P = ParamSpec("P")
 
 
 class BaseTikaClient(ABC, Generic[T, R]):
@@ -39,29 +96,109 @@ class BaseTikaClient(ABC, Generic[T, R]):
     Base class for Tika clients.
 
     Args:
-        tika_url: The URL of the Tika server
+        tika_url: The URL of the Tika server, or a list of URLs to balance requests over several servers
         user_agent: Value to send as the User-Agent header.  Defaults to tika-client/{version}
         timeout: The timeout for the HTTP request
         log_level: The logging level
         compress: Whether to compress the response
+        compress_level: The gzip level for compressed uploads, from 1 (fastest) to 9 (smallest).  Buffers and
+            streamed file uploads are compressed, multipart file uploads are not
+        compression: Decides which uploads are worth compressing, when compress is set.  Defaults to a policy which
+            skips already compressed formats and samples the start of other uploads
+        max_connections: The maximum number of concurrent connections to the server, None for no limit
+        max_keepalive_connections: The maximum number of idle connections kept open for reuse, None for no limit
+        keepalive_expiry: Seconds an idle connection is kept open before being closed, None to keep it forever
+        pool_timeout: Seconds to wait for a free connection from the pool.  Defaults to the timeout
+        http2: Whether to speak HTTP/2 to the server, multiplexing concurrent requests over few connections.
+            Requires the http2 extra.  For http:// URLs this is cleartext HTTP/2 with prior knowledge (h2c)
+        trust_env: Whether to send requests through the proxies of the HTTP_PROXY, HTTPS_PROXY, ALL_PROXY and
+            NO_PROXY environment variables, as httpx does
+        load_balancing: How requests are spread when more than one server URL is given
+        health: When given, unhealthy servers are detected by background probes and failure rates, and stop
+            receiving requests until they recover
+        retry: When given, requests failing for transient reasons are retried according to this policy
+        hedging: When given, slow requests are duplicated to another server according to this policy.  Only the
+            AsyncTikaClient hedges requests
+        workers: The threads the TikaClient uses for submit and map, by default max_keepalive_connections so each
+            thread can keep a connection open
+        upload_mode: How from_file sends documents.  Streaming PUTs the raw file in fixed size chunks, avoiding the
+            multipart encoding and keeping memory flat for large files
+        upload_chunk_size: The bytes read from a document at once when streaming it
+        json_decoder: Decodes the JSON responses of the server from their bytes.  Defaults to the standard library's
+            json module, best_json_decoder() picks orjson or msgspec when installed, for example with the orjson extra
+        cache: When given, the JSON responses of from_file and from_buffer are cached, keyed by the content, the
+            file name, the endpoint, the mime type, the parse options and the server version.  The cache may be shared
+            by several clients
+        memory_cache: When given, the decoded responses of from_file and from_buffer are also kept in memory, keyed
+            as in the cache and looked up first.  Answered responses are shared, so should not be modified
+        coalesce: Whether identical from_file and from_buffer calls in flight at the same time share one request.
+            Calls are identical when their content, file name, endpoint, mime type and parse options are.  Shared
+            responses should not be modified
+        parse_options: Parse settings sent with every request, such as limits on the server's work per document.
+            The options given to a single request take precedence over these, field by field
 
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
-        tika_url: str,
+        tika_url: str | Sequence[str],
         user_agent: str = f"tika-client/{__version__}",
         *,
         timeout: float = 30.0,
         log_level: int = logging.ERROR,
         compress: bool = False,
+        compress_level: int = DEFAULT_COMPRESS_LEVEL,
+        compression: CompressionPolicy | None = None,
+        max_connections: int | None = 100,
+        max_keepalive_connections: int | None = 20,
+        keepalive_expiry: float | None = 5.0,
+        pool_timeout: float | None = None,
+        http2: bool = False,
+        trust_env: bool = True,
+        load_balancing: LoadBalancing = LoadBalancing.RoundRobin,
+        health: HealthPolicy | None = None,
+        retry: RetryPolicy | None = None,
+        hedging: HedgingPolicy | None = None,
+        workers: int | None = None,
+        upload_mode: UploadMode = UploadMode.Multipart,
+        upload_chunk_size: int = UPLOAD_CHUNK_SIZE,
+        json_decoder: JsonDecoder | None = None,
+        cache: ResultCache | None = None,
+        memory_cache: MemoryCache | None = None,
+        coalesce: bool = False,
+        parse_options: ParseOptions | None = None,
     ) -> None:
         """Construct a Tika client with the specific server URL, timeout and compression."""
-        self.tika_url = tika_url
+        self.tika_urls = [tika_url] if isinstance(tika_url, str) else list(tika_url)
+        if not self.tika_urls:
+            msg = "At least one Tika server URL is required"
+            raise ValueError(msg)
+        self.tika_url = self.tika_urls[0]
         self.timeout = timeout
         self.log_level = log_level
         self.compress = compress
+        self.compress_level = compress_level
+        self.compression = compression or CompressionPolicy()
         self.user_agent = user_agent
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.keepalive_expiry = keepalive_expiry
+        self.pool_timeout = timeout if pool_timeout is None else pool_timeout
+        self.http2 = http2
+        self.trust_env = trust_env
+        self.load_balancing = load_balancing
+        self.health = health
+        self.retry = retry
+        self.hedging = hedging
+        # The same fallback the standard library uses for a thread pool
+        self.workers = workers or max_keepalive_connections or min(32, (os.cpu_count() or 1) + 4)
+        self.upload_mode = upload_mode
+        self.upload_chunk_size = upload_chunk_size
+        self.json_decoder = json_decoder or json.loads
+        self.cache = cache
+        self.memory_cache = memory_cache
+        self.coalesce = coalesce
+        self.parse_options = parse_options
 
         logging.getLogger("httpx").setLevel(log_level)
         logging.getLogger("httpcore").setLevel(log_level)
@@ -75,6 +212,134 @@ class BaseTikaClient(ABC, Generic[T, R]):
 
         return headers
 
+    @cached_property
+    def _resource_config(self) -> ResourceConfig:
+        return ResourceConfig(
+            compress=self.compress,
+            compress_level=self.compress_level,
+            retrier=Retrier(self.retry) if self.retry is not None else None,
+            hedger=Hedger(self.hedging) if self.hedging is not None else None,
+            upload_mode=self.upload_mode,
+            chunk_size=self.upload_chunk_size,
+            compression=CompressionAdvisor(self.compression, self.compress_level) if self.compress else None,
+            json_decoder=self.json_decoder,
+            cache=self.cache,
+            memory_cache=self.memory_cache,
+            coalescer=Coalescer() if self.coalesce else None,
+            parse_options=self.parse_options,
+        )
+
+    @cached_property
+    def _limits(self) -> Limits:
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @cached_property
+    def _http1(self) -> bool:
+        # Without TLS there is no ALPN to negotiate the protocol, so HTTP/2 must be spoken from the first byte
+        return not (self.http2 and URL(self.tika_url).scheme == "http")
+
+    @cached_property
+    def _proxies(self) -> dict[str, str | None]:
+        # Passing our own transport turns off httpx's proxies from the environment, so they are read here instead
+        return get_environment_proxies() if self.trust_env else {}
+
+    @cached_property
+    def _timeout(self) -> Timeout:
+        return Timeout(self.timeout, pool=self.pool_timeout)
+
+    @cached_property
+    def _node_pool(self) -> NodePool:
+        return NodePool(self.tika_urls, self.load_balancing, health=self.health)
+
+    @cached_property
+    def _health_checker(self) -> HealthChecker | None:
+        if self.health is None:
+            return None
+        return HealthChecker(self._node_pool, self.health, {"User-Agent": self.user_agent}, trust_env=self.trust_env)
+
+    def _start_health_checks(self) -> None:
+        if self._health_checker is not None:
+            self._health_checker.start()
+
+    def _stop_health_checks(self) -> None:
+        # Only stop a checker which was actually created
+        checker: HealthChecker | None = self.__dict__.get("_health_checker")
+        if checker is not None:
+            checker.stop()
+
+    def node_stats(self) -> list[NodeStats]:
+        """
+        Report the load of every Tika server the client balances over.
+
+        Returns:
+            A snapshot of the per server statistics, in the order the URLs were given
+
+        """
+        return self._node_pool.stats()
+
+    def pool_stats(self) -> PoolStats:
+        """
+        Report the current occupancy of the connection pool.
+
+        Useful for sizing max_connections against the number of workers and Tika servers.
+
+        Returns:
+            A snapshot of the pool statistics
+
+        """
+        return pool_stats(self._transport, self._limits)
+
+    def compression_stats(self) -> CompressionStats | None:
+        """
+        Report how many uploads were compressed, and the bytes and CPU time compression decisions saved.
+
+        Returns:
+            A snapshot of the compression counters, or None if the client does not compress
+
+        """
+        advisor = self._resource_config.compression
+        return advisor.stats() if advisor is not None else None
+
+    def cache_stats(self) -> CacheStats | None:
+        """
+        Report how often the result cache answered instead of the server, and how large it is.
+
+        Returns:
+            A snapshot of the cache counters, or None if the client has no cache
+
+        """
+        return self.cache.stats() if self.cache is not None else None
+
+    def memory_cache_stats(self) -> CacheStats | None:
+        """
+        Report how often the memory cache answered, and how many bytes of responses it holds.
+
+        Returns:
+            A snapshot of the cache counters, or None if the client has no memory cache
+
+        """
+        return self.memory_cache.stats() if self.memory_cache is not None else None
+
+    def coalescing_stats(self) -> CoalescingStats | None:
+        """
+        Report how many requests were sent for coalesced calls, and how many calls shared another's request.
+
+        Returns:
+            A snapshot of the coalescing counters, or None if the client does not coalesce
+
+        """
+        coalescer = self._resource_config.coalescer
+        return coalescer.stats() if coalescer is not None else None
+
+    @property
+    @abstractmethod
+    def _transport(self) -> HTTPTransport | AsyncHTTPTransport:  # pragma: no cover
+        pass
+
     @property
     @abstractmethod
     def client(self) -> T:  # pragma: no cover  # noqa: D102
@@ -110,27 +375,96 @@ class TikaClient(AbstractContextManager["TikaClient"], BaseTikaClient[Client, Sy
         exc_tb: TracebackType | None,
     ) -> None:
         """Exit the TikaClient context and perform cleanup."""
+        executor: ThreadPoolExecutor | None = self.__dict__.get("_executor")
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
         self.client.close()
+        self._stop_health_checks()
+
+    @cached_property
+    def _executor(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="tika-client")
+
+    def submit(self, fn: Callable[P, V], /, *args: P.args, **kwargs: P.kwargs) -> Future[V]:
+        """
+        Run a call, usually a resource method, on the client's thread pool.
+
+        Every thread shares this client's connection pool, so many uploads can be in flight from synchronous code.
+
+        Args:
+            fn: The callable to run, for example `client.metadata.from_file`
+            args: Positional arguments for fn
+            kwargs: Keyword arguments for fn
+
+        Returns:
+            A future for the result of the call
+
+        """
+        return self._executor.submit(fn, *args, **kwargs)
+
+    def map(
+        self,
+        fn: Callable[[Path], V],
+        paths: Iterable[Path],
+        *,
+        ordered: bool = True,
+        max_in_flight: int | None = None,
+    ) -> Generator[BatchResult[V], None, None]:
+        """
+        Send many files concurrently on the client's thread pool.
+
+        A failed file does not stop the others, its exception is returned in its result instead.  Paths are only
+        taken as capacity frees up, and closing the iterator early cancels the files not yet started.
+
+        Args:
+            fn: Sends a single file, for example `client.metadata.from_file`
+            paths: The files to send
+            ordered: Whether to yield results in input order instead of as they complete
+            max_in_flight: The most files submitted but not yet yielded, defaults to twice the worker count
+
+        Returns:
+            A generator of the results, which may be closed early
+
+        """
+        if max_in_flight is None:
+            max_in_flight = 2 * self.workers
+        return map_in_executor(self._executor, fn, paths, ordered=ordered, max_in_flight=max_in_flight)
+
+    @cached_property
+    def _transport(self) -> HTTPTransport:
+        return HTTPTransport(limits=self._limits, http1=self._http1, http2=self.http2)
 
     @cached_property
     def client(self) -> Client:
         """Create and return the client instance for this TikaClient."""
-        return Client(base_url=self.tika_url, timeout=self.timeout, headers=self._default_headers)
+        mounts: dict[str, BaseTransport | None] = {
+            pattern: None if proxy is None else HTTPTransport(limits=self._limits, http2=self.http2, proxy=proxy)
+            for pattern, proxy in self._proxies.items()
+        }
+        client = Client(
+            base_url=self.tika_url,
+            timeout=self._timeout,
+            headers=self._default_headers,
+            trust_env=self.trust_env,
+            transport=SyncBalancingTransport(self._transport, self._node_pool, mounts),
+        )
+        self._start_health_checks()
+        return client
 
     @cached_property
     def metadata(self) -> SyncMetadata:
         """Access the Tika metadata route."""
-        return SyncMetadata(self.client, compress=self.compress)
+        return SyncMetadata(self.client, self._resource_config)
 
     @cached_property
     def tika(self) -> SyncTika:
         """Access the Tika tika route."""
-        return SyncTika(self.client, compress=self.compress)
+        return SyncTika(self.client, self._resource_config)
 
     @cached_property
     def rmeta(self) -> SyncRecursive:
         """Access the Tika recursive metadata route."""
-        return SyncRecursive(self.client, compress=self.compress)
+        return SyncRecursive(self.client, self._resource_config)
 
 
 class AsyncTikaClient(AbstractAsyncContextManager["AsyncTikaClient"], BaseTikaClient[AsyncClient, AsyncResource]):
@@ -148,23 +482,84 @@ class AsyncTikaClient(AbstractAsyncContextManager["AsyncTikaClient"], BaseTikaCl
     ) -> None:
         """Exit the TikaClient context and perform cleanup."""
         await self.client.aclose()
+        # Joining the probe thread may wait on an in progress probe
+        await run_sync(self._stop_health_checks)
+
+    def hedging_stats(self) -> HedgingStats | None:
+        """
+        Report how many hedged requests were sent and how many of them finished first.
+
+        Returns:
+            A snapshot of the hedging counters, or None if the client does not hedge
+
+        """
+        hedger = self._resource_config.hedger
+        return hedger.stats() if hedger is not None else None
+
+    def batch(
+        self,
+        fn: Callable[[Path], Awaitable[V]],
+        paths: Iterable[Path] | AsyncIterable[Path],
+        *,
+        max_concurrency: int = 10,
+        ordered: bool = False,
+        window: int | None = None,
+    ) -> AbstractAsyncContextManager[AsyncIterator[BatchResult[V]]]:
+        """
+        Send many files with bounded concurrency.
+
+        A failed file does not abort the batch, its exception is returned in its result instead.  Leaving the context
+        early cancels the requests still running.
+
+            async with client.batch(client.metadata.from_file, paths, max_concurrency=8) as results:
+                async for item in results:
+                    ...
+
+        Args:
+            fn: Sends a single file, for example `client.metadata.from_file`
+            paths: The files to send, an iterable or async iterable which is consumed as capacity frees up
+            max_concurrency: The most requests in flight at once
+            ordered: Whether to yield results in input order instead of as they complete
+            window: When ordered, the most files started but not yet yielded, defaults to twice max_concurrency
+
+        Returns:
+            A context yielding an async iterator of the results
+
+        """
+        return run_batch(fn, paths, max_concurrency=max_concurrency, ordered=ordered, window=window)
+
+    @cached_property
+    def _transport(self) -> AsyncHTTPTransport:
+        return AsyncHTTPTransport(limits=self._limits, http1=self._http1, http2=self.http2)
 
     @cached_property
     def client(self) -> AsyncClient:
         """Create and return the client instance for this TikaClient."""
-        return AsyncClient(base_url=self.tika_url, timeout=self.timeout, headers=self._default_headers)
+        mounts: dict[str, AsyncBaseTransport | None] = {
+            pattern: None if proxy is None else AsyncHTTPTransport(limits=self._limits, http2=self.http2, proxy=proxy)
+            for pattern, proxy in self._proxies.items()
+        }
+        client = AsyncClient(
+            base_url=self.tika_url,
+            timeout=self._timeout,
+            headers=self._default_headers,
+            trust_env=self.trust_env,
+            transport=AsyncBalancingTransport(self._transport, self._node_pool, mounts),
+        )
+        self._start_health_checks()
+        return client
 
     @cached_property
     def metadata(self) -> AsyncMetadata:
         """Access the Tika metadata route."""
-        return AsyncMetadata(self.client, compress=self.compress)
+        return AsyncMetadata(self.client, self._resource_config)
 
     @cached_property
     def tika(self) -> AsyncTika:
         """Access the Tika tika route."""
-        return AsyncTika(self.client, compress=self.compress)
+        return AsyncTika(self.client, self._resource_config)
 
     @cached_property
     def rmeta(self) -> AsyncRecursive:
         """Access the Tika recursive metadata route."""
-        return AsyncRecursive(self.client, compress=self.compress)
+        return AsyncRecursive(self.client, self._resource_config)
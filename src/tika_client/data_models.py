@@ -8,7 +8,20 @@ from datetime import datetime
 from datetime import timedelta
 from datetime import timezone
 from enum import Enum
+from functools import lru_cache
+from typing import TYPE_CHECKING
 from typing import Any
+from typing import Generic
+from typing import TypeVar
+from typing import overload
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+_T = TypeVar("_T")
+
+# Marks a lazily converted field which has not been read yet
+_UNSET: Any = object()
 
 # Based on https://cwiki.apache.org/confluence/display/TIKA/Metadata+Overview
 
@@ -24,6 +37,81 @@ _TIME_RE = re.compile(
     r"(?P<timezone>[zZ]|[+-]\d{2}:\d{2})?",
 )
 
+# The shapes Tika normally sends, which datetime.fromisoformat parses exactly as _TIME_RE would, on every supported
+# Python.  Newer versions of fromisoformat accept more, such as week dates, so anything else goes through _TIME_RE
+_ISO_FAST_RE = re.compile(
+    r"[0-9]{4}-[0-9]{2}-[0-9]{2}"
+    r"[T ]"
+    r"[0-9]{2}:[0-9]{2}:[0-9]{2}"
+    r"(?:\.[0-9]{3}(?:[0-9]{3})?)?"
+    r"(?:[zZ]|[+-][0-9]{2}:[0-9]{2})?",
+)
+
+
+@lru_cache(maxsize=256)
+def _tzinfo(offset: str) -> timezone:
+    """Return the timezone for a +HH:MM or -HH:MM offset, shared by every datetime with that offset."""
+    multi = -1 if offset[0:1] == "-" else 1
+    delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:])) * multi
+    return timezone(delta)
+
+
+def _parse_datetime(date_str: str) -> datetime | None:
+    if _ISO_FAST_RE.fullmatch(date_str):
+        # Python 3.10 does not know the Z suffix
+        if date_str[-1] in "zZ":
+            date_str = date_str[:-1] + "+00:00"
+        return datetime.fromisoformat(date_str)
+
+    m = _TIME_RE.match(date_str)
+    if not m:
+        return None
+
+    (year, month, day, hour, minute, second, frac_sec, timezone_str) = m.groups()
+
+    # Parse fractional seconds without float conversion to avoid precision loss
+    if frac_sec is not None:
+        # Remove the leading dot and pad/truncate to 6 digits
+        frac_str = frac_sec[1:]  # Remove the '.'
+        frac_str = frac_str.ljust(6, "0")[:6]  # Pad with zeros or truncate to 6 digits
+        microseconds = int(frac_str)
+    else:
+        microseconds = 0
+
+    tzinfo = None
+    if timezone_str is not None:
+        tzinfo = timezone.utc if timezone_str.lower() == "z" else _tzinfo(timezone_str)
+
+    return datetime(
+        year=int(year),
+        month=int(month),
+        day=int(day),
+        hour=int(hour),
+        minute=int(minute),
+        second=int(second),
+        microsecond=microseconds,
+        tzinfo=tzinfo,
+    )
+
+
+# Swapped for a memoized version by set_datetime_cache_size
+_parse: Callable[[str], datetime | None] = _parse_datetime
+
+
+def set_datetime_cache_size(maxsize: int) -> None:
+    """
+    Memoize parsed datetime strings, shared by every response.
+
+    Bulk exports repeat the same timestamps often, such as every attachment of one mail.  The cache is off by default,
+    and setting a new size empties it.  The parsed datetimes are immutable, so sharing them is safe.
+
+    Args:
+        maxsize: How many distinct strings to keep, least recently used dropped first.  0 turns the cache off
+
+    """
+    global _parse  # noqa: PLW0603
+    _parse = lru_cache(maxsize=maxsize)(_parse_datetime) if maxsize > 0 else _parse_datetime
+
 
 class TikaKey(str, Enum):
     """
@@ -88,6 +176,45 @@ class OtherTikaKeys(str, Enum):
     Language = "language"
 
 
+class _cached_slot(Generic[_T]):  # noqa: N801
+    """
+    Like functools.cached_property, but storing the value in a slot, for classes without an instance __dict__.
+
+    The owning class must list the slot, named as the property with a leading underscore, in its __slots__, and set
+    it to _UNSET on construction.  Checking for the marker is much cheaper than catching the AttributeError of an
+    empty slot.
+    """
+
+    def __init__(self, func: Callable[[Any], _T]) -> None:
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.slot = getattr(owner, f"_{name}")
+
+    @overload
+    def __get__(self, instance: None, owner: type | None = None) -> _cached_slot[_T]: ...
+
+    @overload
+    def __get__(self, instance: object, owner: type | None = None) -> _T: ...
+
+    def __get__(self, instance: object | None, owner: type | None = None) -> _cached_slot[_T] | _T:
+        if instance is None:
+            return self
+        value: _T = self.slot.__get__(instance, owner)
+        if value is _UNSET:
+            value = self.func(instance)
+            self.slot.__set__(instance, value)
+        return value
+
+    def __set__(self, instance: object, value: _T) -> None:
+        self.slot.__set__(instance, value)
+
+
+def _optional_int(value: str | None) -> int | None:
+    return int(value) or None if value is not None else None
+
+
 class TikaResponse:
     """
     A basic wrapper class for the JSON data returned from the Tika server.
@@ -95,9 +222,29 @@ class TikaResponse:
     It sets fields which the response always appears to have, and some small helpers for getting and converting
     other data types, including handling the chance those don't exist in the response.
 
+    Only the type and parsers are read up front.  The other fields are converted from the data when first accessed,
+    then kept, so a response which is only read for its content never parses its dates.
+
     All returned data is available in the decoded JSON form under the .data attribute
     """
 
+    __slots__ = (
+        "_character_count",
+        "_content",
+        "_content_length",
+        "_created",
+        "_language",
+        "_last_author",
+        "_modified",
+        "_page_count",
+        "_revision",
+        "_title",
+        "_xmp_created",
+        "data",
+        "parsers",
+        "type",
+    )
+
     def __init__(self, data: dict[str | TikaKey | DublinCoreKey | XmpKey | OtherTikaKeys, Any]) -> None:
         """Construct a TikaResponse using the provided JSON data from a Tika server."""
         self.data = data
@@ -106,24 +253,79 @@ class TikaResponse:
         self.type: str = self.data[TikaKey.ContentType]
         self.parsers: list[str] = self.data[TikaKey.Parsers]
 
-        # Tika keys
-        self.content: str | None = data.get(TikaKey.Content)
-        self.content_length: int | None = int(self.data.get(TikaKey.ContentLength, "0")) or None
-
-        # Dublin Core keys
-        self.created: datetime | None = self.parse_datetime_string(self.data.get(DublinCoreKey.Created))
-        self.modified: datetime | None = self.parse_datetime_string(self.data.get(DublinCoreKey.Modified))
-        self.title: str | None = self.data.get(DublinCoreKey.Title)
-
-        # Xmp keys
-        self.xmp_created: datetime | None = self.parse_datetime_string(self.data.get(XmpKey.Created))
-        self.page_count: int | None = int(self.data.get(XmpKey.NumPages, "0")) or None
-
-        # Other general keys
-        self.character_count: int | None = int(self.data.get(OtherTikaKeys.CharacterCount, "0")) or None
-        self.revision: int | None = int(self.data.get(OtherTikaKeys.Revision, "0")) or None
-        self.language: str | None = self.data.get(OtherTikaKeys.Language)
-        self.last_author: str | None = self.data.get(OtherTikaKeys.LastAuthor)
+        # Converted from the data on first access
+        self._content = self._content_length = _UNSET
+        self._created = self._modified = self._title = _UNSET
+        self._xmp_created = self._page_count = _UNSET
+        self._character_count = self._revision = self._language = self._last_author = _UNSET
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        """Pickle the data and the fields already converted, leaving the rest to convert after unpickling."""
+        converted = {
+            name: value
+            for name in TikaResponse.__slots__
+            if name.startswith("_") and (value := getattr(self, name)) is not _UNSET
+        }
+        return (self.__class__, (self.data,), (None, converted))
+
+    # Tika keys
+    @_cached_slot
+    def content(self) -> str | None:
+        """Return the extracted content, if any."""
+        return self.data.get(TikaKey.Content)
+
+    @_cached_slot
+    def content_length(self) -> int | None:
+        """Return the length of the document in bytes, if known."""
+        return _optional_int(self.data.get(TikaKey.ContentLength))
+
+    # Dublin Core keys
+    @_cached_slot
+    def created(self) -> datetime | None:
+        """Return when the document was created, according to its Dublin Core metadata."""
+        return self.parse_datetime_string(self.data.get(DublinCoreKey.Created))
+
+    @_cached_slot
+    def modified(self) -> datetime | None:
+        """Return when the document was last modified."""
+        return self.parse_datetime_string(self.data.get(DublinCoreKey.Modified))
+
+    @_cached_slot
+    def title(self) -> str | None:
+        """Return the document's title."""
+        return self.data.get(DublinCoreKey.Title)
+
+    # Xmp keys
+    @_cached_slot
+    def xmp_created(self) -> datetime | None:
+        """Return when the document was created, according to its XMP metadata."""
+        return self.parse_datetime_string(self.data.get(XmpKey.Created))
+
+    @_cached_slot
+    def page_count(self) -> int | None:
+        """Return the number of pages, if known."""
+        return _optional_int(self.data.get(XmpKey.NumPages))
+
+    # Other general keys
+    @_cached_slot
+    def character_count(self) -> int | None:
+        """Return the number of characters, if known."""
+        return _optional_int(self.data.get(OtherTikaKeys.CharacterCount))
+
+    @_cached_slot
+    def revision(self) -> int | None:
+        """Return the document's revision number, if known."""
+        return _optional_int(self.data.get(OtherTikaKeys.Revision))
+
+    @_cached_slot
+    def language(self) -> str | None:
+        """Return the language of the document, if detected."""
+        return self.data.get(OtherTikaKeys.Language)
+
+    @_cached_slot
+    def last_author(self) -> str | None:
+        """Return who last modified the document."""
+        return self.data.get(OtherTikaKeys.LastAuthor)
 
     @staticmethod
     def parse_datetime_string(
@@ -132,47 +334,11 @@ class TikaResponse:
         """
         If present, attempts to parse the given key as an ISO-8061 format datetime, including timezone handling.
 
-        If not present, return None
+        If not present, return None.  The common shapes are parsed by datetime.fromisoformat, others by a regex
         """
         if not date_str:
             return None
-
-        m = _TIME_RE.match(date_str)
-        if not m:
-            return None
-
-        (year, month, day, hour, minute, second, frac_sec, timezone_str) = m.groups()
-
-        # Parse fractional seconds without float conversion to avoid precision loss
-        if frac_sec is not None:
-            # Remove the leading dot and pad/truncate to 6 digits
-            frac_str = frac_sec[1:]  # Remove the '.'
-            frac_str = frac_str.ljust(6, "0")[:6]  # Pad with zeros or truncate to 6 digits
-            microseconds = int(frac_str)
-        else:
-            microseconds = 0
-
-        tzinfo = None
-        if timezone_str is not None:
-            if timezone_str.lower() == "z":
-                tzinfo = timezone.utc
-            else:
-                multi = -1 if timezone_str[0:1] == "-" else 1
-                hours = int(timezone_str[1:3])
-                minutes = int(timezone_str[4:])
-                delta = timedelta(hours=hours, minutes=minutes) * multi
-                tzinfo = timezone(delta)
-
-        return datetime(
-            year=int(year),
-            month=int(month),
-            day=int(day),
-            hour=int(hour),
-            minute=int(minute),
-            second=int(second),
-            microsecond=microseconds,
-            tzinfo=tzinfo,
-        )
+        return _parse(date_str)
 
     def __repr__(self) -> str:  # pragma: no cover
         """Representation of this class."""
@@ -8,10 +8,18 @@ from pytest_docker.plugin import Services
 
 from tika_client.client import AsyncTikaClient
 from tika_client.client import TikaClient
+from tika_client.data_models import TikaKey
 
 logger = logging.getLogger("tika-client.tests")
 
 
+def ok_json(content: str = "content") -> dict[str, object]:
+    """
+    A minimal successful Tika JSON response, for tests which mock the server
+    """
+    return {TikaKey.ContentType: "test", TikaKey.Parsers: [], TikaKey.Content: content}
+
+
 @pytest.fixture(scope="session")
 def docker_compose_file() -> Path:
     return Path(__file__).parent / "docker" / "docker-compose.ci-test.yml"
@@ -40,6 +48,14 @@ def tika_host(docker_services: Services, docker_ip: str) -> str:
     return url
 
 
+@pytest.fixture(scope="session")
+def stub_tika_url() -> str:
+    """
+    A server URL which is never contacted, for tests which mock every response
+    """
+    return "http://tika.invalid:9998"
+
+
 @pytest.fixture(scope="session")
 def samples_dir() -> Path:
     return Path(__file__).parent.resolve() / "samples"
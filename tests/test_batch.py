@@ -0,0 +1,247 @@
+import threading
+import time
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import anyio
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+from tika_client.data_models import TikaKey
+
+PATHS = [Path(f"file-{index}.pdf") for index in range(20)]
+
+
+class Tracker:
+    """
+    Stands in for a resource method, recording how many calls run at once
+    """
+
+    def __init__(self) -> None:
+        self.in_flight = 0
+        self.peak = 0
+        self.started = 0
+
+    async def __call__(self, path: Path) -> str:
+        self.started += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later files finish first, so completion order differs from input order
+            await anyio.sleep(0.001 * (len(PATHS) - int(path.stem.split("-")[1])))
+            if path.stem == "file-3":
+                msg = "broken file"
+                raise ValueError(msg)
+            return path.stem
+        finally:
+            self.in_flight -= 1
+
+
+class ThreadTracker:
+    """
+    The thread based version of the Tracker
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.in_flight = 0
+        self.peak = 0
+        self.started = 0
+
+    def __call__(self, path: Path) -> str:
+        with self.lock:
+            self.started += 1
+            self.in_flight += 1
+            self.peak = max(self.peak, self.in_flight)
+        try:
+            time.sleep(0.001 * (len(PATHS) - int(path.stem.split("-")[1])))
+            if path.stem == "file-3":
+                msg = "broken file"
+                raise ValueError(msg)
+            return path.stem
+        finally:
+            with self.lock:
+                self.in_flight -= 1
+
+
+class TestAsyncBatch:
+    async def test_bounded_concurrency(self, stub_tika_url: str) -> None:
+        """
+        Test every path is processed with no more than max_concurrency in flight
+        """
+        tracker = Tracker()
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.batch(
+                tracker,
+                PATHS,
+                max_concurrency=4,
+            ) as results,
+        ):
+            collected = [item async for item in results]
+
+        assert tracker.peak == 4
+        assert sorted(item.index for item in collected) == list(range(len(PATHS)))
+
+    async def test_errors_per_item(self, stub_tika_url: str) -> None:
+        """
+        Test a failing item is returned with its error, without aborting the batch
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client, client.batch(Tracker(), PATHS) as results:
+            collected = {item.index: item async for item in results}
+
+        failed = collected.pop(3)
+        assert not failed.ok
+        assert isinstance(failed.error, ValueError)
+        assert failed.result is None
+        assert all(item.ok and item.result == item.path.stem for item in collected.values())
+
+    async def test_ordered(self, stub_tika_url: str) -> None:
+        """
+        Test ordered results follow the input order, with a bounded number of files started ahead
+        """
+        tracker = Tracker()
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.batch(
+                tracker,
+                PATHS,
+                max_concurrency=4,
+                ordered=True,
+                window=6,
+            ) as results,
+        ):
+            indexes = []
+            async for item in results:
+                indexes.append(item.index)
+                assert tracker.started - len(indexes) <= 6
+
+        assert indexes == list(range(len(PATHS)))
+
+    async def test_async_iterable(self, stub_tika_url: str) -> None:
+        """
+        Test paths can come from an async iterable
+        """
+
+        async def produce() -> AsyncIterator[Path]:
+            for path in PATHS[:5]:
+                yield path
+
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.batch(
+                Tracker(),
+                produce(),
+                ordered=True,
+            ) as results,
+        ):
+            assert [item.path async for item in results] == PATHS[:5]
+
+    async def test_early_exit_cancels(self, stub_tika_url: str) -> None:
+        """
+        Test leaving the context early stops starting new files
+        """
+        tracker = Tracker()
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            async with client.batch(tracker, PATHS, max_concurrency=2) as results:
+                async for _ in results:
+                    break
+            assert tracker.started < len(PATHS)
+            assert tracker.in_flight == 0
+
+    async def test_invalid_concurrency(self, stub_tika_url: str) -> None:
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            with pytest.raises(ValueError, match="max_concurrency"):
+                async with client.batch(Tracker(), PATHS, max_concurrency=0):
+                    pass  # pragma: no cover
+
+    async def test_batch_resource(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+        sample_doc_file: Path,
+    ) -> None:
+        """
+        Test a batch over a real resource method
+        """
+        httpx_mock.add_response(json={TikaKey.ContentType: "test", TikaKey.Parsers: []}, is_reusable=True)
+
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.batch(
+                client.metadata.from_file,
+                [sample_docx_file, sample_doc_file],
+                ordered=True,
+            ) as results,
+        ):
+            collected = [item async for item in results]
+
+        assert [item.path for item in collected] == [sample_docx_file, sample_doc_file]
+        assert all(item.result is not None and item.result.type == "test" for item in collected)
+
+
+class TestSyncBatch:
+    def test_submit(self, stub_tika_url: str) -> None:
+        """
+        Test a call submitted to the thread pool returns a future of its result
+        """
+        with TikaClient(tika_url=stub_tika_url) as client:
+            future = client.submit(ThreadTracker(), PATHS[0])
+            assert future.result() == "file-0"
+
+    def test_map_ordered(self, stub_tika_url: str) -> None:
+        """
+        Test map yields every result in input order, using up to the configured workers
+        """
+        tracker = ThreadTracker()
+        with TikaClient(tika_url=stub_tika_url, workers=4) as client:
+            collected = list(client.map(tracker, PATHS))
+
+        assert [item.index for item in collected] == list(range(len(PATHS)))
+        assert tracker.peak == 4
+        failed = collected[3]
+        assert isinstance(failed.error, ValueError)
+        assert all(item.result == item.path.stem for item in collected if item.ok)
+
+    def test_map_unordered(self, stub_tika_url: str) -> None:
+        """
+        Test unordered map yields every result as it completes
+        """
+        with TikaClient(tika_url=stub_tika_url, workers=4) as client:
+            collected = list(client.map(ThreadTracker(), PATHS, ordered=False))
+
+        indexes = [item.index for item in collected]
+        assert sorted(indexes) == list(range(len(PATHS)))
+        assert indexes != list(range(len(PATHS)))
+
+    def test_map_bounded(self, stub_tika_url: str) -> None:
+        """
+        Test map does not submit more than max_in_flight files ahead of the consumer
+        """
+        tracker = ThreadTracker()
+        with TikaClient(tika_url=stub_tika_url, workers=2) as client:
+            results = client.map(tracker, PATHS, max_in_flight=3)
+            next(results)
+            time.sleep(0.05)
+            assert tracker.started <= 3
+            results.close()
+
+    def test_map_resource(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+        sample_doc_file: Path,
+    ) -> None:
+        """
+        Test threads share the client for a real resource method
+        """
+        httpx_mock.add_response(json={TikaKey.ContentType: "test", TikaKey.Parsers: []}, is_reusable=True)
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            collected = list(client.map(client.metadata.from_file, [sample_docx_file, sample_doc_file]))
+
+        assert all(item.result is not None and item.result.type == "test" for item in collected)
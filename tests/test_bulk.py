@@ -0,0 +1,101 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+
+from tika_client._bulk import BulkEndpoint
+from tika_client._bulk import _portable
+from tika_client._bulk import bulk_extract
+from tika_client.data_models import TikaKey
+
+
+class _Handler(BaseHTTPRequestHandler):
+    def do_POST(self) -> None:
+        upload = self.rfile.read(int(self.headers.get("Content-Length", "0")))
+        if b'filename="broken.txt"' in upload:
+            self.send_response(500)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        document = {TikaKey.ContentType: "text/plain", TikaKey.Parsers: [], TikaKey.Content: self.path}
+        body = json.dumps([document, document] if self.path.startswith("/rmeta") else document).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+
+@pytest.fixture(scope="module")
+def local_tika_url() -> Iterator[str]:
+    """
+    A real local server, since mocked responses do not reach worker processes
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def text_files(tmp_path: Path) -> list[Path]:
+    files = []
+    for name in ("a.txt", "b.txt", "broken.txt", "c.txt"):
+        path = tmp_path / name
+        path.write_text(name)
+        files.append(path)
+    return files
+
+
+class TestBulkExtract:
+    def test_bulk_text(self, local_tika_url: str, text_files: list[Path]) -> None:
+        """
+        Test files are extracted by worker processes, in order, with per file errors
+        """
+        missing = text_files[0].parent / "missing.txt"
+
+        results = list(bulk_extract(local_tika_url, [*text_files, missing], processes=2))
+
+        assert [item.path for item in results] == [*text_files, missing]
+        assert [item.ok for item in results] == [True, True, False, True, False]
+        assert isinstance(results[2].error, RuntimeError)
+        assert "HTTPStatusError" in str(results[2].error)
+        assert isinstance(results[4].error, FileNotFoundError)
+        first = results[0].result
+        assert not isinstance(first, list)
+        assert first is not None
+        assert first.type == "text/plain"
+        assert first.content == "/tika/form/text"
+
+    def test_bulk_recursive(self, local_tika_url: str, text_files: list[Path]) -> None:
+        """
+        Test the recursive endpoints return a list of responses per file
+        """
+        results = list(
+            bulk_extract(local_tika_url, text_files[:1], endpoint=BulkEndpoint.RecursiveText, processes=1),
+        )
+
+        documents = results[0].result
+        assert isinstance(documents, list)
+        assert [document.content for document in documents] == ["/rmeta/form/text", "/rmeta/form/text"]
+
+    def test_portable_errors(self) -> None:
+        """
+        Test errors which cannot be rebuilt in the parent are replaced, and others kept
+        """
+        request = httpx.Request("PUT", "http://tika.invalid/tika")
+        status_error = httpx.HTTPStatusError("boom", request=request, response=httpx.Response(500, request=request))
+        not_found = FileNotFoundError("gone")
+
+        assert isinstance(_portable(status_error), RuntimeError)
+        assert _portable(not_found) is not_found
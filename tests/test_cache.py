@@ -0,0 +1,540 @@
+import itertools
+import os
+import pickle
+import threading
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client import CacheStats
+from tika_client import MemoryCache
+from tika_client import ResultCache
+from tika_client import UploadMode
+from tika_client import _base
+from tika_client import _cache
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+VERSION = "Apache Tika 3.2.0"
+
+
+@pytest.fixture
+def result_cache(tmp_path: Path) -> Iterator[ResultCache]:
+    cache = ResultCache(tmp_path / "cache.sqlite3")
+    yield cache
+    cache.close()
+
+
+@pytest.fixture
+def ticking_clock(monkeypatch: pytest.MonkeyPatch) -> None:
+    # Every use gets a distinct, later time, so the least recently used entry is never a tie
+    monkeypatch.setattr(_cache, "time", SimpleNamespace(time=itertools.count().__next__))
+
+
+@pytest.fixture
+def manual_clock(monkeypatch: pytest.MonkeyPatch) -> SimpleNamespace:
+    # Stands still until a test moves it forward
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(_cache, "time", SimpleNamespace(monotonic=lambda: clock.now))
+    return clock
+
+
+def mock_version(httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+    httpx_mock.add_response(
+        method="GET",
+        url=f"{stub_tika_url}/version",
+        match_headers={"Accept": "text/plain"},
+        text=VERSION,
+    )
+
+
+class TestResultCache:
+    def test_get_put(self, result_cache: ResultCache) -> None:
+        """
+        Test a stored response is returned and lookups are counted
+        """
+        assert result_cache.get("key") is None
+
+        result_cache.put("key", b'{"a": 1}')
+
+        assert result_cache.get("key") == b'{"a": 1}'
+        assert result_cache.stats() == CacheStats(hits=1, misses=1, stores=1, evictions=0, entries=1, size=8)
+
+    @pytest.mark.usefixtures("ticking_clock")
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """
+        Test the least recently used responses are dropped once the size limit is passed
+        """
+        cache = ResultCache(tmp_path / "cache.sqlite3", max_size=30)
+        cache.put("first", b"1" * 10)
+        cache.put("second", b"2" * 10)
+        cache.put("third", b"3" * 10)
+        assert cache.get("first") is not None
+
+        cache.put("fourth", b"4" * 10)
+
+        assert cache.get("second") is None
+        assert cache.get("first") is not None
+        assert cache.get("third") is not None
+        assert cache.get("fourth") is not None
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.size == 30
+
+    def test_too_large(self, tmp_path: Path) -> None:
+        """
+        Test a response larger than the whole cache is not stored
+        """
+        cache = ResultCache(tmp_path / "cache.sqlite3", max_size=4)
+
+        cache.put("key", b"12345")
+
+        assert cache.get("key") is None
+        assert cache.stats().stores == 0
+
+    def test_shared_database(self, result_cache: ResultCache) -> None:
+        """
+        Test another cache on the same file, as in another process, sees the stored responses
+        """
+        result_cache.put("key", b"value")
+
+        copy = pickle.loads(pickle.dumps(result_cache))  # noqa: S301
+
+        assert copy.get("key") == b"value"
+        copy.close()
+
+    def test_file_digest_remembered(self, result_cache: ResultCache, tmp_path: Path) -> None:
+        """
+        Test an unchanged file is not hashed again, and a changed one is
+        """
+        sample = tmp_path / "sample.txt"
+        sample.write_bytes(b"first")
+        digest = result_cache.file_digest(sample, 2)
+        assert digest == _cache.content_digest(b"first")
+
+        # Same size and modification time, so the remembered hash is trusted without reading the file
+        stat = sample.stat()
+        sample.write_bytes(b"other")
+        os.utime(sample, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        assert result_cache.file_digest(sample, 2) == digest
+
+        sample.write_bytes(b"changed")
+        assert result_cache.file_digest(sample, 2) == _cache.content_digest(b"changed")
+
+    def test_unusable_database(self, tmp_path: Path) -> None:
+        """
+        Test a database which cannot be opened acts as an empty cache
+        """
+        cache = ResultCache(tmp_path)
+
+        cache.put("key", b"value")
+
+        assert cache.get("key") is None
+        assert cache.stats().misses == 1
+
+    def test_key(self) -> None:
+        """
+        Test header names and order do not change the key, while their values and the server version do
+        """
+        key = _cache.cache_key("digest", "/tika", {"Content-Type": "text/plain", "X-Tika-Skip": "1"}, VERSION)
+
+        assert key == _cache.cache_key("digest", "/tika", {"x-tika-skip": "1", "content-type": "text/plain"}, VERSION)
+        assert key != _cache.cache_key("digest", "/tika", {"Content-Type": "text/csv", "X-Tika-Skip": "1"}, VERSION)
+        assert key != _cache.cache_key("digest", "/tika", {"Content-Type": "text/plain", "X-Tika-Skip": "1"}, "3.1")
+
+
+class TestMemoryCache:
+    def test_get_put(self) -> None:
+        """
+        Test a stored response is returned as is and lookups are counted
+        """
+        cache = MemoryCache()
+        value = {"a": 1}
+        assert cache.get("key") is None
+
+        cache.put("key", value, 8)
+
+        assert cache.get("key") is value
+        assert cache.stats() == CacheStats(hits=1, misses=1, stores=1, evictions=0, entries=1, size=8)
+
+    def test_evicts_least_recently_used(self) -> None:
+        """
+        Test the least recently used responses are dropped once their total size passes the limit
+        """
+        cache = MemoryCache(max_size=30)
+        cache.put("first", 1, 10)
+        cache.put("second", 2, 10)
+        cache.put("third", 3, 10)
+        assert cache.get("first") == 1
+
+        cache.put("fourth", 4, 20)
+
+        assert cache.get("second") is None
+        assert cache.get("third") is None
+        assert cache.get("first") == 1
+        assert cache.get("fourth") == 4
+        stats = cache.stats()
+        assert (stats.evictions, stats.entries, stats.size) == (2, 2, 30)
+
+    def test_replace(self) -> None:
+        """
+        Test storing a key again replaces its size instead of adding to it
+        """
+        cache = MemoryCache(max_size=30)
+        cache.put("key", 1, 20)
+        cache.put("key", 2, 25)
+
+        assert cache.get("key") == 2
+        assert cache.stats().size == 25
+        assert cache.stats().evictions == 0
+
+    def test_too_large(self) -> None:
+        """
+        Test a response larger than the whole cache is not stored
+        """
+        cache = MemoryCache(max_size=4)
+
+        cache.put("key", "value", 5)
+
+        assert cache.get("key") is None
+        assert cache.stats().stores == 0
+
+    def test_ttl(self, manual_clock: SimpleNamespace) -> None:
+        """
+        Test a response is no longer answered once it is older than the time to live
+        """
+        cache = MemoryCache(ttl=60)
+        cache.put("key", "value", 5)
+
+        manual_clock.now = 59.0
+        assert cache.get("key") == "value"
+        manual_clock.now = 60.0
+        assert cache.get("key") is None
+
+        stats = cache.stats()
+        assert (stats.evictions, stats.entries, stats.size) == (1, 0, 0)
+
+    def test_file_digest_remembered(self, tmp_path: Path) -> None:
+        """
+        Test an unchanged file is not hashed again, and a changed one is
+        """
+        cache = MemoryCache()
+        sample = tmp_path / "sample.txt"
+        sample.write_bytes(b"first")
+        hashed: list[Path] = []
+
+        def hasher(path: Path) -> str:
+            hashed.append(path)
+            return _cache.file_digest(path, 2)
+
+        assert cache.known_digest(sample) is None
+        digest = cache.file_digest(sample, hasher)
+        assert digest == _cache.content_digest(b"first")
+        assert cache.known_digest(sample) == digest
+        assert cache.file_digest(sample, hasher) == digest
+
+        sample.write_bytes(b"changed")
+        assert cache.known_digest(sample) is None
+        assert cache.file_digest(sample, hasher) == _cache.content_digest(b"changed")
+        assert hashed == [sample, sample]
+
+    def test_threads(self) -> None:
+        """
+        Test the size stays consistent while many threads store and look up responses
+        """
+        cache = MemoryCache(max_size=1000)
+
+        def work(thread: int) -> None:
+            for i in range(500):
+                cache.put(f"{thread}-{i % 50}", i, 7)
+                cache.get(f"{(thread + 1) % 8}-{i % 50}")
+
+        with ThreadPoolExecutor(8) as executor:
+            list(executor.map(work, range(8)))
+
+        stats = cache.stats()
+        assert stats.size == stats.entries * 7 <= 1000
+        assert stats.hits + stats.misses == 8 * 500
+
+    def test_copy_starts_empty(self) -> None:
+        """
+        Test a copy, as sent to another process, keeps the settings but not the responses
+        """
+        cache = MemoryCache(max_size=100, ttl=5)
+        cache.put("key", "value", 5)
+
+        copy = pickle.loads(pickle.dumps(cache))  # noqa: S301
+
+        assert (copy.max_size, copy.ttl) == (100, 5)
+        assert copy.get("key") is None
+
+
+class TestSyncClientCache:
+    def test_from_buffer(self, httpx_mock: HTTPXMock, stub_tika_url: str, result_cache: ResultCache) -> None:
+        """
+        Test the same content is only sent once, and a different mime type is a different result
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="PUT", match_headers={"Content-Type": "text/plain"}, json=ok_json("plain"))
+        httpx_mock.add_response(method="PUT", match_headers={"Content-Type": "text/csv"}, json=ok_json("csv"))
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            first = client.tika.as_text.from_buffer("content", "text/plain")
+            second = client.tika.as_text.from_buffer(b"content", "text/plain")
+            other = client.tika.as_text.from_buffer("content", "text/csv")
+            stats = client.cache_stats()
+
+        assert first.content == second.content == "plain"
+        assert other.content == "csv"
+        assert stats is not None
+        assert (stats.hits, stats.misses, stats.entries) == (1, 2, 2)
+
+    @pytest.mark.parametrize("upload_mode", [UploadMode.Multipart, UploadMode.Stream])
+    def test_from_file(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        result_cache: ResultCache,
+        sample_docx_file: Path,
+        upload_mode: UploadMode,
+    ) -> None:
+        """
+        Test a file is only sent once in either upload mode, and its copies are answered from the cache
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="POST" if upload_mode is UploadMode.Multipart else "PUT", json=ok_json())
+        copy = result_cache.path.parent / "copies" / sample_docx_file.name
+        copy.parent.mkdir()
+        copy.write_bytes(sample_docx_file.read_bytes())
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache, upload_mode=upload_mode) as client:
+            client.metadata.from_file(sample_docx_file)
+            client.metadata.from_file(sample_docx_file)
+            resp = client.metadata.from_file(copy)
+
+        assert resp.content == "content"
+        assert result_cache.stats().hits == 2
+
+    @pytest.mark.parametrize("upload_mode", [UploadMode.Multipart, UploadMode.Stream])
+    def test_file_names_separate(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        result_cache: ResultCache,
+        tmp_path: Path,
+        upload_mode: UploadMode,
+    ) -> None:
+        """
+        Test the same content under another name or extension is not answered from the cache, as Tika reports both
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(json=ok_json("html"))
+        httpx_mock.add_response(json=ok_json("text"))
+        httpx_mock.add_response(json=ok_json("other"))
+        names = ("a.html", "a.txt", "b.txt")
+        for name in names:
+            (tmp_path / name).write_text("<p>content</p>")
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache, upload_mode=upload_mode) as client:
+            contents = [client.tika.as_text.from_file(tmp_path / name).content for name in names]
+
+        assert contents == ["html", "text", "other"]
+        assert result_cache.stats().entries == 3
+
+    def test_endpoints_separate(self, httpx_mock: HTTPXMock, stub_tika_url: str, result_cache: ResultCache) -> None:
+        """
+        Test the same content sent to another endpoint is not answered from the cache
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(url=f"{stub_tika_url}/tika/text", json=ok_json("text"))
+        httpx_mock.add_response(url=f"{stub_tika_url}/tika", json=ok_json("<html/>"))
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            assert client.tika.as_text.from_buffer("content").content == "text"
+            assert client.tika.as_html.from_buffer("content").content == "<html/>"
+
+    def test_errors_not_cached(self, httpx_mock: HTTPXMock, stub_tika_url: str, result_cache: ResultCache) -> None:
+        """
+        Test a failed request is not cached, so the next call asks the server again
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="PUT", status_code=500)
+        httpx_mock.add_response(method="PUT", json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.tika.as_text.from_buffer("content")
+            assert client.tika.as_text.from_buffer("content").content == "content"
+
+    def test_version_unavailable(self, httpx_mock: HTTPXMock, stub_tika_url: str, result_cache: ResultCache) -> None:
+        """
+        Test requests still work, uncached, when the server version cannot be asked, which is not asked again soon
+        """
+        httpx_mock.add_response(method="GET", url=f"{stub_tika_url}/version", status_code=404)
+        httpx_mock.add_response(method="PUT", json=ok_json(), is_reusable=True)
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            client.tika.as_text.from_buffer("content")
+            client.tika.as_text.from_buffer("content")
+
+        assert len(httpx_mock.get_requests(method="GET")) == 1
+        assert len(httpx_mock.get_requests(method="PUT")) == 2
+        assert result_cache.stats().entries == 0
+
+    def test_version_asked_again(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        result_cache: ResultCache,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test the server version is asked again once the retry interval passed, and caching resumes
+        """
+        monkeypatch.setattr(_base, "VERSION_RETRY_INTERVAL", 0.0)
+        httpx_mock.add_response(method="GET", url=f"{stub_tika_url}/version", status_code=503)
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="PUT", json=ok_json(), is_reusable=True)
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            client.tika.as_text.from_buffer("content")
+            client.tika.as_text.from_buffer("content")
+            client.tika.as_text.from_buffer("content")
+
+        assert len(httpx_mock.get_requests(method="PUT")) == 2
+        assert result_cache.stats().hits == 1
+
+    def test_no_cache(self, stub_tika_url: str) -> None:
+        """
+        Test a client without a cache reports no cache statistics
+        """
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client.cache_stats() is None
+            assert client.memory_cache_stats() is None
+
+    def test_memory_only(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a memory cache alone answers a repeated file without sending it again
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="POST", json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, memory_cache=MemoryCache()) as client:
+            first = client.metadata.from_file(sample_docx_file)
+            second = client.metadata.from_file(sample_docx_file)
+            stats = client.memory_cache_stats()
+
+        assert first.content == second.content == "content"
+        assert stats is not None
+        assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+        # Sized by the body the server sent
+        assert stats.size == len(httpx.Response(200, json=ok_json()).content)
+
+    def test_memory_in_front(self, httpx_mock: HTTPXMock, stub_tika_url: str, result_cache: ResultCache) -> None:
+        """
+        Test the memory cache is asked before the result cache, and filled from it
+        """
+        # Once for each client
+        mock_version(httpx_mock, stub_tika_url)
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="PUT", json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            client.tika.as_text.from_buffer("content")
+        with TikaClient(tika_url=stub_tika_url, cache=result_cache, memory_cache=MemoryCache()) as client:
+            client.tika.as_text.from_buffer("content")
+            resp = client.tika.as_text.from_buffer("content")
+
+        assert resp.content == "content"
+        assert (result_cache.stats().hits, result_cache.stats().misses) == (1, 1)
+        stats = client.memory_cache_stats()
+        assert stats is not None
+        assert (stats.hits, stats.misses, stats.stores) == (1, 1, 1)
+
+
+class TestAsyncClientCache:
+    async def test_from_file(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        result_cache: ResultCache,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test the async client answers a repeated file from the cache, including recursive metadata
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(url=f"{stub_tika_url}/rmeta/form/text", json=[ok_json("parent"), ok_json("child")])
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            first = await client.rmeta.as_text.from_file(sample_docx_file)
+            second = await client.rmeta.as_text.from_file(sample_docx_file)
+
+        assert [doc.content for doc in second] == [doc.content for doc in first] == ["parent", "child"]
+        assert result_cache.stats().hits == 1
+
+    async def test_from_buffer(self, httpx_mock: HTTPXMock, stub_tika_url: str, result_cache: ResultCache) -> None:
+        """
+        Test the async client answers a repeated buffer from the cache
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(method="PUT", json=ok_json())
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, cache=result_cache) as client:
+            await client.tika.as_html.from_buffer("content")
+            resp = await client.tika.as_html.from_buffer("content")
+
+        assert resp.content == "content"
+        assert client.cache_stats() == result_cache.stats()
+
+    async def test_memory_from_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client answers a repeated file from memory, hashing it only once
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(url=f"{stub_tika_url}/rmeta/form/text", json=[ok_json("parent"), ok_json("child")])
+        memory_cache = MemoryCache()
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, memory_cache=memory_cache) as client:
+            first = await client.rmeta.as_text.from_file(sample_docx_file)
+            assert memory_cache.known_digest(sample_docx_file) is not None
+            second = await client.rmeta.as_text.from_file(sample_docx_file)
+
+        assert [doc.content for doc in second] == [doc.content for doc in first] == ["parent", "child"]
+        assert memory_cache.stats().hits == 1
+
+    async def test_file_signature_off_loop(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """
+        Test the async client never reads a file's size and modification time on the event loop, even when remembered
+        """
+        mock_version(httpx_mock, stub_tika_url)
+        httpx_mock.add_response(json=ok_json())
+        memory_cache = MemoryCache()
+        loop_thread = threading.current_thread()
+        signature_threads = []
+        signature = memory_cache._signature  # noqa: SLF001
+
+        def tracked_signature(filepath: Path) -> tuple[str, int, int]:
+            signature_threads.append(threading.current_thread())
+            return signature(filepath)
+
+        monkeypatch.setattr(memory_cache, "_signature", tracked_signature)
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, memory_cache=memory_cache) as client:
+            await client.metadata.from_file(sample_docx_file)
+            await client.metadata.from_file(sample_docx_file)
+
+        assert signature_threads
+        assert loop_thread not in signature_threads
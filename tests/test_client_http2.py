@@ -0,0 +1,53 @@
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+from tika_client.data_models import TikaKey
+
+
+class TestHttp2:
+    def test_http1_by_default(self, stub_tika_url: str) -> None:
+        """
+        Test the client only speaks HTTP/1.1 unless asked otherwise
+        """
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client._http1  # noqa: SLF001
+            assert not client.http2
+
+    def test_cleartext_uses_prior_knowledge(self, stub_tika_url: str) -> None:
+        """
+        Test a http:// URL disables HTTP/1.1 so h2c is spoken with prior knowledge
+        """
+        pytest.importorskip("h2")
+        with TikaClient(tika_url=stub_tika_url, http2=True) as client:
+            assert not client._http1  # noqa: SLF001
+
+    def test_tls_negotiates(self) -> None:
+        """
+        Test a https:// URL keeps HTTP/1.1 available for ALPN fallback
+        """
+        pytest.importorskip("h2")
+        with TikaClient(tika_url="https://tika.invalid", http2=True) as client:
+            assert client._http1  # noqa: SLF001
+
+
+class TestAsyncHttp2:
+    async def test_http2_request(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test requests are made normally when HTTP/2 is enabled
+        """
+        pytest.importorskip("h2")
+        httpx_mock.add_response(json={TikaKey.ContentType: "test", TikaKey.Parsers: []})
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, http2=True) as client:
+            resp = await client.metadata.from_file(sample_docx_file)
+
+        assert resp.type == "test"
@@ -0,0 +1,239 @@
+import json
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+from tika_client.data_models import TikaKey
+
+PROXY_VARIABLES = ("HTTP_PROXY", "HTTPS_PROXY", "ALL_PROXY", "NO_PROXY")
+
+
+class LocalServer:
+    """
+    A real local server, answering every request itself and remembering the paths it was asked for.  Also stands in
+    for a forward proxy, which is asked for absolute URLs
+    """
+
+    def __init__(self) -> None:
+        self.requested: list[str] = []
+        body = json.dumps({TikaKey.ContentType: "proxied", TikaKey.Parsers: []}).encode()
+        requested = self.requested
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keeps connections open between requests, for the pool to reuse
+            protocol_version = "HTTP/1.1"
+
+            def do_PUT(self) -> None:
+                self.rfile.read(int(self.headers.get("Content-Length", "0")))
+                requested.append(self.path)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args: object) -> None:
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+
+
+@pytest.fixture
+def local_server() -> Iterator[LocalServer]:
+    """
+    Runs a LocalServer for the test
+    """
+    server = LocalServer()
+    thread = threading.Thread(target=server.server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    yield server
+    server.server.shutdown()
+    server.server.server_close()
+
+
+@pytest.fixture
+def proxy_env(local_server: LocalServer, monkeypatch: pytest.MonkeyPatch) -> LocalServer:
+    """
+    Sets a LocalServer as the HTTP_PROXY of the environment
+    """
+    for name in PROXY_VARIABLES:
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.lower(), raising=False)
+    monkeypatch.setenv("HTTP_PROXY", local_server.url)
+    return local_server
+
+
+class TestConnectionPool:
+    def test_pool_limits_applied(self, stub_tika_url: str) -> None:
+        """
+        Test the pool sizing options are passed through to the transport and timeouts
+        """
+        with TikaClient(
+            tika_url=stub_tika_url,
+            max_connections=7,
+            max_keepalive_connections=3,
+            keepalive_expiry=1.5,
+            pool_timeout=2.0,
+        ) as client:
+            assert client.client.timeout.pool == 2.0
+            assert client.client.timeout.read == 30.0
+
+            stats = client.pool_stats()
+            assert stats.max_connections == 7
+            assert stats.max_keepalive_connections == 3
+            assert stats.connections == 0
+            assert stats.waiting == 0
+
+    def test_pool_timeout_defaults_to_timeout(self, stub_tika_url: str) -> None:
+        """
+        Test the pool acquire timeout follows the request timeout when not given
+        """
+        with TikaClient(tika_url=stub_tika_url, timeout=12.0) as client:
+            assert client.client.timeout.pool == 12.0
+
+    def test_pooled_client_requests(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test requests are still made through the configured transport
+        """
+        httpx_mock.add_response(json={TikaKey.ContentType: "test", TikaKey.Parsers: []})
+
+        with TikaClient(tika_url=stub_tika_url, max_connections=1) as client:
+            resp = client.metadata.from_file(sample_docx_file)
+
+        assert resp.type == "test"
+
+
+class TestPoolOccupancy:
+    def test_streamed_response_holds_connection(self, local_server: LocalServer) -> None:
+        """
+        Test pool_stats reports a connection as active while a streamed response is open, and idle after
+        """
+        with TikaClient(tika_url=local_server.url) as client:
+            with client.client.stream("PUT", "/tika/text", content=b"content") as resp:
+                assert resp.status_code == httpx.codes.OK
+
+                stats = client.pool_stats()
+                assert (stats.connections, stats.active, stats.idle, stats.waiting) == (1, 1, 0, 0)
+                # Only a fully read response hands its connection back for reuse
+                resp.read()
+
+            stats = client.pool_stats()
+            assert (stats.connections, stats.active, stats.idle, stats.waiting) == (1, 0, 1, 0)
+
+            # The idle connection is reused
+            assert client.tika.as_text.from_buffer("content").type == "proxied"
+            assert client.pool_stats().connections == 1
+
+    def test_exhausted_pool_times_out(self, local_server: LocalServer) -> None:
+        """
+        Test a request waiting on a full pool raises PoolTimeout after pool_timeout
+        """
+        with TikaClient(tika_url=local_server.url, max_connections=1, pool_timeout=0.05) as client:
+            with client.client.stream("PUT", "/tika/text", content=b"content"), pytest.raises(httpx.PoolTimeout):
+                client.tika.as_text.from_buffer("content")
+
+            # Released once the stream closes
+            assert client.tika.as_text.from_buffer("content").type == "proxied"
+            assert local_server.requested == ["/tika/text", "/tika/text"]
+
+    async def test_async_exhausted_pool(self, local_server: LocalServer) -> None:
+        """
+        Test the async pool reports its occupancy and times out once exhausted
+        """
+        async with AsyncTikaClient(tika_url=local_server.url, max_connections=1, pool_timeout=0.05) as client:
+            async with client.client.stream("PUT", "/tika/text", content=b"content") as resp:
+                stats = client.pool_stats()
+                assert (stats.connections, stats.active, stats.idle) == (1, 1, 0)
+
+                with pytest.raises(httpx.PoolTimeout):
+                    await client.tika.as_text.from_buffer("content")
+                await resp.aread()
+
+            stats = client.pool_stats()
+            assert (stats.connections, stats.active, stats.idle, stats.waiting) == (1, 0, 1, 0)
+
+
+class TestProxies:
+    def test_environment_proxy(self, proxy_env: LocalServer, stub_tika_url: str) -> None:
+        """
+        Test requests go through the proxy of the environment, for every balanced server
+        """
+        other_url = "http://tika-other.invalid:9998"
+        with TikaClient(tika_url=[stub_tika_url, other_url]) as client:
+            assert client.tika.as_text.from_buffer("content").type == "proxied"
+            assert client.tika.as_text.from_buffer("content").type == "proxied"
+
+        assert proxy_env.requested == [f"{stub_tika_url}/tika/text", f"{other_url}/tika/text"]
+
+    def test_no_proxy(self, proxy_env: LocalServer, monkeypatch: pytest.MonkeyPatch, stub_tika_url: str) -> None:
+        """
+        Test a server excluded by NO_PROXY is connected to directly
+        """
+        monkeypatch.setenv("NO_PROXY", httpx.URL(stub_tika_url).host)
+
+        with TikaClient(tika_url=stub_tika_url) as client, pytest.raises(httpx.ConnectError):
+            client.tika.as_text.from_buffer("content")
+
+        assert proxy_env.requested == []
+
+    def test_untrusted_environment(self, proxy_env: LocalServer, stub_tika_url: str) -> None:
+        """
+        Test the environment's proxies are ignored without trust_env
+        """
+        with TikaClient(tika_url=stub_tika_url, trust_env=False) as client, pytest.raises(httpx.ConnectError):
+            client.tika.as_text.from_buffer("content")
+
+        assert proxy_env.requested == []
+
+    async def test_async_environment_proxy(self, proxy_env: LocalServer, stub_tika_url: str) -> None:
+        """
+        Test the async client's requests go through the proxy of the environment
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            resp = await client.tika.as_text.from_buffer("content")
+
+        assert resp.type == "proxied"
+        assert proxy_env.requested == [f"{stub_tika_url}/tika/text"]
+
+
+class TestAsyncConnectionPool:
+    async def test_pool_limits_applied(self, stub_tika_url: str) -> None:
+        """
+        Test the pool sizing options are passed through to the async transport
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url, max_connections=None, pool_timeout=0.5) as client:
+            assert client.client.timeout.pool == 0.5
+
+            stats = client.pool_stats()
+            assert stats.max_connections is None
+            assert stats.active == 0
+            assert stats.idle == 0
+
+    async def test_pool_timeout_raised(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test pool exhaustion surfaces as the httpx PoolTimeout
+        """
+        httpx_mock.add_exception(httpx.PoolTimeout("No connection available"))
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            with pytest.raises(httpx.PoolTimeout):
+                await client.metadata.from_file(sample_docx_file)
@@ -0,0 +1,274 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client import CoalescingStats
+from tika_client import MemoryCache
+from tika_client._coalesce import Coalescer
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+CALLERS = 8
+
+
+def wait_for_coalesced(coalescer: Coalescer, count: int) -> None:
+    deadline = time.monotonic() + 5
+    while coalescer.stats().coalesced < count:
+        assert time.monotonic() < deadline, "the other calls never joined the request"
+        time.sleep(0.001)
+
+
+async def await_coalesced(coalescer: Coalescer, count: int) -> None:
+    with anyio.fail_after(5):
+        while coalescer.stats().coalesced < count:  # noqa: ASYNC110
+            await anyio.sleep(0.001)
+
+
+class TestCoalescer:
+    def test_overlapping_calls_share(self) -> None:
+        """
+        Test calls overlapping the first wait for its result instead of running their own
+        """
+        coalescer = Coalescer()
+        release = threading.Event()
+        runs = []
+
+        def fetch() -> str:
+            runs.append(1)
+            release.wait(5)
+            return "result"
+
+        with ThreadPoolExecutor(CALLERS) as executor:
+            futures = [executor.submit(coalescer.call, "key", fetch) for _ in range(CALLERS)]
+            wait_for_coalesced(coalescer, CALLERS - 1)
+            release.set()
+            results = [future.result() for future in futures]
+
+        assert results == ["result"] * CALLERS
+        assert runs == [1]
+        assert coalescer.stats() == CoalescingStats(sent=1, coalesced=CALLERS - 1)
+
+    def test_later_calls_run_again(self) -> None:
+        """
+        Test a call made after the first finished runs its own, nothing is cached
+        """
+        coalescer = Coalescer()
+
+        assert coalescer.call("key", lambda: 1) == 1
+        assert coalescer.call("key", lambda: 2) == 2
+        assert coalescer.stats() == CoalescingStats(sent=2, coalesced=0)
+
+    def test_error_shared(self) -> None:
+        """
+        Test the waiting calls receive the error of the shared call
+        """
+        coalescer = Coalescer()
+        release = threading.Event()
+
+        def fetch() -> str:
+            release.wait(5)
+            msg = "failed"
+            raise ValueError(msg)
+
+        with ThreadPoolExecutor(2) as executor:
+            futures = [executor.submit(coalescer.call, "key", fetch) for _ in range(2)]
+            wait_for_coalesced(coalescer, 1)
+            release.set()
+            for future in futures:
+                with pytest.raises(ValueError, match="failed"):
+                    future.result()
+
+        # The failed call is forgotten, the next one tries again
+        assert coalescer.call("key", lambda: "result") == "result"
+
+
+class TestSyncClientCoalescing:
+    def test_identical_calls(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test identical calls in flight at once send one request and each get the response
+        """
+        with TikaClient(tika_url=stub_tika_url, coalesce=True, workers=CALLERS) as client:
+            coalescer = client._resource_config.coalescer  # noqa: SLF001
+            assert coalescer is not None
+
+            def respond(_: httpx.Request) -> httpx.Response:
+                wait_for_coalesced(coalescer, CALLERS - 1)
+                return httpx.Response(200, json=ok_json())
+
+            httpx_mock.add_callback(respond, method="POST")
+
+            results = list(client.map(client.tika.as_text.from_file, [sample_docx_file] * CALLERS))
+            stats = client.coalescing_stats()
+
+        contents = []
+        for item in results:
+            assert item.result is not None
+            contents.append(item.result.content)
+        assert contents == ["content"] * CALLERS
+        assert len(httpx_mock.get_requests()) == 1
+        assert stats == CoalescingStats(sent=1, coalesced=CALLERS - 1)
+
+    def test_different_calls(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test calls with other content or another mime type are not coalesced
+        """
+        httpx_mock.add_response(method="PUT", json=ok_json(), is_reusable=True)
+
+        with TikaClient(tika_url=stub_tika_url, coalesce=True) as client:
+            client.tika.as_text.from_buffer("content", "text/plain")
+            client.tika.as_text.from_buffer("other", "text/plain")
+            client.tika.as_text.from_buffer("content", "text/csv")
+
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_other_file_names(self, httpx_mock: HTTPXMock, stub_tika_url: str, tmp_path: Path) -> None:
+        """
+        Test files with the same content under other names or extensions, in flight at once, are not coalesced
+        """
+        paths = [tmp_path / name for name in ("a.html", "a.txt", "b.txt")]
+        for path in paths:
+            path.write_text("<p>content</p>")
+        # Only returns once every file's request is in flight at the same time
+        barrier = threading.Barrier(len(paths), timeout=5)
+
+        def respond(request: httpx.Request) -> httpx.Response:
+            barrier.wait()
+            name = next(path.name for path in paths if f'filename="{path.name}"'.encode() in request.read())
+            return httpx.Response(200, json=ok_json(name))
+
+        httpx_mock.add_callback(respond, method="POST", is_reusable=True)
+
+        with TikaClient(tika_url=stub_tika_url, coalesce=True, workers=len(paths)) as client:
+            results = list(client.map(client.tika.as_text.from_file, paths))
+            stats = client.coalescing_stats()
+
+        contents = []
+        for item in results:
+            assert item.result is not None
+            contents.append(item.result.content)
+        assert contents == [path.name for path in paths]
+        assert stats == CoalescingStats(sent=len(paths), coalesced=0)
+
+    def test_with_memory_cache(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test coalescing without a server version still works alongside a cache which needs one
+        """
+        # Not asked again by the second call, the failure is remembered
+        httpx_mock.add_response(method="GET", url=f"{stub_tika_url}/version", status_code=404)
+        httpx_mock.add_response(method="POST", json=ok_json(), is_reusable=True)
+
+        with TikaClient(tika_url=stub_tika_url, coalesce=True, memory_cache=MemoryCache()) as client:
+            client.metadata.from_file(sample_docx_file)
+            client.metadata.from_file(sample_docx_file)
+            stats = client.coalescing_stats()
+
+        assert len(httpx_mock.get_requests(method="POST")) == 2
+        assert stats == CoalescingStats(sent=2, coalesced=0)
+
+    def test_not_coalescing(self, stub_tika_url: str) -> None:
+        """
+        Test a client which does not coalesce reports no coalescing statistics
+        """
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client.coalescing_stats() is None
+
+
+class TestAsyncClientCoalescing:
+    async def test_identical_calls(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test identical files uploaded at once send one request and each get the response
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url, coalesce=True) as client:
+            coalescer = client._resource_config.coalescer  # noqa: SLF001
+            assert coalescer is not None
+
+            async def respond(_: httpx.Request) -> httpx.Response:
+                await await_coalesced(coalescer, CALLERS - 1)
+                return httpx.Response(200, json=[ok_json("parent"), ok_json("child")])
+
+            httpx_mock.add_callback(respond, url=f"{stub_tika_url}/rmeta/form/text")
+            results = []
+
+            async def upload() -> None:
+                results.append(await client.rmeta.as_text.from_file(sample_docx_file))
+
+            async with anyio.create_task_group() as tg:
+                for _ in range(CALLERS):
+                    tg.start_soon(upload)
+            stats = client.coalescing_stats()
+
+        assert [[doc.content for doc in docs] for docs in results] == [["parent", "child"]] * CALLERS
+        assert len(httpx_mock.get_requests()) == 1
+        assert stats == CoalescingStats(sent=1, coalesced=CALLERS - 1)
+
+    async def test_error_shared(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test every identical call receives the error of the shared request
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url, coalesce=True) as client:
+            coalescer = client._resource_config.coalescer  # noqa: SLF001
+            assert coalescer is not None
+
+            async def respond(_: httpx.Request) -> httpx.Response:
+                await await_coalesced(coalescer, 1)
+                return httpx.Response(500)
+
+            httpx_mock.add_callback(respond, method="PUT")
+            errors = []
+
+            async def parse() -> None:
+                try:
+                    await client.tika.as_text.from_buffer("content")
+                except httpx.HTTPStatusError as err:
+                    errors.append(err)
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(parse)
+                tg.start_soon(parse)
+
+        assert len(errors) == 2
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_cancelled_request(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test a call waiting on a cancelled request sends its own instead of failing
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url, coalesce=True) as client:
+            coalescer = client._resource_config.coalescer  # noqa: SLF001
+            assert coalescer is not None
+
+            async def respond_never(_: httpx.Request) -> httpx.Response:
+                await anyio.sleep(5)
+                return httpx.Response(200, json=ok_json())  # pragma: no cover
+
+            httpx_mock.add_callback(respond_never, method="PUT")
+            httpx_mock.add_response(method="PUT", json=ok_json("second"))
+            first_scope = anyio.CancelScope()
+            results = []
+
+            async def cancelled() -> None:
+                with first_scope:
+                    await client.tika.as_text.from_buffer("content")
+
+            async def parse() -> None:
+                results.append(await client.tika.as_text.from_buffer("content"))
+
+            async with anyio.create_task_group() as tg:
+                tg.start_soon(cancelled)
+                with anyio.fail_after(5):
+                    while coalescer.stats().sent < 1:  # noqa: ASYNC110
+                        await anyio.sleep(0.001)
+                tg.start_soon(parse)
+                await await_coalesced(coalescer, 1)
+                first_scope.cancel()
+            stats = client.coalescing_stats()
+
+        assert [resp.content for resp in results] == ["second"]
+        assert stats == CoalescingStats(sent=2, coalesced=0)
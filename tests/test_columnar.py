@@ -0,0 +1,216 @@
+import sys
+from array import array
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from pathlib import Path
+
+import pytest
+
+from tika_client import RESPONSE_COLUMNS
+from tika_client import Column
+from tika_client import ColumnType
+from tika_client import ResponseColumns
+from tika_client.data_models import DublinCoreKey
+from tika_client.data_models import OtherTikaKeys
+from tika_client.data_models import TikaKey
+from tika_client.data_models import TikaResponse
+from tika_client.data_models import XmpKey
+
+FULL = {
+    TikaKey.ContentType: "application/pdf",
+    TikaKey.Parsers: ["org.apache.tika.parser.DefaultParser", "org.apache.tika.parser.pdf.PDFParser"],
+    TikaKey.Content: "content",
+    DublinCoreKey.Created: "2023-05-17T16:30:44+02:00",
+    DublinCoreKey.Creator: ["First Author", "Second Author"],
+    XmpKey.NumPages: "12",
+    "pdf:PDFVersion": "1.7",
+}
+SPARSE = {
+    TikaKey.ContentType: "text/plain",
+    TikaKey.Parsers: "org.apache.tika.parser.DefaultParser",
+    DublinCoreKey.Created: "not a date",
+    XmpKey.NumPages: "many",
+}
+
+COLUMNS = (
+    Column("type", TikaKey.ContentType),
+    Column("parsers", TikaKey.Parsers, ColumnType.TextList),
+    Column("created", DublinCoreKey.Created, ColumnType.Datetime),
+    Column("creator", DublinCoreKey.Creator),
+    Column("pages", XmpKey.NumPages, ColumnType.Integer),
+    "pdf:PDFVersion",
+)
+
+EXPECTED = {
+    "type": ["application/pdf", "text/plain"],
+    "parsers": [
+        ["org.apache.tika.parser.DefaultParser", "org.apache.tika.parser.pdf.PDFParser"],
+        ["org.apache.tika.parser.DefaultParser"],
+    ],
+    "created": [datetime(2023, 5, 17, 14, 30, 44, tzinfo=timezone.utc), None],
+    "creator": ["First Author", None],
+    "pages": [12, None],
+    "pdf:PDFVersion": ["1.7", None],
+}
+
+
+class TestArrayColumns:
+    def test_convert(self) -> None:
+        """
+        Test each column type converts, with missing and unconvertible values left out
+        """
+        columns = ResponseColumns(COLUMNS)
+        columns.add(TikaResponse(FULL))
+        columns.add(SPARSE)
+
+        arrays = columns.to_arrays()
+
+        assert len(columns) == 2
+        assert {name: column.to_pylist() for name, column in arrays.items()} == EXPECTED
+        pages = arrays["pages"].values
+        assert isinstance(pages, array)
+        assert pages.typecode == "q"
+        assert arrays["pages"].valid == bytearray([1, 0])
+
+    def test_datetime_microseconds(self) -> None:
+        """
+        Test datetimes are held as microseconds since the epoch, naive ones taken as UTC
+        """
+        columns = ResponseColumns([Column("created", DublinCoreKey.Created, ColumnType.Datetime)])
+        columns.extend(
+            [{DublinCoreKey.Created: "1970-01-01T00:00:01.5"}, {DublinCoreKey.Created: "1969-12-31T23:00:00-01:00"}],
+        )
+
+        created = columns.to_arrays()["created"]
+
+        assert list(created.values) == [1_500_000, 0]
+        assert created.to_pylist()[0] == datetime(1970, 1, 1, 0, 0, 1, 500000, tzinfo=timezone.utc)
+
+    def test_response_columns(self) -> None:
+        """
+        Test the default columns match the fields of TikaResponse
+        """
+        columns = ResponseColumns()
+        columns.add(FULL)
+
+        row = {name: column.to_pylist()[0] for name, column in columns.to_arrays().items()}
+        response = TikaResponse(FULL)
+
+        assert [column.name for column in RESPONSE_COLUMNS] == list(row)
+        assert row["created"] == response.created
+        assert row["page_count"] == response.page_count
+        assert row["parsers"] == response.parsers
+
+    def test_response_counts(self) -> None:
+        """
+        Test the default columns read a zero count as missing, as TikaResponse does
+        """
+        data = {
+            TikaKey.ContentType: "text/plain",
+            TikaKey.Parsers: ["org.apache.tika.parser.DefaultParser"],
+            TikaKey.ContentLength: "0",
+            XmpKey.NumPages: "3",
+            OtherTikaKeys.Revision: 0,
+        }
+        columns = ResponseColumns()
+        columns.add(data)
+
+        row = {name: column.to_pylist()[0] for name, column in columns.to_arrays().items()}
+        response = TikaResponse(data)
+
+        assert row["content_length"] is response.content_length is None
+        assert row["revision"] is response.revision is None
+        assert row["page_count"] == response.page_count == 3
+
+    def test_integers(self) -> None:
+        """
+        Test Integer columns keep zero, and leave out values which are not whole numbers rather than truncating them
+        """
+        columns = ResponseColumns([Column("number", "number", ColumnType.Integer)])
+        columns.extend({"number": value} for value in [0, "7", 3.0, 1.7, "1.7", float("inf"), float("nan"), True])
+
+        assert columns.to_arrays()["number"].to_pylist() == [0, 7, 3, None, None, None, None, None]
+
+    def test_duplicate_names(self) -> None:
+        """
+        Test two columns cannot share a name
+        """
+        with pytest.raises(ValueError, match="unique"):
+            ResponseColumns(["title", Column("title", DublinCoreKey.Title)])
+
+    def test_clear(self) -> None:
+        """
+        Test clearing drops the rows but keeps the columns
+        """
+        columns = ResponseColumns(COLUMNS)
+        columns.extend([FULL, SPARSE])
+
+        columns.clear()
+        columns.add(SPARSE)
+
+        assert len(columns) == 1
+        assert columns.to_arrays()["type"].to_pylist() == ["text/plain"]
+
+
+class TestArrow:
+    def test_to_arrow(self) -> None:
+        """
+        Test the Arrow table has typed columns holding the same values
+        """
+        pa = pytest.importorskip("pyarrow")
+        columns = ResponseColumns(COLUMNS)
+        columns.extend([FULL, SPARSE])
+
+        table = columns.to_arrow()
+
+        assert table.schema.field("pages").type == pa.int64()
+        assert table.schema.field("created").type == pa.timestamp("us", tz="UTC")
+        assert table.schema.field("parsers").type == pa.list_(pa.string())
+        assert table.column("pages").null_count == 1
+        assert table.to_pydict() == EXPECTED
+
+    def test_empty(self) -> None:
+        """
+        Test a table can be built before any row is added
+        """
+        pytest.importorskip("pyarrow")
+
+        table = ResponseColumns().to_arrow()
+
+        assert table.num_rows == 0
+        assert table.num_columns == len(RESPONSE_COLUMNS)
+
+    def test_write_parquet(self, tmp_path: Path) -> None:
+        """
+        Test the rows round trip through a Parquet file
+        """
+        parquet = pytest.importorskip("pyarrow.parquet")
+        columns = ResponseColumns(COLUMNS)
+        columns.extend([FULL, SPARSE])
+
+        columns.write_parquet(tmp_path / "export.parquet", compression="zstd")
+
+        assert parquet.read_table(tmp_path / "export.parquet").to_pydict() == EXPECTED
+
+    def test_missing_pyarrow(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test a clear error is raised when pyarrow is not installed
+        """
+        monkeypatch.setitem(sys.modules, "pyarrow", None)
+        columns = ResponseColumns(COLUMNS)
+
+        with pytest.raises(ImportError, match="arrow extra"):
+            columns.to_arrow()
+
+    def test_utc_offsets(self) -> None:
+        """
+        Test timestamps with an offset are stored as the same instant in UTC
+        """
+        pytest.importorskip("pyarrow")
+        columns = ResponseColumns([Column("created", DublinCoreKey.Created, ColumnType.Datetime)])
+        columns.add({DublinCoreKey.Created: "2023-05-17T16:30:44-08:00"})
+
+        created = columns.to_arrow().column("created")[0].as_py()
+
+        assert created == datetime(2023, 5, 17, 16, 30, 44, tzinfo=timezone(timedelta(hours=-8)))
@@ -0,0 +1,260 @@
+import gzip
+import os
+import random
+from pathlib import Path
+
+import anyio
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client import CompressionPolicy
+from tika_client import UploadMode
+from tika_client._compression import CompressionAdvisor
+from tika_client._compression import CompressionTally
+from tika_client._upload import gzip_chunks
+from tika_client._upload import iter_buffer_chunks
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+TEXT = "".join(random.choice("abcdefgh ") for _ in range(200_000))  # noqa: S311
+
+
+class TestGzipChunks:
+    def test_round_trip(self) -> None:
+        """
+        Test chunked compression produces a single valid gzip stream
+        """
+        content = TEXT.encode()
+
+        compressed = b"".join(gzip_chunks(iter_buffer_chunks(content, 1000), level=6))
+
+        assert gzip.decompress(compressed) == content
+        assert len(compressed) < len(content)
+
+    def test_level(self) -> None:
+        """
+        Test a higher level compresses smaller
+        """
+        content = TEXT.encode()
+
+        fastest = b"".join(gzip_chunks(iter_buffer_chunks(content, 1000), level=1))
+        smallest = b"".join(gzip_chunks(iter_buffer_chunks(content, 1000), level=9))
+
+        assert len(smallest) < len(fastest)
+
+
+class TestCompressionAdvisor:
+    def test_skips_compressed_types(self) -> None:
+        """
+        Test a known compressed format is skipped without sampling it
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(), level=6)
+
+        def sample() -> bytes:  # pragma: no cover
+            raise AssertionError
+
+        assert not advisor.decide(100_000, "image/jpeg", sample)
+        assert not advisor.decide(100_000, "video/mp4; codecs=avc1", sample)
+        assert advisor.stats().skipped == 2
+
+    def test_small_uncompressed(self) -> None:
+        """
+        Test content under the minimum size is neither compressed nor counted
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(min_size=100), level=6)
+
+        assert not advisor.decide(100, "text/plain", lambda: b"a" * 100)
+        assert advisor.stats().skipped == 0
+
+    def test_samples_ratio(self) -> None:
+        """
+        Test the sampled ratio decides for content of a type which is not known to be compressed
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(), level=6)
+
+        assert advisor.decide(100_000, "application/pdf", lambda: TEXT.encode()[:65536])
+        assert not advisor.decide(100_000, "application/pdf", lambda: os.urandom(65536))
+
+    def test_learns_per_type(self) -> None:
+        """
+        Test a type is no longer sampled once learned, except to re-sample now and then
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(learn_after=3, resample_every=10), level=6)
+        samples = 0
+
+        def sample() -> bytes:
+            nonlocal samples
+            samples += 1
+            return os.urandom(4096)
+
+        decisions = [advisor.decide(100_000, "application/x-custom", sample) for _ in range(20)]
+
+        assert not any(decisions)
+        # Three to learn, then the tenth and twentieth uploads
+        assert samples == 5
+
+    def test_unknown_type_always_sampled(self) -> None:
+        """
+        Test content without a type is sampled every time
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(learn_after=1), level=6)
+
+        assert not advisor.decide(100_000, None, lambda: os.urandom(4096))
+        assert advisor.decide(100_000, None, lambda: TEXT.encode()[:4096])
+
+    def test_stats(self) -> None:
+        """
+        Test compressed bytes and the CPU time of skipped uploads are counted
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(), level=6)
+        content = TEXT.encode()
+        tally = advisor.tally("text/plain")
+
+        compressed = b"".join(gzip_chunks(iter_buffer_chunks(content, 1000), level=6, tally=tally))
+        advisor.decide(len(content), "image/png")
+
+        stats = advisor.stats()
+        assert stats.compressed == 1
+        assert stats.bytes_in == len(content)
+        assert stats.bytes_out == len(compressed)
+        assert stats.bytes_saved == len(content) - len(compressed)
+        assert stats.cpu_seconds > 0
+        assert stats.cpu_seconds_saved > 0
+
+    def test_saved_cpu_excludes_samples(self) -> None:
+        """
+        Test the CPU time saved by skipping is estimated from compressing uploads, not samples
+        """
+        advisor = CompressionAdvisor(CompressionPolicy(), level=6)
+        advisor.record(CompressionTally(advisor, "text/plain", bytes_in=1000, bytes_out=100, cpu_seconds=1.0))
+        assert advisor.decide(100_000, "application/pdf", lambda: TEXT.encode()[:65536])
+        advisor.decide(2000, "image/png")
+
+        stats = advisor.stats()
+        assert stats.sample_bytes == 65536
+        assert stats.sample_cpu_seconds > 0
+        assert stats.cpu_seconds == pytest.approx(1.0 + stats.sample_cpu_seconds)
+        assert stats.cpu_seconds_saved == pytest.approx(2.0)
+
+
+class TestSyncCompression:
+    def test_buffer_streamed_gzip(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test a large buffer is sent as a chunked gzip stream
+        """
+        httpx_mock.add_response(json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, compress=True, compress_level=1) as client:
+            client.tika.as_text.from_buffer(TEXT)
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert request.headers["Transfer-Encoding"] == "chunked"
+        assert "Content-Length" not in request.headers
+        assert gzip.decompress(request.read()) == TEXT.encode()
+
+    def test_small_buffer_uncompressed(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test a small buffer is not worth compressing
+        """
+        httpx_mock.add_response(json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, compress=True) as client:
+            client.tika.as_text.from_buffer("tiny")
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert "Content-Encoding" not in request.headers
+        assert request.read() == b"tiny"
+
+    def test_compressed_type_uncompressed(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test a buffer of an already compressed format is sent as is
+        """
+        httpx_mock.add_response(json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, compress=True) as client:
+            client.tika.as_text.from_buffer(TEXT, mime_type="application/zip")
+            stats = client.compression_stats()
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert "Content-Encoding" not in request.headers
+        assert stats is not None
+        assert stats.skipped == 1
+
+    def test_no_stats_without_compression(self, stub_tika_url: str) -> None:
+        """
+        Test a client which does not compress has no compression statistics
+        """
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client.compression_stats() is None
+
+    def test_stream_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, tmp_path: Path) -> None:
+        """
+        Test a streamed file upload is compressed
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/tika/text", json=ok_json())
+        document = tmp_path / "document.txt"
+        document.write_text(TEXT)
+
+        with TikaClient(tika_url=stub_tika_url, compress=True, upload_mode=UploadMode.Stream) as client:
+            client.tika.as_text.from_file(document)
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(request.read()) == TEXT.encode()
+
+
+class TestAsyncCompression:
+    async def test_buffer_streamed_gzip(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test the async client compresses a large buffer as it is sent
+        """
+        httpx_mock.add_response(json=ok_json())
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, compress=True) as client:
+            await client.tika.as_text.from_buffer(TEXT)
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["Content-Encoding"] == "gzip"
+        assert gzip.decompress(await request.aread()) == TEXT.encode()
+
+    async def test_stream_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, tmp_path: Path) -> None:
+        """
+        Test the async client compresses a streamed file upload
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/meta", json=ok_json())
+        document = anyio.Path(tmp_path / "document.txt")
+        await document.write_text(TEXT)
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, compress=True, upload_mode=UploadMode.Stream) as client:
+            await client.metadata.from_file(Path(document))
+            stats = client.compression_stats()
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert gzip.decompress(await request.aread()) == TEXT.encode()
+        assert stats is not None
+        assert stats.compressed == 1
+        assert stats.bytes_saved > 0
+
+    async def test_incompressible_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, tmp_path: Path) -> None:
+        """
+        Test a streamed file which does not compress is sampled and sent as is
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/meta", json=ok_json())
+        document = anyio.Path(tmp_path / "document.bin")
+        await document.write_bytes(os.urandom(200_000))
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, compress=True, upload_mode=UploadMode.Stream) as client:
+            await client.metadata.from_file(Path(document))
+
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert "Content-Encoding" not in request.headers
+        assert await request.aread() == await document.read_bytes()
@@ -0,0 +1,196 @@
+import pickle
+from collections.abc import Iterator
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from typing import Any
+
+import pytest
+
+from tika_client.data_models import DublinCoreKey
+from tika_client.data_models import OtherTikaKeys
+from tika_client.data_models import TikaKey
+from tika_client.data_models import TikaResponse
+from tika_client.data_models import XmpKey
+from tika_client.data_models import set_datetime_cache_size
+
+
+def response_json() -> dict[str, Any]:
+    return {
+        TikaKey.ContentType: "application/pdf",
+        TikaKey.Parsers: ["org.apache.tika.parser.DefaultParser"],
+        TikaKey.Content: "content",
+        TikaKey.ContentLength: "1024",
+        DublinCoreKey.Created: "2023-05-17T16:30:44Z",
+        DublinCoreKey.Title: "A title",
+        XmpKey.NumPages: "3",
+        OtherTikaKeys.Revision: "0",
+    }
+
+
+class TestTikaResponse:
+    def test_fields(self) -> None:
+        """
+        Test every field converts from the data as before
+        """
+        resp = TikaResponse(response_json())
+
+        assert resp.type == "application/pdf"
+        assert resp.parsers == ["org.apache.tika.parser.DefaultParser"]
+        assert resp.content == "content"
+        assert resp.content_length == 1024
+        assert resp.created == datetime(2023, 5, 17, 16, 30, 44, tzinfo=timezone.utc)
+        assert resp.modified is None
+        assert resp.xmp_created is None
+        assert resp.title == "A title"
+        assert resp.page_count == 3
+        assert resp.revision is None
+        assert resp.character_count is None
+        assert resp.language is None
+        assert resp.last_author is None
+
+    def test_no_instance_dict(self) -> None:
+        """
+        Test responses are slotted, without a per instance __dict__
+        """
+        resp = TikaResponse(response_json())
+
+        assert not hasattr(resp, "__dict__")
+        with pytest.raises(AttributeError):
+            resp.unknown = 1  # type: ignore[attr-defined]
+
+    def test_required_keys_checked_up_front(self) -> None:
+        """
+        Test a response without a content type still fails on construction
+        """
+        data = response_json()
+        del data[TikaKey.ContentType]
+
+        with pytest.raises(KeyError):
+            TikaResponse(data)
+
+    def test_converted_once_on_access(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test dates are only parsed when first read, then kept
+        """
+        calls: list[str | None] = []
+        parse = TikaResponse.parse_datetime_string
+
+        def counting(date_str: str | None) -> datetime | None:
+            calls.append(date_str)
+            return parse(date_str)
+
+        monkeypatch.setattr(TikaResponse, "parse_datetime_string", staticmethod(counting))
+
+        resp = TikaResponse(response_json())
+        assert resp.content == "content"
+        assert calls == []
+
+        assert resp.created is resp.created
+        assert calls == ["2023-05-17T16:30:44Z"]
+
+    def test_assign_field(self) -> None:
+        """
+        Test a field can still be assigned, replacing the converted value
+        """
+        resp = TikaResponse(response_json())
+
+        resp.title = "Replaced"
+        resp.page_count = None
+
+        assert resp.title == "Replaced"
+        assert resp.page_count is None
+
+    def test_pickle(self) -> None:
+        """
+        Test a response survives pickling, as when returned from a worker process
+        """
+        resp = TikaResponse(response_json())
+        assert resp.page_count == 3
+
+        copy = pickle.loads(pickle.dumps(resp))  # noqa: S301
+
+        assert copy.data == resp.data
+        assert copy.page_count == 3
+        assert copy.created == resp.created
+
+
+@pytest.fixture
+def datetime_cache() -> Iterator[None]:
+    set_datetime_cache_size(16)
+    yield
+    set_datetime_cache_size(0)
+
+
+class TestParseDatetime:
+    @pytest.mark.parametrize(
+        ("date_str", "expected"),
+        [
+            ("2023-05-17T16:30:44+00:00", datetime(2023, 5, 17, 16, 30, 44, tzinfo=timezone.utc)),
+            ("2023-01-17T16:35:44Z", datetime(2023, 1, 17, 16, 35, 44, tzinfo=timezone.utc)),
+            ("2023-06-17T16:30:44+08:00", datetime(2023, 6, 17, 16, 30, 44, tzinfo=timezone(timedelta(hours=8)))),
+            ("2023-06-17T16:30:44-08:00", datetime(2023, 6, 17, 16, 30, 44, tzinfo=timezone(timedelta(hours=-8)))),
+            ("2025-09-01T10:41:38.516674+00:00", datetime(2025, 9, 1, 10, 41, 38, 516674, tzinfo=timezone.utc)),
+            ("2023-05-17T16:30:44.123", datetime(2023, 5, 17, 16, 30, 44, 123000)),  # noqa: DTZ001
+            ("2023-05-17 16:30:44", datetime(2023, 5, 17, 16, 30, 44)),  # noqa: DTZ001
+            # Only parsed by the regex
+            ("2023-05-17t16:30:44z", datetime(2023, 5, 17, 16, 30, 44, tzinfo=timezone.utc)),
+            ("2023-05-17T16:30:44.1", datetime(2023, 5, 17, 16, 30, 44, 100000)),  # noqa: DTZ001
+            (
+                "2023-05-17T16:30:44.1234567-05:30",
+                datetime(2023, 5, 17, 16, 30, 44, 123456, tzinfo=timezone(timedelta(hours=-5, minutes=-30))),
+            ),
+            ("2023-05-17T16:30:44 (local)", datetime(2023, 5, 17, 16, 30, 44)),  # noqa: DTZ001
+            # Not matched at all, although newer versions of datetime.fromisoformat accept some
+            ("202-06-17T16:30:44-0", None),
+            ("2023-W20-3T16:30:44", None),
+            ("2023-05-17", None),
+            ("", None),
+            (None, None),
+        ],
+    )
+    def test_formats(self, date_str: str | None, expected: datetime | None) -> None:
+        """
+        Test the fast path and the regex parse each format the same
+        """
+        parsed = TikaResponse.parse_datetime_string(date_str)
+
+        assert parsed == expected
+        if expected is not None:
+            assert parsed is not None
+            assert parsed.utcoffset() == expected.utcoffset()
+
+    def test_invalid_date(self) -> None:
+        """
+        Test an impossible date in the expected shape still raises
+        """
+        with pytest.raises(ValueError, match="month"):
+            TikaResponse.parse_datetime_string("2023-13-17T16:30:44Z")
+
+    def test_tzinfo_shared(self) -> None:
+        """
+        Test datetimes parsed by the regex share one timezone per offset
+        """
+        first = TikaResponse.parse_datetime_string("2023-05-17T16:30:44.1+05:30")
+        second = TikaResponse.parse_datetime_string("2024-01-01t00:00:00+05:30")
+
+        assert first is not None
+        assert second is not None
+        assert first.tzinfo is second.tzinfo
+
+    @pytest.mark.usefixtures("datetime_cache")
+    def test_memoized(self) -> None:
+        """
+        Test repeated strings return the same datetime once the cache is on
+        """
+        first = TikaResponse.parse_datetime_string("2023-05-17T16:30:44+08:00")
+
+        assert TikaResponse.parse_datetime_string("2023-05-17T16:30:44+08:00") is first
+
+    def test_not_memoized_by_default(self) -> None:
+        """
+        Test repeated strings are parsed again when the cache is off
+        """
+        first = TikaResponse.parse_datetime_string("2023-05-17T16:30:44+08:00")
+
+        assert TikaResponse.parse_datetime_string("2023-05-17T16:30:44+08:00") is not first
@@ -0,0 +1,257 @@
+import json
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client._balancer import Node
+from tika_client._balancer import NodePool
+from tika_client._health import CircuitState
+from tika_client._health import HealthChecker
+from tika_client._health import HealthPolicy
+from tika_client._health import NoHealthyServerError
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+HEALTHY = "http://tika-healthy.invalid:9998"
+SICK = "http://tika-sick.invalid:9998"
+
+PASSIVE = HealthPolicy(check_interval=None, window=4, min_requests=2, failure_rate=0.5, open_duration=60.0)
+
+
+def state_of(node: Node) -> CircuitState:
+    # Read afresh, the pool changes the state behind the type checker's back
+    return node.state
+
+
+@contextmanager
+def local_server(status: int = 200, *, stall: bool = False) -> Iterator[str]:
+    """
+    A real local server answering every request with the status, or stalling until it is shut down
+    """
+    released = threading.Event()
+    body = json.dumps(ok_json()).encode()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_PUT(self) -> None:
+            self.rfile.read(int(self.headers.get("Content-Length", "0")))
+            if stall:
+                released.wait(5)
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, kwargs={"poll_interval": 0.01}, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        released.set()
+        server.shutdown()
+        server.server_close()
+
+
+class TestCircuitBreaker:
+    def test_server_errors_eject(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test a server answering 503 stops receiving requests once its error rate is exceeded
+        """
+        httpx_mock.add_response(url=f"{SICK}/meta/form", status_code=503, is_reusable=True)
+        httpx_mock.add_response(url=f"{HEALTHY}/meta/form", json=ok_json(), is_reusable=True)
+
+        with TikaClient(tika_url=[SICK, HEALTHY], health=PASSIVE) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.HTTPStatusError):
+                    client.metadata.from_file(sample_docx_file)
+                client.metadata.from_file(sample_docx_file)
+
+            # Every further request goes to the healthy server
+            for _ in range(5):
+                client.metadata.from_file(sample_docx_file)
+
+            sick, healthy = client.node_stats()
+
+        assert sick.state == CircuitState.Open
+        assert sick.requests == 2
+        assert healthy.state == CircuitState.Closed
+        assert healthy.requests == 7
+
+    def test_stalled_server_ejected(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test a server which stalls until the read timeout is ejected
+        """
+        httpx_mock.add_exception(httpx.ReadTimeout("stalled"), url=f"{SICK}/meta/form", is_reusable=True)
+        httpx_mock.add_response(url=f"{HEALTHY}/meta/form", json=ok_json(), is_reusable=True)
+
+        with TikaClient(tika_url=[SICK, HEALTHY], health=PASSIVE) as client:
+            for _ in range(2):
+                with pytest.raises(httpx.ReadTimeout):
+                    client.metadata.from_file(sample_docx_file)
+                client.metadata.from_file(sample_docx_file)
+            client.metadata.from_file(sample_docx_file)
+
+            assert client.node_stats()[0].state == CircuitState.Open
+
+    def test_stalled_local_server_ejected(self) -> None:
+        """
+        Test a real server which stalls past the read timeout is ejected, and the others take its requests
+        """
+        with (
+            local_server(stall=True) as stalled,
+            local_server() as healthy,
+            TikaClient(tika_url=[stalled, healthy], health=PASSIVE, timeout=0.2) as client,
+        ):
+            for _ in range(2):
+                with pytest.raises(httpx.ReadTimeout):
+                    client.tika.as_text.from_buffer("content")
+                client.tika.as_text.from_buffer("content")
+            for _ in range(3):
+                assert client.tika.as_text.from_buffer("content").type == "test"
+
+            stalled_stats, healthy_stats = client.node_stats()
+
+        assert stalled_stats.state == CircuitState.Open
+        assert stalled_stats.requests == 2
+        assert healthy_stats.requests == 5
+
+    async def test_unavailable_local_server_ejected(self) -> None:
+        """
+        Test a real server answering 503 is ejected by the async client
+        """
+        with local_server(503) as sick, local_server() as healthy:
+            async with AsyncTikaClient(tika_url=[sick, healthy], health=PASSIVE) as client:
+                for _ in range(2):
+                    with pytest.raises(httpx.HTTPStatusError):
+                        await client.tika.as_text.from_buffer("content")
+                    await client.tika.as_text.from_buffer("content")
+                for _ in range(3):
+                    assert (await client.tika.as_text.from_buffer("content")).type == "test"
+
+                sick_stats, healthy_stats = client.node_stats()
+
+        assert sick_stats.state == CircuitState.Open
+        assert sick_stats.requests == 2
+        assert healthy_stats.requests == 5
+
+    def test_half_open_trial(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test an open circuit lets a single trial through after the open duration and closes when it succeeds
+        """
+        policy = HealthPolicy(check_interval=None, min_requests=1, failure_rate=1.0, open_duration=0.05)
+        httpx_mock.add_response(url=f"{SICK}/meta/form", status_code=503)
+        httpx_mock.add_response(url=f"{SICK}/meta/form", json=ok_json())
+
+        with TikaClient(tika_url=SICK, health=policy) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.metadata.from_file(sample_docx_file)
+            with pytest.raises(NoHealthyServerError):
+                client.metadata.from_file(sample_docx_file)
+
+            time.sleep(0.06)
+            assert client.metadata.from_file(sample_docx_file).type == "test"
+            assert client.node_stats()[0].state == CircuitState.Closed
+
+    def test_failed_trial_backs_off(self) -> None:
+        """
+        Test a failed trial reopens the circuit for twice as long
+        """
+        pool = NodePool([SICK], health=HealthPolicy(min_requests=1, failure_rate=1.0, open_duration=0.01))
+        node = pool.acquire()
+        pool.record(node, latency=None, failed=True)
+        pool.release(node)
+        assert node.open_duration == 0.01
+
+        time.sleep(0.02)
+        node = pool.acquire()
+        assert state_of(node) == CircuitState.HalfOpen
+        # Only one trial at a time
+        with pytest.raises(NoHealthyServerError):
+            pool.acquire()
+        pool.record(node, latency=None, failed=True)
+        pool.release(node)
+
+        assert state_of(node) == CircuitState.Open
+        assert node.open_duration == 0.02
+
+    def test_latency_outlier(self) -> None:
+        """
+        Test a server far slower than the others is ejected
+        """
+        policy = HealthPolicy(min_requests=2, latency_factor=3.0)
+        pool = NodePool([SICK, HEALTHY, f"{HEALTHY}1"], health=policy)
+        sick, *healthy = pool.nodes
+        for node in healthy:
+            pool.record(node, latency=0.1, failed=False)
+
+        pool.record(sick, latency=1.0, failed=False)
+        assert state_of(sick) == CircuitState.Closed
+        pool.record(sick, latency=1.0, failed=False)
+        assert state_of(sick) == CircuitState.Open
+
+    def test_cancellation_not_counted(self) -> None:
+        """
+        Test a request with no outcome does not affect the circuit
+        """
+        pool = NodePool([SICK], health=HealthPolicy(min_requests=1, failure_rate=0.5))
+        node = pool.acquire()
+        pool.record(node, latency=None, failed=False)
+
+        assert node.state == CircuitState.Closed
+        assert not node.outcomes
+
+
+class TestHealthProbes:
+    def test_probe_failures_eject(self, httpx_mock: HTTPXMock) -> None:
+        """
+        Test consecutive failed probes open the circuit and a healthy probe half opens it
+        """
+        httpx_mock.add_response(url=f"{HEALTHY}/", text="This is Tika Server", is_reusable=True)
+        httpx_mock.add_response(url=f"{SICK}/", status_code=503)
+        httpx_mock.add_exception(httpx.ConnectTimeout("stalled"), url=f"{SICK}/")
+        httpx_mock.add_response(url=f"{SICK}/", text="This is Tika Server")
+
+        pool = NodePool([SICK, HEALTHY], health=HealthPolicy(probe_failures=2))
+        checker = HealthChecker(pool, pool.health, {})  # type: ignore[arg-type]
+        try:
+            checker.check_once()
+            assert state_of(pool.nodes[0]) == CircuitState.Closed
+            checker.check_once()
+            assert state_of(pool.nodes[0]) == CircuitState.Open
+            checker.check_once()
+            assert state_of(pool.nodes[0]) == CircuitState.HalfOpen
+            assert state_of(pool.nodes[1]) == CircuitState.Closed
+        finally:
+            checker.stop()
+
+    async def test_background_probes(self, httpx_mock: HTTPXMock) -> None:
+        """
+        Test the async client probes in the background and stops probing on exit
+        """
+        httpx_mock.add_response(url=f"{SICK}/", status_code=503, is_reusable=True)
+
+        policy = HealthPolicy(check_interval=0.01, probe_failures=1)
+        async with AsyncTikaClient(tika_url=SICK, health=policy) as client:
+            _ = client.client
+            deadline = time.monotonic() + 2
+            while client.node_stats()[0].state != CircuitState.Open and time.monotonic() < deadline:  # noqa: ASYNC110
+                await anyio.sleep(0.01)
+            assert client.node_stats()[0].state == CircuitState.Open
+
+        checker = client._health_checker  # noqa: SLF001
+        assert checker is not None
+        assert checker._thread is None  # noqa: SLF001
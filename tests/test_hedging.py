@@ -0,0 +1,129 @@
+import anyio
+import httpx
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client._hedging import Hedger
+from tika_client._hedging import HedgingPolicy
+from tika_client.client import AsyncTikaClient
+
+NODES = ["http://tika-1.invalid:9998", "http://tika-2.invalid:9998"]
+HEDGE_EARLY = HedgingPolicy(percentile=50.0, min_samples=3, max_extra_load=1.0)
+
+
+def warm_up(client: AsyncTikaClient, latency: float) -> None:
+    hedger = client._resource_config.hedger  # noqa: SLF001
+    assert hedger is not None
+    for _ in range(HEDGE_EARLY.min_samples):
+        hedger.record(latency)
+
+
+class TestHedger:
+    def test_delay_needs_samples(self) -> None:
+        """
+        Test no hedge delay is given until enough latencies are recorded
+        """
+        hedger = Hedger(HedgingPolicy(percentile=50.0, min_samples=4))
+        for latency in (0.1, 0.2, 0.3):
+            hedger.record(latency)
+        assert hedger.delay() is None
+
+        hedger.record(0.4)
+        assert hedger.delay() == 0.3
+
+    def test_budget_caps_hedges(self) -> None:
+        """
+        Test hedges are limited to a fraction of the requests made
+        """
+        hedger = Hedger(HedgingPolicy(max_extra_load=0.1))
+        for _ in range(10):
+            hedger.budget.deposit()
+
+        assert hedger.try_fire()
+        assert not hedger.try_fire()
+
+        stats = hedger.stats()
+        assert stats.fired == 1
+        assert stats.denied == 1
+
+
+class TestAsyncHedging:
+    async def test_hedge_wins_on_slow_server(self, httpx_mock: HTTPXMock) -> None:
+        """
+        Test a slow request is duplicated to the other server, whose response is used
+        """
+        slow, fast = NODES
+
+        async def respond_slowly(_: httpx.Request) -> httpx.Response:
+            await anyio.sleep(5)
+            return httpx.Response(200, json=ok_json())  # pragma: no cover
+
+        httpx_mock.add_callback(respond_slowly, url=f"{slow}/tika/text")
+        httpx_mock.add_response(url=f"{fast}/tika/text", json=ok_json())
+
+        async with AsyncTikaClient(tika_url=NODES, hedging=HEDGE_EARLY) as client:
+            warm_up(client, 0.01)
+            with anyio.fail_after(2):
+                resp = await client.tika.as_text.from_buffer("some text")
+            stats = client.hedging_stats()
+
+        assert resp.type == "test"
+        assert stats is not None
+        assert stats.fired == 1
+        assert stats.won == 1
+        assert [request.url.host for request in httpx_mock.get_requests()] == ["tika-1.invalid", "tika-2.invalid"]
+
+    async def test_hedge_wins_keep_delay(self, httpx_mock: HTTPXMock) -> None:
+        """
+        Test hedges that keep winning record the latency from the original request, so the delay does not shrink
+        """
+        sent = 0
+
+        async def hedge_faster(_: httpx.Request) -> httpx.Response:
+            nonlocal sent
+            sent += 1
+            # Every original request is slow, and every hedge of it fast
+            if sent % 2:
+                await anyio.sleep(5)
+            return httpx.Response(200, json=ok_json())
+
+        httpx_mock.add_callback(hedge_faster, is_reusable=True)
+
+        async with AsyncTikaClient(tika_url=NODES, hedging=HEDGE_EARLY) as client:
+            warm_up(client, 0.05)
+            with anyio.fail_after(2):
+                for _ in range(5):
+                    await client.tika.as_text.from_buffer("some text")
+            hedger = client._resource_config.hedger  # noqa: SLF001
+            assert hedger is not None
+            stats = hedger.stats()
+            delay = hedger.delay()
+
+        assert stats.fired == 5
+        assert stats.won == 5
+        assert delay is not None
+        assert delay >= 0.05
+
+    async def test_no_hedge_when_fast(self, httpx_mock: HTTPXMock) -> None:
+        """
+        Test a request finishing within the hedge delay is not duplicated
+        """
+        for node in NODES:
+            httpx_mock.add_response(url=f"{node}/tika/text", json=ok_json(), is_optional=True)
+
+        async with AsyncTikaClient(tika_url=NODES, hedging=HEDGE_EARLY) as client:
+            warm_up(client, 5.0)
+            resp = await client.tika.as_text.from_buffer("some text")
+            stats = client.hedging_stats()
+
+        assert resp.type == "test"
+        assert stats is not None
+        assert stats.fired == 0
+        assert len(httpx_mock.get_requests()) == 1
+
+    async def test_no_hedging_by_default(self, stub_tika_url: str) -> None:
+        """
+        Test the client only hedges when given a policy
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            assert client.hedging_stats() is None
@@ -0,0 +1,122 @@
+import json
+import math
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client._json import best_json_decoder
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+
+class CountingDecoder:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self, content: bytes) -> Any:  # noqa: ANN401
+        self.calls += 1
+        return json.loads(content)
+
+
+class TestBestJsonDecoder:
+    def test_prefers_orjson(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test orjson is picked when installed
+        """
+        decoder = CountingDecoder()
+        monkeypatch.setitem(sys.modules, "orjson", SimpleNamespace(loads=decoder, JSONDecodeError=ValueError))
+
+        assert best_json_decoder()(b"[]") == []
+        assert decoder.calls == 1
+
+    def test_rejected_documents(self) -> None:
+        """
+        Test documents the faster decoders reject still decode as with the standard library
+        """
+        pytest.importorskip("orjson")
+
+        decoded = best_json_decoder()(b'[NaN, 1e400, "\\ud800"]')
+
+        assert math.isnan(decoded[0])
+        assert decoded[1:] == [math.inf, "\ud800"]
+
+    def test_invalid_document(self) -> None:
+        """
+        Test a document which is not JSON at all still raises
+        """
+        with pytest.raises(ValueError, match="Expecting value"):
+            best_json_decoder()(b"not json")
+
+    def test_fallback(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test the standard library decodes when no faster decoder is installed
+        """
+        monkeypatch.setitem(sys.modules, "orjson", None)
+        monkeypatch.setitem(sys.modules, "msgspec", None)
+
+        assert best_json_decoder() is json.loads
+
+    def test_decodes_tika_json(self) -> None:
+        """
+        Test whichever decoder is picked decodes the same as the standard library
+        """
+        content = json.dumps(ok_json("Ünïcödé")).encode()
+
+        assert best_json_decoder()(content) == json.loads(content)
+
+
+class TestClientJsonDecoder:
+    def test_standard_library_default(self, stub_tika_url: str) -> None:
+        """
+        Test the client decodes with the standard library unless a faster decoder is opted in to
+        """
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client.json_decoder is json.loads
+
+    def test_sync_custom_decoder(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test the client decodes responses with the given decoder
+        """
+        httpx_mock.add_response(json=ok_json("Ünïcödé"))
+        decoder = CountingDecoder()
+
+        with TikaClient(tika_url=stub_tika_url, json_decoder=decoder) as client:
+            resp = client.tika.as_text.from_buffer("content")
+
+        assert decoder.calls == 1
+        assert resp.content == "Ünïcödé"
+
+    async def test_async_custom_decoder(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test the async client decodes responses with the given decoder
+        """
+        httpx_mock.add_response(json=ok_json("Ünïcödé"))
+        decoder = CountingDecoder()
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, json_decoder=decoder) as client:
+            resp = await client.metadata.from_file(sample_docx_file)
+
+        assert decoder.calls == 1
+        assert resp.type == "test"
+
+    def test_streamed_elements(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test each element of a streamed response is decoded with the given decoder
+        """
+        httpx_mock.add_response(json=[ok_json("Ünïcödé"), ok_json("Ünïcödé"), ok_json("Ünïcödé")])
+        decoder = CountingDecoder()
+
+        with TikaClient(tika_url=stub_tika_url, json_decoder=decoder) as client:
+            documents = list(client.rmeta.as_text.stream_from_file(sample_docx_file))
+
+        assert decoder.calls == len(documents) == 3
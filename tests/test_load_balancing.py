@@ -0,0 +1,146 @@
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client._balancer import LoadBalancing
+from tika_client._balancer import NodePool
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+from tika_client.data_models import TikaKey
+
+NODES = ["http://tika-1.invalid:9998", "http://tika-2.invalid:9998", "http://tika-3.invalid:9998"]
+
+
+class TestNodePool:
+    def test_round_robin(self) -> None:
+        """
+        Test round robin visits every node in turn
+        """
+        pool = NodePool(NODES, LoadBalancing.RoundRobin)
+
+        chosen = [str(pool.acquire().url) for _ in range(6)]
+
+        assert chosen == [*NODES, *NODES]
+
+    def test_least_outstanding(self) -> None:
+        """
+        Test least outstanding avoids nodes with requests in flight
+        """
+        pool = NodePool(NODES, LoadBalancing.LeastOutstanding)
+
+        busy = pool.acquire()
+        second = pool.acquire()
+        third = pool.acquire()
+        assert len({busy.url, second.url, third.url}) == 3
+
+        pool.release(second)
+        assert pool.acquire() is second
+
+    def test_power_of_two_choices(self) -> None:
+        """
+        Test power of two choices picks the less loaded of the two sampled nodes
+        """
+        pool = NodePool(NODES[:2], LoadBalancing.PowerOfTwoChoices)
+        busy = pool.acquire()
+        idle = pool.nodes[1] if busy is pool.nodes[0] else pool.nodes[0]
+
+        for _ in range(10):
+            node = pool.acquire()
+            assert node is idle
+            pool.release(node)
+
+    def test_latency_average(self) -> None:
+        """
+        Test the latency is tracked as a moving average
+        """
+        pool = NodePool(NODES[:1], latency_decay=0.5)
+        node = pool.acquire()
+
+        pool.record(node, latency=1.0, failed=False)
+        pool.record(node, latency=3.0, failed=True)
+
+        stats = pool.stats()[0]
+        assert stats.latency == 2.0
+        assert stats.failures == 1
+        assert stats.in_flight == 1
+
+    def test_mismatched_paths(self) -> None:
+        """
+        Test servers must agree on the base path
+        """
+        with pytest.raises(ValueError, match="same path"):
+            NodePool(["http://tika-1.invalid/tika", "http://tika-2.invalid/"])
+
+    def test_no_urls(self) -> None:
+        """
+        Test at least one server is required
+        """
+        with pytest.raises(ValueError, match="At least one"):
+            TikaClient(tika_url=[])
+
+
+class TestBalancedClient:
+    def test_requests_spread(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test requests are spread over the servers and routed with the right Host
+        """
+        for url in NODES:
+            httpx_mock.add_response(
+                url=f"{url}/meta/form",
+                json={TikaKey.ContentType: url, TikaKey.Parsers: []},
+                is_reusable=True,
+            )
+
+        with TikaClient(tika_url=NODES) as client:
+            types = [client.metadata.from_file(sample_docx_file).type for _ in range(6)]
+            stats = client.node_stats()
+
+        assert types == [*NODES, *NODES]
+        assert [node.requests for node in stats] == [2, 2, 2]
+        assert all(node.in_flight == 0 for node in stats)
+        assert all(node.latency is not None for node in stats)
+        assert [request.headers["Host"] for request in httpx_mock.get_requests()[:3]] == [
+            "tika-1.invalid:9998",
+            "tika-2.invalid:9998",
+            "tika-3.invalid:9998",
+        ]
+
+    def test_failures_counted(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test server side failures and connection errors are attributed to the node
+        """
+        httpx_mock.add_response(url=f"{NODES[0]}/meta/form", status_code=503)
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url=f"{NODES[1]}/meta/form")
+
+        with TikaClient(tika_url=NODES[:2]) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client.metadata.from_file(sample_docx_file)
+            with pytest.raises(httpx.ConnectError):
+                client.metadata.from_file(sample_docx_file)
+            stats = client.node_stats()
+
+        assert [node.failures for node in stats] == [1, 1]
+        assert [node.in_flight for node in stats] == [0, 0]
+
+
+class TestAsyncBalancedClient:
+    async def test_requests_spread(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test the async client spreads requests over the servers
+        """
+        for url in NODES:
+            httpx_mock.add_response(
+                url=f"{url}/rmeta/form/text",
+                json=[{TikaKey.ContentType: url, TikaKey.Parsers: []}],
+                is_reusable=True,
+            )
+
+        async with AsyncTikaClient(tika_url=NODES, load_balancing=LoadBalancing.LeastOutstanding) as client:
+            for _ in range(3):
+                await client.rmeta.as_text.from_file(sample_docx_file)
+            stats = client.node_stats()
+
+        assert [node.requests for node in stats] == [1, 1, 1]
+        assert all(node.in_flight == 0 for node in stats)
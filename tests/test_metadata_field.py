@@ -0,0 +1,98 @@
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client import ParseOptions
+from tika_client import UploadMode
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+from tika_client.data_models import DublinCoreKey
+from tika_client.data_models import TikaKey
+from tika_client.data_models import XmpKey
+
+
+class TestSyncMetadataField:
+    @pytest.mark.parametrize("upload_mode", [UploadMode.Multipart, UploadMode.Stream])
+    def test_field(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+        upload_mode: UploadMode,
+    ) -> None:
+        """
+        Test the file is sent as the raw body to the key's endpoint, in either upload mode, and its value returned
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/meta/xmpTPg:NPages", json={XmpKey.NumPages: "12"})
+
+        with TikaClient(tika_url=stub_tika_url, upload_mode=upload_mode) as client:
+            pages = client.metadata.field(sample_docx_file, XmpKey.NumPages)
+
+        assert pages == "12"
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.read() == sample_docx_file.read_bytes()
+
+    def test_several_values(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a key with several values returns them all
+        """
+        httpx_mock.add_response(url=f"{stub_tika_url}/meta/dc:creator", json={"dc:creator": ["First", "Second"]})
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client.metadata.field(sample_docx_file, "dc:creator") == ["First", "Second"]
+
+    def test_missing_key(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a key the document does not have returns None, as the server answers 404
+        """
+        httpx_mock.add_response(url=f"{stub_tika_url}/meta/dcterms:created", status_code=404)
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert client.metadata.field(sample_docx_file, DublinCoreKey.Created) is None
+
+    def test_http_error(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test other HTTP errors are raised
+        """
+        httpx_mock.add_response(status_code=500)
+
+        with TikaClient(tika_url=stub_tika_url) as client, pytest.raises(httpx.HTTPStatusError):
+            client.metadata.field(sample_docx_file, TikaKey.ContentType)
+
+    def test_options(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the parse options are sent with the request
+        """
+        httpx_mock.add_response(match_headers={"X-Tika-OCRskipOcr": "true"}, json={TikaKey.ContentType: "test"})
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            value = client.metadata.field(sample_docx_file, TikaKey.ContentType, options=ParseOptions(skip_ocr=True))
+
+        assert value == "test"
+
+
+class TestAsyncMetadataField:
+    async def test_field(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client returns the value of a single key
+        """
+        httpx_mock.add_response(
+            method="PUT",
+            url=f"{stub_tika_url}/meta/Content-Type",
+            json={TikaKey.ContentType: "application/pdf"},
+        )
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            assert await client.metadata.field(sample_docx_file, TikaKey.ContentType) == "application/pdf"
+
+    async def test_missing_key(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client returns None for a key the document does not have
+        """
+        httpx_mock.add_response(status_code=404)
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            assert await client.metadata.field(sample_docx_file, XmpKey.NumPages) is None
@@ -0,0 +1,90 @@
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client._multipart import AsyncFileMultipart
+from tika_client._retry import RetryPolicy
+from tika_client.client import AsyncTikaClient
+
+
+async def encode(form: AsyncFileMultipart) -> bytes:
+    return b"".join([chunk async for chunk in form])
+
+
+class TestAsyncFileMultipart:
+    @pytest.mark.parametrize("filename", ["plain.txt", 'with "quotes".txt', "ünïcödé.txt"])
+    async def test_matches_httpx(self, tmp_path: Path, filename: str) -> None:
+        """
+        Test the form is encoded exactly as httpx encodes it, including the length
+        """
+        filepath = tmp_path / filename
+        await anyio.Path(filepath).write_bytes(b"some file content " * 10_000)
+        form = AsyncFileMultipart("upload-file", filepath, "text/plain", chunk_size=1000, boundary=b"fixed")
+
+        with filepath.open("rb") as handle:
+            expected = httpx.Request(
+                "POST",
+                "http://tika.invalid",
+                files={"upload-file": (filename, handle, "text/plain")},
+                headers={"Content-Type": "multipart/form-data; boundary=fixed"},
+            )
+            expected_body = expected.read()
+
+        body = await encode(form)
+        assert body == expected_body
+        headers = form.headers(len(b"some file content " * 10_000))
+        assert headers["Content-Length"] == str(len(body))
+        assert headers["Content-Type"] == "multipart/form-data; boundary=fixed"
+
+    async def test_reiterable(self, tmp_path: Path) -> None:
+        """
+        Test iterating again reads the file again
+        """
+        filepath = tmp_path / "file.txt"
+        await anyio.Path(filepath).write_bytes(b"first")
+        form = AsyncFileMultipart("upload-file", filepath, "text/plain", chunk_size=1000)
+
+        assert b"first" in await encode(form)
+        await anyio.Path(filepath).write_bytes(b"second")
+        assert b"second" in await encode(form)
+
+
+class TestAsyncPutMultipart:
+    async def test_upload(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client sends the encoded form with its length
+        """
+        httpx_mock.add_response(method="POST", url=f"{stub_tika_url}/meta/form", json=ok_json())
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            resp = await client.metadata.from_file(sample_docx_file, "application/test")
+
+        assert resp.type == "test"
+        request = httpx_mock.get_request()
+        assert request is not None
+        body = await request.aread()
+        content = await anyio.Path(sample_docx_file).read_bytes()
+        assert content in body
+        assert b"Content-Type: application/test\r\n" in body
+        assert request.headers["Content-Length"] == str(len(body))
+        assert request.headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert request.headers["Content-Disposition"] == f'attachment; filename="{sample_docx_file.name}"'
+
+    async def test_retry(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a retried upload sends the whole form again
+        """
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(json=ok_json())
+
+        retry = RetryPolicy(backoff_base=0.0, jitter=False)
+        async with AsyncTikaClient(tika_url=stub_tika_url, retry=retry) as client:
+            await client.tika.as_text.from_file(sample_docx_file)
+
+        first, second = [await request.aread() for request in httpx_mock.get_requests()]
+        assert first == second
+        assert await anyio.Path(sample_docx_file).read_bytes() in first
@@ -0,0 +1,171 @@
+from pathlib import Path
+
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client import MemoryCache
+from tika_client import OcrStrategy
+from tika_client import ParseOptions
+from tika_client import UploadMode
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+LIMITS = ParseOptions(write_limit=1000, max_embedded_resources=5, timeout=30)
+LIMIT_HEADERS = {"writeLimit": "1000", "maxEmbeddedResources": "5", "X-Tika-Timeout-Millis": "30000"}
+
+
+class TestParseOptions:
+    def test_headers(self) -> None:
+        """
+        Test every field becomes the header the Tika server reads it from
+        """
+        options = ParseOptions(
+            write_limit=100,
+            throw_on_write_limit=False,
+            max_embedded_resources=0,
+            skip_ocr=True,
+            ocr_language="eng+deu",
+            ocr_timeout=60,
+            pdf_ocr_strategy=OcrStrategy.NoOcr,
+            pdf_extract_inline_images=False,
+            timeout=1.5,
+        )
+
+        assert options.headers() == {
+            "writeLimit": "100",
+            "throwOnWriteLimitReached": "false",
+            "maxEmbeddedResources": "0",
+            "X-Tika-OCRskipOcr": "true",
+            "X-Tika-OCRLanguage": "eng+deu",
+            "X-Tika-OCRtimeoutSeconds": "60",
+            "X-Tika-PDFOcrStrategy": "no_ocr",
+            "X-Tika-PDFextractInlineImages": "false",
+            "X-Tika-Timeout-Millis": "1500",
+        }
+
+    def test_unset(self) -> None:
+        """
+        Test unset fields send no headers
+        """
+        assert ParseOptions().headers() == {}
+
+    def test_merged(self) -> None:
+        """
+        Test the set fields of the overrides replace the defaults, and the rest are kept
+        """
+        merged = LIMITS.merged(ParseOptions(write_limit=5, skip_ocr=True))
+
+        assert merged == ParseOptions(write_limit=5, max_embedded_resources=5, timeout=30, skip_ocr=True)
+
+
+class TestSyncClientOptions:
+    def test_from_buffer(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test the options of a request are sent as headers
+        """
+        httpx_mock.add_response(method="PUT", match_headers=LIMIT_HEADERS, json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            resp = client.tika.as_text.from_buffer("content", options=LIMITS)
+
+        assert resp.content == "content"
+
+    @pytest.mark.parametrize("upload_mode", [UploadMode.Multipart, UploadMode.Stream])
+    def test_client_defaults(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+        upload_mode: UploadMode,
+    ) -> None:
+        """
+        Test the client's options are sent with file uploads in either upload mode
+        """
+        httpx_mock.add_response(match_headers=LIMIT_HEADERS, json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, parse_options=LIMITS, upload_mode=upload_mode) as client:
+            client.metadata.from_file(sample_docx_file)
+
+    def test_request_overrides_defaults(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test a request's options take precedence over the client's, field by field
+        """
+        httpx_mock.add_response(
+            url=f"{stub_tika_url}/rmeta/form/text",
+            match_headers={**LIMIT_HEADERS, "writeLimit": "10", "X-Tika-OCRskipOcr": "true"},
+            json=[ok_json()],
+        )
+
+        with TikaClient(tika_url=stub_tika_url, parse_options=LIMITS) as client:
+            client.rmeta.as_text.from_file(sample_docx_file, options=ParseOptions(write_limit=10, skip_ocr=True))
+
+    def test_streamed_responses(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test options are sent when the response is streamed, alongside the plain text Accept header
+        """
+        httpx_mock.add_response(
+            url=f"{stub_tika_url}/rmeta/form/html",
+            match_headers=LIMIT_HEADERS,
+            json=[ok_json(), ok_json()],
+        )
+        httpx_mock.add_response(
+            url=f"{stub_tika_url}/tika/text",
+            match_headers={**LIMIT_HEADERS, "Accept": "text/plain"},
+            text="content",
+        )
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            assert len(list(client.rmeta.as_html.stream_from_file(sample_docx_file, options=LIMITS))) == 2
+            with client.tika.as_text.stream_from_buffer("content", options=LIMITS) as text:
+                assert "".join(text) == "content"
+
+    def test_options_in_cache_key(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test the same content parsed with other options is not answered from the cache
+        """
+        httpx_mock.add_response(method="GET", url=f"{stub_tika_url}/version", text="Apache Tika 3.2.0")
+        httpx_mock.add_response(method="PUT", match_headers={"writeLimit": "10"}, json=ok_json("short"))
+        httpx_mock.add_response(method="PUT", json=ok_json("full"))
+
+        with TikaClient(tika_url=stub_tika_url, memory_cache=MemoryCache()) as client:
+            short = client.tika.as_text.from_buffer("content", options=ParseOptions(write_limit=10))
+            full = client.tika.as_text.from_buffer("content")
+            again = client.tika.as_text.from_buffer("content", options=ParseOptions(write_limit=10))
+
+        assert (short.content, full.content, again.content) == ("short", "full", "short")
+
+
+class TestAsyncClientOptions:
+    async def test_from_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client sends the client's and the request's options
+        """
+        httpx_mock.add_response(
+            match_headers={**LIMIT_HEADERS, "X-Tika-PDFOcrStrategy": "ocr_only"},
+            json=ok_json(),
+        )
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, parse_options=LIMITS) as client:
+            resp = await client.tika.as_html.from_file(
+                sample_docx_file,
+                options=ParseOptions(pdf_ocr_strategy=OcrStrategy.OcrOnly),
+            )
+
+        assert resp.content == "content"
+
+    async def test_from_buffer(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test the async client sends a request's options with content
+        """
+        httpx_mock.add_response(method="PUT", match_headers=LIMIT_HEADERS, json=ok_json())
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            resp = await client.tika.as_text.from_buffer("content", options=LIMITS)
+
+        assert resp.content == "content"
@@ -9,6 +9,9 @@ from pytest_httpx import HTTPXMock
 
 from tika_client.client import AsyncTikaClient
 from tika_client.client import TikaClient
+from tika_client.data_models import DublinCoreKey
+from tika_client.data_models import TikaKey
+from tika_client.data_models import XmpKey
 
 
 class TestMetadataResource:
@@ -69,6 +72,14 @@ class TestMetadataResource:
         assert resp.type == "application/msword"
         assert resp.language == "en"
 
+    def test_field_from_doc(self, tika_client: TikaClient, sample_doc_file: Path) -> None:
+        """
+        Test fetching single metadata keys of a DOC, and a key it does not have
+        """
+        assert tika_client.metadata.field(sample_doc_file, TikaKey.ContentType) == "application/msword"
+        assert tika_client.metadata.field(sample_doc_file, XmpKey.NumPages) == "1"
+        assert tika_client.metadata.field(sample_doc_file, "no-such-key") is None
+
     def test_http_error(
         self,
         httpx_mock: HTTPXMock,
@@ -164,6 +175,14 @@ class TestAsyncMetadataResource:
         assert resp.type == "application/msword"
         assert resp.language == "en"
 
+    async def test_field_from_word_docx(self, async_tika_client: AsyncTikaClient, sample_docx_file: Path) -> None:
+        """
+        Test fetching a single metadata key of a DOCX produced by Microsoft Word using async client
+        """
+        created = await async_tika_client.metadata.field(sample_docx_file, DublinCoreKey.Created)
+
+        assert created == "2023-05-17T16:41:00Z"
+
     async def test_http_error(
         self,
         httpx_mock: HTTPXMock,
@@ -89,6 +89,24 @@ class TestRecursiveMetadataResource:
         document = documents[1]
         assert document.type == "image/png"
 
+    def test_r_metadata_stream_from_odt_plain(
+        self,
+        tika_client: TikaClient,
+        sample_google_docs_to_libre_office_writer_file: Path,
+    ) -> None:
+        documents = list(
+            tika_client.rmeta.as_text.stream_from_file(
+                sample_google_docs_to_libre_office_writer_file,
+                magic.from_file(str(sample_google_docs_to_libre_office_writer_file), mime=True),
+            ),
+        )
+
+        assert len(documents) == 2
+        assert documents[0].type == "application/vnd.oasis.opendocument.text"
+        assert documents[0].content is not None
+        assert "This is an ODT test document, created September 14, 2022" in documents[0].content
+        assert documents[1].type == "image/png"
+
     def test_r_metadata_from_ods_plain(self, tika_client: TikaClient, sample_ods_file: Path) -> None:
         documents = tika_client.rmeta.as_text.from_file(
             sample_ods_file,
@@ -105,6 +123,17 @@ class TestRecursiveMetadataResource:
         document = documents[1]
         assert document.type == "image/png"
 
+    def test_r_metadata_only_from_ods(self, tika_client: TikaClient, sample_ods_file: Path) -> None:
+        documents = tika_client.rmeta.as_metadata.from_file(
+            sample_ods_file,
+            magic.from_file(str(sample_ods_file), mime=True),
+        )
+
+        assert len(documents) == 2
+        assert all(document.content is None for document in documents)
+        assert documents[0].type == "application/vnd.oasis.opendocument.spreadsheet"
+        assert documents[1].type == "image/png"
+
     def test_r_metadata_from_xlsx_plain(self, tika_client: TikaClient, sample_xlsx_file: Path) -> None:
         documents = tika_client.rmeta.as_text.from_file(
             sample_xlsx_file,
@@ -214,6 +243,21 @@ class TestAsyncRecursiveMetadataResource:
         document = documents[1]
         assert document.type == "image/png"
 
+    async def test_r_metadata_stream_from_odt_plain(
+        self,
+        async_tika_client: AsyncTikaClient,
+        sample_google_docs_to_libre_office_writer_file: Path,
+    ) -> None:
+        async with async_tika_client.rmeta.as_text.stream_from_file(
+            sample_google_docs_to_libre_office_writer_file,
+            magic.from_file(str(sample_google_docs_to_libre_office_writer_file), mime=True),
+        ) as stream:
+            documents = [document async for document in stream]
+
+        assert len(documents) == 2
+        assert documents[0].type == "application/vnd.oasis.opendocument.text"
+        assert documents[1].type == "image/png"
+
     async def test_r_metadata_from_ods_plain(
         self,
         async_tika_client: AsyncTikaClient,
@@ -113,6 +113,16 @@ class TestParsePlain:
         assert resp.content is not None
         assert "This is an ODT test document, created September 14, 2022" in resp.content
 
+    def test_stream_docx_from_file_as_text(
+        self,
+        tika_client: TikaClient,
+        sample_google_docs_to_docx_file: Path,
+    ) -> None:
+        with tika_client.tika.as_text.stream_from_file(sample_google_docs_to_docx_file) as text:
+            content = "".join(text)
+
+        assert "This is an DOCX test document, also made September 14, 2022" in content
+
 
 class TestParseContentPlain:
     def test_parse_docx_from_bytes_buffer(self, tika_client: TikaClient, sample_google_docs_to_docx_file: Path) -> None:
@@ -338,6 +348,16 @@ class TestAsyncParsePlain:
         assert resp.content is not None
         assert "This is an ODT test document, created September 14, 2022" in resp.content
 
+    async def test_stream_docx_from_file_as_text(
+        self,
+        async_tika_client: AsyncTikaClient,
+        sample_google_docs_to_docx_file: Path,
+    ) -> None:
+        async with async_tika_client.tika.as_text.stream_from_file(sample_google_docs_to_docx_file) as text:
+            content = "".join([chunk async for chunk in text])
+
+        assert "This is an DOCX test document, also made September 14, 2022" in content
+
 
 class TestAsyncParseContentPlain:
     async def test_parse_docx_from_bytes_buffer(
@@ -0,0 +1,169 @@
+from datetime import datetime
+from datetime import timedelta
+from datetime import timezone
+from email.utils import format_datetime
+from pathlib import Path
+
+import anyio
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client._retry import RetryBudget
+from tika_client._retry import RetryPolicy
+from tika_client._retry import parse_retry_after
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+FAST = RetryPolicy(max_attempts=3, backoff_base=0.0, jitter=False)
+
+
+class TestRetryPolicy:
+    def test_parse_retry_after_seconds(self) -> None:
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+
+    def test_parse_retry_after_date(self) -> None:
+        when = datetime.now(tz=timezone.utc) + timedelta(seconds=30)
+        delay = parse_retry_after(format_datetime(when, usegmt=True))
+        assert delay is not None
+        assert 25 < delay <= 30
+
+    def test_budget_ratio(self) -> None:
+        """
+        Test the budget allows the reserve plus a fraction of requests
+        """
+        budget = RetryBudget(ratio=0.5, min_per_second=0.1, window=10.0)
+        assert budget.withdraw()
+        assert not budget.withdraw()
+
+        for _ in range(4):
+            budget.deposit()
+        assert budget.withdraw()
+        assert budget.withdraw()
+        assert not budget.withdraw()
+        assert budget.granted == 3
+        assert budget.denied == 2
+
+
+class TestSyncRetry:
+    def test_retry_unavailable(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a 503 is retried, streaming the file again from disk
+        """
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, retry=FAST) as client:
+            resp = client.metadata.from_file(sample_docx_file)
+
+        assert resp.type == "test"
+        content = sample_docx_file.read_bytes()
+        assert all(content in request.read() for request in httpx_mock.get_requests())
+
+    def test_retry_connection_error(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test a connection reset is retried for buffer content
+        """
+        httpx_mock.add_exception(httpx.RemoteProtocolError("reset"))
+        httpx_mock.add_response(json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, retry=FAST) as client:
+            resp = client.tika.as_text.from_buffer("some text")
+
+        assert resp.type == "test"
+
+    def test_gives_up(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the final failure is raised once the attempts are used up
+        """
+        httpx_mock.add_response(status_code=502, is_reusable=True)
+
+        with pytest.raises(httpx.HTTPStatusError) as err, TikaClient(tika_url=stub_tika_url, retry=FAST) as client:
+            client.metadata.from_file(sample_docx_file)
+
+        assert err.value.response.status_code == httpx.codes.BAD_GATEWAY
+        assert len(httpx_mock.get_requests()) == 3
+
+    def test_no_retry_document_error(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test failures caused by the document are not retried
+        """
+        httpx_mock.add_response(status_code=422)
+
+        with pytest.raises(httpx.HTTPStatusError), TikaClient(tika_url=stub_tika_url, retry=FAST) as client:
+            client.metadata.from_file(sample_docx_file)
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_retry_after_too_long(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+    ) -> None:
+        """
+        Test a Retry-After beyond the longest backoff is not waited for
+        """
+        httpx_mock.add_response(status_code=503, headers={"Retry-After": "120"})
+
+        with pytest.raises(httpx.HTTPStatusError), TikaClient(tika_url=stub_tika_url, retry=FAST) as client:
+            client.metadata.from_file(sample_docx_file)
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_budget_exhausted(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test no retry is made once the budget is spent
+        """
+        httpx_mock.add_response(status_code=503)
+        policy = RetryPolicy(backoff_base=0.0, budget_ratio=0.0, budget_min_per_second=0.0)
+
+        with pytest.raises(httpx.HTTPStatusError), TikaClient(tika_url=stub_tika_url, retry=policy) as client:
+            client.metadata.from_file(sample_docx_file)
+
+        assert len(httpx_mock.get_requests()) == 1
+
+    def test_retry_other_server(self, httpx_mock: HTTPXMock, sample_docx_file: Path) -> None:
+        """
+        Test a retry is balanced to the next server
+        """
+        httpx_mock.add_exception(httpx.ConnectError("refused"), url="http://tika-1.invalid/meta/form")
+        httpx_mock.add_response(url="http://tika-2.invalid/meta/form", json=ok_json())
+
+        with TikaClient(tika_url=["http://tika-1.invalid", "http://tika-2.invalid"], retry=FAST) as client:
+            assert client.metadata.from_file(sample_docx_file).type == "test"
+
+
+class TestAsyncRetry:
+    async def test_retry_timeout(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a read timeout is retried by the async client
+        """
+        httpx_mock.add_exception(httpx.ReadTimeout("timed out"))
+        httpx_mock.add_response(json=[ok_json()])
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, retry=FAST) as client:
+            documents = await client.rmeta.as_text.from_file(sample_docx_file)
+
+        assert len(documents) == 1
+        assert await anyio.Path(sample_docx_file).read_bytes() in httpx_mock.get_requests()[-1].read()
+
+    async def test_retry_after(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test a Retry-After header is honored by the async client
+        """
+        httpx_mock.add_response(status_code=429, headers={"Retry-After": "0"})
+        httpx_mock.add_response(json=ok_json())
+
+        async with AsyncTikaClient(tika_url=stub_tika_url, retry=RetryPolicy(backoff_base=60.0)) as client:
+            resp = await client.tika.as_html.from_buffer("<p>Hello</p>")
+
+        assert resp.type == "test"
@@ -0,0 +1,218 @@
+import json
+import random
+from collections.abc import AsyncIterator
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client import UploadMode
+from tika_client._streaming import JsonArrayParser
+from tika_client._streaming import iter_json_array
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+from tika_client.data_models import TikaKey
+
+DOCUMENTS = [
+    {
+        TikaKey.ContentType: "message/rfc822",
+        TikaKey.Parsers: ["org.apache.tika.parser.mail.RFC822Parser"],
+        TikaKey.Content: 'Quotes " and brackets ]} and escapes \\ in the text ' * (index + 1),
+        "X-TIKA:embedded_resource_path": f"/attachment-{index}",
+    }
+    for index in range(20)
+]
+
+
+def split(content: bytes, max_size: int) -> list[bytes]:
+    chunks = []
+    while content:
+        size = random.randint(1, max_size)  # noqa: S311
+        chunks.append(content[:size])
+        content = content[size:]
+    return chunks
+
+
+class TrackedStream(httpx.AsyncByteStream):
+    def __init__(self, content: bytes) -> None:
+        self.content = content
+        self.closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self.content), 100):
+            yield self.content[start : start + 100]
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+class TestJsonArrayParser:
+    @pytest.mark.parametrize("indent", [None, 2])
+    @pytest.mark.parametrize("max_size", [1, 7, 4096])
+    def test_any_split(self, indent: int | None, max_size: int) -> None:
+        """
+        Test the elements are decoded however the bytes are split
+        """
+        content = json.dumps(DOCUMENTS, indent=indent).encode()
+
+        assert list(iter_json_array(split(content, max_size))) == DOCUMENTS
+
+    def test_yields_when_complete(self) -> None:
+        """
+        Test an element is available as soon as its closing bracket arrives
+        """
+        parser = JsonArrayParser()
+
+        assert parser.feed(b'[{"a": "}"}') == [{"a": "}"}]
+        assert parser.feed(b', {"b": [1, 2') == []
+        assert parser.feed(b"]}") == [{"b": [1, 2]}]
+        assert parser.feed(b"]") == []
+        parser.close()
+
+    def test_empty(self) -> None:
+        """
+        Test an empty array has no elements
+        """
+        assert list(iter_json_array([b" [ ", b"]\n"])) == []
+
+    def test_truncated(self) -> None:
+        """
+        Test an array which ends early is an error
+        """
+        with pytest.raises(ValueError, match="ended before"):
+            list(iter_json_array([b'[{"a": 1}, {"b"']))
+
+    @pytest.mark.parametrize("content", [b'{"a": 1}', b"[1, 2]"])
+    def test_not_array_of_objects(self, content: bytes) -> None:
+        """
+        Test content other than an array of objects or arrays is an error
+        """
+        with pytest.raises(ValueError, match="Expected a JSON"):
+            list(iter_json_array([content]))
+
+    @pytest.mark.parametrize(
+        ("content", "error"),
+        [
+            (b'[{"a": 1} {"b": 2}]', "Expected ','"),
+            (b'[{"a": 1},, {"b": 2}]', "Expected a JSON object"),
+            (b'[, {"a": 1}]', "Expected a JSON object"),
+            (b'[{"a": 1},]', "comma before the end"),
+            (b"[,]", "Expected a JSON object"),
+        ],
+    )
+    def test_separators(self, content: bytes, error: str) -> None:
+        """
+        Test elements must be separated by exactly one comma, without one before the closing bracket
+        """
+        with pytest.raises(ValueError, match=error):
+            list(iter_json_array(split(content, 3)))
+
+    @pytest.mark.parametrize("chunks", [[b'[{"a": 1}] junk'], [b'[{"a": 1}]', b" junk"], [b'[{"a": 1}] ', b"\nj"]])
+    def test_data_after_array(self, chunks: list[bytes]) -> None:
+        """
+        Test anything but whitespace after the closing bracket is an error, whether or not it arrives with the bracket
+        """
+        with pytest.raises(ValueError, match="after the end"):
+            list(iter_json_array(chunks))
+
+    def test_whitespace_after_array(self) -> None:
+        """
+        Test whitespace after the closing bracket is allowed
+        """
+        assert list(iter_json_array([b'[{"a": 1}] \n', b"\r\n"])) == [{"a": 1}]
+
+
+class TestSyncStreaming:
+    def test_stream_from_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the documents of a chunked response are each decoded
+        """
+        content = json.dumps(DOCUMENTS).encode()
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{stub_tika_url}/rmeta/form/text",
+            stream=httpx.ByteStream(content),
+        )
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            documents = list(client.rmeta.as_text.stream_from_file(sample_docx_file))
+
+        assert [document.data for document in documents] == DOCUMENTS
+        assert documents[3].content == DOCUMENTS[3][TikaKey.Content]
+
+    def test_streamed_upload(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a streamed upload goes to the plain endpoint
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/rmeta/html", json=DOCUMENTS)
+
+        with TikaClient(tika_url=stub_tika_url, upload_mode=UploadMode.Stream) as client:
+            documents = list(client.rmeta.as_html.stream_from_file(sample_docx_file))
+
+        assert len(documents) == len(DOCUMENTS)
+
+    def test_error_status(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test an error response raises, with its body read
+        """
+        httpx_mock.add_response(status_code=422, text="Unprocessable")
+
+        with TikaClient(tika_url=stub_tika_url) as client, pytest.raises(httpx.HTTPStatusError) as err:
+            next(client.rmeta.as_text.stream_from_file(sample_docx_file))
+
+        assert err.value.response.text == "Unprocessable"
+
+
+class TestAsyncStreaming:
+    async def test_stream_from_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client decodes the documents of a chunked response
+        """
+        httpx_mock.add_response(method="POST", url=f"{stub_tika_url}/rmeta/form/html", json=DOCUMENTS)
+
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.rmeta.as_html.stream_from_file(sample_docx_file) as documents,
+        ):
+            received = [document.data async for document in documents]
+
+        assert received == DOCUMENTS
+
+    async def test_metadata_only(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the metadata of each document is requested from the handler which ignores their content
+        """
+        metadata = [{key: value for key, value in document.items() if key != TikaKey.Content} for document in DOCUMENTS]
+        httpx_mock.add_response(
+            method="POST",
+            url=f"{stub_tika_url}/rmeta/form/ignore",
+            json=metadata,
+            is_reusable=True,
+        )
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            listed = await client.rmeta.as_metadata.from_file(sample_docx_file)
+            async with client.rmeta.as_metadata.stream_from_file(sample_docx_file) as documents:
+                received = [document async for document in documents]
+
+        assert [document.data for document in listed] == metadata
+        assert [document.data for document in received] == metadata
+        assert all(document.content is None for document in received)
+
+    async def test_leave_early(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test leaving the context before every document is read closes the response
+        """
+        stream = TrackedStream(json.dumps(DOCUMENTS).encode())
+        httpx_mock.add_response(stream=stream)
+
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.rmeta.as_text.stream_from_file(sample_docx_file) as documents,
+        ):
+            first = await anext(documents)
+            assert not stream.closed
+
+        assert first.data == DOCUMENTS[0]
+        assert stream.closed
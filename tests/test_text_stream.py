@@ -0,0 +1,138 @@
+from collections.abc import AsyncIterator
+from collections.abc import Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tika_client import UploadMode
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+TEXT = "Ünïcödé text, split between chunks in the middle of a character.\n" * 200
+
+
+class ChunkedStream(httpx.SyncByteStream, httpx.AsyncByteStream):
+    def __init__(self, content: bytes, size: int) -> None:
+        self.content = content
+        self.size = size
+
+    def __iter__(self) -> Iterator[bytes]:
+        for start in range(0, len(self.content), self.size):
+            yield self.content[start : start + self.size]
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        for chunk in self:
+            yield chunk
+
+
+class TestSyncTextStream:
+    def test_stream_from_buffer(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test plain text is requested and decoded a chunk at a time
+        """
+        httpx_mock.add_response(
+            method="PUT",
+            url=f"{stub_tika_url}/tika/text",
+            headers={"Content-Type": "text/plain; charset=UTF-8", "X-TIKA-Parsed-By": "TXTParser"},
+            stream=ChunkedStream(TEXT.encode(), 7),
+        )
+
+        with TikaClient(tika_url=stub_tika_url) as client, client.tika.as_text.stream_from_buffer("content") as text:
+            chunks = list(text)
+            headers = text.headers
+            encoding = text.encoding
+
+        assert "".join(chunks) == TEXT
+        assert len(chunks) > 1
+        assert headers["X-TIKA-Parsed-By"] == "TXTParser"
+        assert encoding == "utf-8"
+        request = httpx_mock.get_request()
+        assert request is not None
+        assert request.headers["Accept"] == "text/plain"
+
+    def test_declared_charset(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test text is decoded from the charset the server declares
+        """
+        httpx_mock.add_response(
+            headers={"Content-Type": "text/plain; charset=ISO-8859-1"},
+            stream=ChunkedStream("Ünïcödé".encode("latin-1"), 3),
+        )
+
+        with TikaClient(tika_url=stub_tika_url) as client, client.tika.as_text.stream_from_buffer("content") as text:
+            assert "".join(text) == "Ünïcödé"
+
+    @pytest.mark.parametrize(
+        ("upload_mode", "path"),
+        [(UploadMode.Multipart, "/tika/form/text"), (UploadMode.Stream, "/tika/text")],
+    )
+    def test_stream_from_file(
+        self,
+        httpx_mock: HTTPXMock,
+        stub_tika_url: str,
+        sample_docx_file: Path,
+        upload_mode: UploadMode,
+        path: str,
+    ) -> None:
+        """
+        Test a file's text is streamed in either upload mode
+        """
+        httpx_mock.add_response(
+            url=f"{stub_tika_url}{path}",
+            match_headers={"Accept": "text/plain"},
+            headers={"Content-Type": "text/plain; charset=UTF-8"},
+            text=TEXT,
+        )
+
+        with (
+            TikaClient(tika_url=stub_tika_url, upload_mode=upload_mode) as client,
+            client.tika.as_text.stream_from_file(sample_docx_file) as text,
+        ):
+            assert "".join(text) == TEXT
+
+
+class TestAsyncTextStream:
+    async def test_stream_from_file(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client streams a file's text
+        """
+        httpx_mock.add_response(
+            match_headers={"Accept": "text/plain"},
+            headers={"Content-Type": "text/plain; charset=UTF-8"},
+            stream=ChunkedStream(TEXT.encode(), 5),
+        )
+
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.tika.as_text.stream_from_file(sample_docx_file) as text,
+        ):
+            chunks = [chunk async for chunk in text]
+
+        assert "".join(chunks) == TEXT
+
+    async def test_stream_from_buffer(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test the async client streams a buffer's text
+        """
+        httpx_mock.add_response(headers={"Content-Type": "text/plain; charset=UTF-8"}, text=TEXT)
+
+        async with (
+            AsyncTikaClient(tika_url=stub_tika_url) as client,
+            client.tika.as_text.stream_from_buffer(b"content", "text/plain") as text,
+        ):
+            assert "".join([chunk async for chunk in text]) == TEXT
+
+    async def test_error_status(self, httpx_mock: HTTPXMock, stub_tika_url: str) -> None:
+        """
+        Test an error response raises when entering the context
+        """
+        httpx_mock.add_response(status_code=415, text="Unsupported")
+
+        async with AsyncTikaClient(tika_url=stub_tika_url) as client:
+            with pytest.raises(httpx.HTTPStatusError) as err:
+                async with client.tika.as_text.stream_from_buffer("content"):
+                    pass  # pragma: no cover
+
+        assert err.value.response.text == "Unsupported"
@@ -0,0 +1,104 @@
+from pathlib import Path
+
+import anyio
+import pytest
+from pytest_httpx import HTTPXMock
+
+from tests.conftest import ok_json
+from tika_client import UploadMode
+from tika_client._retry import RetryPolicy
+from tika_client.client import AsyncTikaClient
+from tika_client.client import TikaClient
+
+
+class TestSyncStreamUpload:
+    def test_stream_put(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test streaming PUTs the raw file to the plain endpoint, with its length and name
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/tika/text", json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url, upload_mode=UploadMode.Stream, upload_chunk_size=1024) as client:
+            resp = client.tika.as_text.from_file(sample_docx_file, "application/test")
+
+        assert resp.type == "test"
+        request = httpx_mock.get_request()
+        assert request is not None
+        content = sample_docx_file.read_bytes()
+        assert request.read() == content
+        assert request.headers["Content-Length"] == str(len(content))
+        assert request.headers["Content-Type"] == "application/test"
+        assert request.headers["Content-Disposition"] == f'attachment; filename="{sample_docx_file.name}"'
+        assert "Transfer-Encoding" not in request.headers
+
+    def test_stream_endpoints(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test every resource streams to its plain endpoint
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/meta", json=ok_json())
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/tika", json=ok_json())
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/rmeta/html", json=[ok_json()])
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/rmeta/text", json=[ok_json()])
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/rmeta/ignore", json=[ok_json()])
+
+        with TikaClient(tika_url=stub_tika_url, upload_mode=UploadMode.Stream) as client:
+            client.metadata.from_file(sample_docx_file)
+            client.tika.as_html.from_file(sample_docx_file)
+            assert len(client.rmeta.as_html.from_file(sample_docx_file)) == 1
+            assert len(client.rmeta.as_text.from_file(sample_docx_file)) == 1
+            assert len(client.rmeta.as_metadata.from_file(sample_docx_file)) == 1
+
+        assert all("Content-Type" not in request.headers for request in httpx_mock.get_requests())
+
+    def test_multipart_default(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test multipart remains the default upload
+        """
+        httpx_mock.add_response(method="POST", url=f"{stub_tika_url}/tika/form/text", json=ok_json())
+
+        with TikaClient(tika_url=stub_tika_url) as client:
+            client.tika.as_text.from_file(sample_docx_file)
+
+    def test_stream_retry(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test a retried stream sends the whole file again
+        """
+        httpx_mock.add_response(status_code=503)
+        httpx_mock.add_response(json=ok_json())
+
+        retry = RetryPolicy(backoff_base=0.0, jitter=False)
+        with TikaClient(tika_url=stub_tika_url, upload_mode=UploadMode.Stream, retry=retry) as client:
+            client.tika.as_text.from_file(sample_docx_file)
+
+        content = sample_docx_file.read_bytes()
+        assert [request.read() for request in httpx_mock.get_requests()] == [content, content]
+
+
+class TestAsyncStreamUpload:
+    async def test_stream_put(self, httpx_mock: HTTPXMock, stub_tika_url: str, sample_docx_file: Path) -> None:
+        """
+        Test the async client streams the raw file to the plain endpoint
+        """
+        httpx_mock.add_response(method="PUT", url=f"{stub_tika_url}/rmeta/text", json=[ok_json()])
+
+        async with AsyncTikaClient(
+            tika_url=stub_tika_url,
+            upload_mode=UploadMode.Stream,
+            upload_chunk_size=1024,
+        ) as client:
+            resp = await client.rmeta.as_text.from_file(sample_docx_file)
+
+        assert resp[0].type == "test"
+        request = httpx_mock.get_request()
+        assert request is not None
+        content = await anyio.Path(sample_docx_file).read_bytes()
+        assert await request.aread() == content
+        assert request.headers["Content-Length"] == str(len(content))
+
+    async def test_stream_missing_file(self, stub_tika_url: str, tmp_path: Path) -> None:
+        """
+        Test a missing file fails before anything is sent
+        """
+        async with AsyncTikaClient(tika_url=stub_tika_url, upload_mode=UploadMode.Stream) as client:
+            with pytest.raises(FileNotFoundError):
+                await client.metadata.from_file(tmp_path / "missing.pdf")